@@ -1,6 +1,7 @@
 import tensorflow as tf
 from ..texts._text_functions import (
-    bert_tokenization_siamese,
+    _bert_siamese_sequences,
+    siamese_batches,
     bert_tokenization,
     padding_sequence,
     merge_wordpiece_tokens,
@@ -721,23 +722,32 @@ class SIAMESE_BERT(BERT):
         )
         self._softmax = tf.nn.softmax(self._logits)
 
-    def _base(self, strings_left, strings_right):
-        input_ids, input_masks, segment_ids = bert_tokenization_siamese(
+    def _base(self, strings_left, strings_right, batch_size = 32):
+        sequences = _bert_siamese_sequences(
             self._tokenizer,
             strings_left,
             strings_right,
             cls = self._cls,
             sep = self._sep,
-        )
-
-        return self._sess.run(
-            self._softmax,
-            feed_dict = {
-                self._X: input_ids,
-                self._segment_ids: segment_ids,
-                self._input_masks: input_masks,
-            },
-        )
+        )[:3]
+        pad_ints = (0, 0, 0)
+        outputs, indices = [], []
+        for idx, (input_ids, input_masks, segment_ids) in siamese_batches(
+            sequences, pad_ints, batch_size = batch_size
+        ):
+            outputs.append(
+                self._sess.run(
+                    self._softmax,
+                    feed_dict = {
+                        self._X: input_ids,
+                        self._segment_ids: segment_ids,
+                        self._input_masks: input_masks,
+                    },
+                )
+            )
+            indices.append(idx)
+        outputs = np.concatenate(outputs)
+        return outputs[np.argsort(np.concatenate(indices))]
 
     def predict(self, string_left, string_right):
         """
@@ -759,14 +769,16 @@ class SIAMESE_BERT(BERT):
 
         return self._base([string_left], [string_right])[0, 1]
 
-    def predict_batch(self, strings_left, strings_right):
+    def predict_batch(self, strings_left, strings_right, batch_size = 32):
         """
-        calculate similarity for two different batch of texts.
+        calculate similarity for two different batch of texts,
+        pairs are bucketed by length and run in chunks of `batch_size`.
 
         Parameters
         ----------
         string_left : str
         string_right : str
+        batch_size : int, optional (default=32)
 
         Returns
         -------
@@ -781,7 +793,12 @@ class SIAMESE_BERT(BERT):
         if not isinstance(strings_right[0], str):
             raise ValueError('strings_right must be list of strings')
 
-        return self._base(strings_left, strings_right)[:, 1]
+        if not isinstance(batch_size, int):
+            raise ValueError('batch_size must be an integer')
+
+        return self._base(strings_left, strings_right, batch_size = batch_size)[
+            :, 1
+        ]
 
 
 class TAGGING_BERT(BERT):
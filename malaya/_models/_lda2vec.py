@@ -17,16 +17,35 @@ class LDA2VEC:
         power = 0.75,
         batch_size = 32,
         clip_gradients = 5.0,
+        num_threads = None,
+        prefetch = 4,
         **kwargs
     ):
         moving_avgs = tf.train.ExponentialMovingAverage(0.9)
         self.batch_size = batch_size
         self.freqs = freqs
-        self.sess = tf.InteractiveSession()
+        if num_threads is None:
+            self.sess = tf.InteractiveSession()
+        else:
+            self.sess = tf.InteractiveSession(
+                config = tf.ConfigProto(
+                    intra_op_parallelism_threads = num_threads,
+                    inter_op_parallelism_threads = num_threads,
+                )
+            )
 
-        self.X = tf.placeholder(tf.int32, shape = [None])
-        self.Y = tf.placeholder(tf.int64, shape = [None])
-        self.DOC = tf.placeholder(tf.int32, shape = [None])
+        self._pivot_words = tf.placeholder(tf.int32, shape = [None])
+        self._target_words = tf.placeholder(tf.int64, shape = [None])
+        self._doc_ids = tf.placeholder(tf.int32, shape = [None])
+        dataset = (
+            tf.data.Dataset.from_tensor_slices(
+                (self._pivot_words, self._target_words, self._doc_ids)
+            )
+            .batch(batch_size)
+            .prefetch(prefetch)
+        )
+        self._iterator = dataset.make_initializable_iterator()
+        self.X, self.Y, self.DOC = self._iterator.get_next()
         step = tf.Variable(0, trainable = False, name = 'global_step')
         self.switch_loss = tf.Variable(0, trainable = False)
         train_labels = tf.reshape(self.Y, [-1, 1])
@@ -116,27 +135,20 @@ class LDA2VEC:
         temp_fraction = self.batch_size / len(pivot_words)
         self.sess.run(tf.assign(self.fraction, temp_fraction))
         self.sess.run(tf.assign(self.switch_loss, switch_loss))
+        feed_dict = {
+            self._pivot_words: pivot_words,
+            self._target_words: target_words,
+            self._doc_ids: doc_ids,
+        }
+        total = int(np.ceil(len(pivot_words) / self.batch_size))
         for e in range(num_epochs):
-            pbar = tqdm(
-                range(0, len(pivot_words), self.batch_size),
-                desc = 'minibatch loop',
-            )
-            for i in pbar:
-                batch_x = pivot_words[
-                    i : min(i + self.batch_size, len(pivot_words))
-                ]
-                batch_y = target_words[
-                    i : min(i + self.batch_size, len(pivot_words))
-                ]
-                batch_doc = doc_ids[
-                    i : min(i + self.batch_size, len(pivot_words))
-                ]
-                _, cost = self.sess.run(
-                    [self.optimizer, self.cost],
-                    feed_dict = {
-                        self.X: batch_x,
-                        self.Y: batch_y,
-                        self.DOC: batch_doc,
-                    },
-                )
+            self.sess.run(self._iterator.initializer, feed_dict = feed_dict)
+            pbar = tqdm(total = total, desc = 'minibatch loop')
+            while True:
+                try:
+                    _, cost = self.sess.run([self.optimizer, self.cost])
+                except tf.errors.OutOfRangeError:
+                    break
+                pbar.update(1)
                 pbar.set_postfix(cost = cost, epoch = e + 1)
+            pbar.close()
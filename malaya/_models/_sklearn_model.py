@@ -1,9 +1,11 @@
 import numpy as np
 from ..texts._text_functions import (
     simple_textcleaning,
+    simple_textcleaning_batch,
     classification_textcleaning,
     entities_textcleaning,
     language_detection_textcleaning,
+    language_detection_textcleaning_batch,
     tag_chunk,
 )
 from .._utils._utils import add_neutral as neutral
@@ -11,19 +13,32 @@ from .._utils._utils import add_neutral as neutral
 
 class BAYES:
     def __init__(
-        self, multinomial, label, vectorize, cleaning = simple_textcleaning
+        self,
+        multinomial,
+        label,
+        vectorize,
+        cleaning = simple_textcleaning,
+        cleaning_batch = simple_textcleaning_batch,
     ):
         self._multinomial = multinomial
         self._label = label
         self._vectorize = vectorize
         self._cleaning = cleaning
+        self._cleaning_batch = cleaning_batch
 
 
 class BINARY_BAYES(BAYES):
     def __init__(
-        self, multinomial, label, vectorize, cleaning = simple_textcleaning
+        self,
+        multinomial,
+        label,
+        vectorize,
+        cleaning = simple_textcleaning,
+        cleaning_batch = simple_textcleaning_batch,
     ):
-        BAYES.__init__(self, multinomial, label, vectorize, cleaning)
+        BAYES.__init__(
+            self, multinomial, label, vectorize, cleaning, cleaning_batch
+        )
 
     def predict(self, string, get_proba = False, add_neutral = True):
         """
@@ -92,7 +107,7 @@ class BINARY_BAYES(BAYES):
         else:
             label = self._label
 
-        strings = [self._cleaning(string) for string in strings]
+        strings = self._cleaning_batch(strings)
         vectors = self._vectorize.transform(strings)
         results = self._multinomial.predict_proba(vectors)
 
@@ -112,9 +127,16 @@ class BINARY_BAYES(BAYES):
 
 class MULTICLASS_BAYES(BAYES):
     def __init__(
-        self, multinomial, label, vectorize, cleaning = simple_textcleaning
+        self,
+        multinomial,
+        label,
+        vectorize,
+        cleaning = simple_textcleaning,
+        cleaning_batch = simple_textcleaning_batch,
     ):
-        BAYES.__init__(self, multinomial, label, vectorize, cleaning)
+        BAYES.__init__(
+            self, multinomial, label, vectorize, cleaning, cleaning_batch
+        )
 
     def predict(self, string, get_proba = False):
         """
@@ -161,7 +183,7 @@ class MULTICLASS_BAYES(BAYES):
             raise ValueError('input must be list of strings')
         if not isinstance(get_proba, bool):
             raise ValueError('get_proba must be a boolean')
-        strings = [self._cleaning(string) for string in strings]
+        strings = self._cleaning_batch(strings)
         vectors = self._vectorize.transform(strings)
         results = self._multinomial.predict_proba(vectors)
         if get_proba:
@@ -178,7 +200,13 @@ class MULTICLASS_BAYES(BAYES):
 
 
 class MULTILABEL_BAYES:
-    def __init__(self, models, vectors, cleaning = simple_textcleaning):
+    def __init__(
+        self,
+        models,
+        vectors,
+        cleaning = simple_textcleaning,
+        cleaning_batch = simple_textcleaning_batch,
+    ):
         self._multinomial = models
         self._vectorize = vectors
         self._class_names = [
@@ -190,6 +218,7 @@ class MULTILABEL_BAYES:
             'identity_hate',
         ]
         self._cleaning = cleaning
+        self._cleaning_batch = cleaning_batch
 
     def predict(self, string, get_proba = False):
         """
@@ -239,7 +268,7 @@ class MULTILABEL_BAYES:
         if not isinstance(strings[0], str):
             raise ValueError('input must be list of strings')
 
-        strings = [self._cleaning(string) for string in strings]
+        strings = self._cleaning_batch(strings)
         vectors = self._vectorize.transform(strings)
         result = self._multinomial.predict_proba(vectors)
         arounded = np.around(result)
@@ -307,9 +336,7 @@ class LANGUAGE_DETECTION:
             raise ValueError('input must be a list')
         if not isinstance(strings[0], str):
             raise ValueError('input must be list of strings')
-        strings = [
-            language_detection_textcleaning(string) for string in strings
-        ]
+        strings = language_detection_textcleaning_batch(strings)
         vectors = self._vectorizer.transform(strings)
 
         if get_proba:
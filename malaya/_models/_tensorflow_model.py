@@ -6,6 +6,7 @@ from ..texts._text_functions import (
     char_str_idx,
     generate_char_seq,
     language_detection_textcleaning,
+    language_detection_textcleaning_batch,
     tag_chunk,
 )
 from .._utils._parse_dependency import DependencyGraph
@@ -116,7 +117,7 @@ class DEEP_LANG:
         if not isinstance(get_proba, bool):
             raise ValueError('get_proba must be a boolean')
 
-        strings = [language_detection_textcleaning(i) for i in strings]
+        strings = language_detection_textcleaning_batch(strings)
         transformed = self._vectorizer.transform(strings)
         batch_x = _convert_sparse_matrix_to_sparse_tensor(transformed)
         probs = self._sess.run(
@@ -72,6 +72,8 @@ PATH_STEM = {
     },
 }
 
+PATH_SASTRAWI_CACHE = home + '/stem/sastrawi/sastrawi-cache.json'
+
 S3_PATH_STEM = {
     'lstm': {
         'model': 'v15/stem/lstm-stem.pb',
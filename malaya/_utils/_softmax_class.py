@@ -34,7 +34,10 @@ def multinomial(path, s3_path, class_name, label, validate = True):
             "model corrupted due to some reasons, please run malaya.clear_cache('%s/multinomial') and try again"
             % (class_name)
         )
-    from ..stem import _classification_textcleaning_stemmer
+    from ..stem import (
+        _classification_textcleaning_stemmer,
+        _classification_textcleaning_stemmer_batch,
+    )
 
     if len(label) > 2:
         selected_class = MULTICLASS_BAYES
@@ -45,6 +48,7 @@ def multinomial(path, s3_path, class_name, label, validate = True):
         label = label,
         vectorize = vectorize,
         cleaning = _classification_textcleaning_stemmer,
+        cleaning_batch = _classification_textcleaning_stemmer_batch,
     )
 
 
@@ -4,6 +4,7 @@ import sentencepiece as spm
 import numpy as np
 import requests
 import os
+from multiprocessing import Pool, cpu_count
 from pathlib import Path
 from .. import _delete_folder
 from tensorflow.contrib.seq2seq.python.ops import beam_search_ops
@@ -112,6 +113,107 @@ def check_file(file, s3_file):
             fopen.write(file['version'])
 
 
+_worker = None
+
+
+def _initialize_worker(obj, method):
+    global _worker
+    _worker = getattr(obj, method)
+
+
+def _call_worker(string):
+    return _worker(string)
+
+
+def multiprocessing_imap(obj, method, strings, cores = None, chunksize = 64):
+    """
+    Stream strings through `obj.method` on a pool of processes, results are in the same order as strings.
+    `obj` is sent once per worker, only strings and results are pickled per chunk.
+    """
+    cores = cores or cpu_count()
+    if cores == 1:
+        function = getattr(obj, method)
+        for string in strings:
+            yield function(string)
+        return
+    with Pool(
+        cores, initializer = _initialize_worker, initargs = (obj, method)
+    ) as pool:
+        for result in pool.imap(_call_worker, strings, chunksize = chunksize):
+            yield result
+
+
+def bag_of_vectors(vectorizer, tokenized, aggregation = 'mean', soft = True):
+    """
+    Aggregate word vectors per document, every unique token is looked up once and
+    documents are encoded with a sparse document x token matrix product.
+
+    Parameters
+    ----------
+    vectorizer : object
+        object with `get_vector_by_name` method.
+    tokenized : list of list of str
+    aggregation : str, (default='mean')
+        `mean`, `min`, `max`, `sum` or `sqrt`, `sqrt` is sum divided by square root of length.
+    soft: bool, (default=True)
+        word not inside vectorizer will replace with nearest word if True, else, will skip.
+
+    Returns
+    -------
+    result: numpy array, [len(tokenized), dimension]
+    """
+    from scipy.sparse import csr_matrix
+    from ..texts._fuzzy import fuzzy_index
+
+    ids, vectors = {}, []
+    for tokens in tokenized:
+        for token in tokens:
+            if token in ids:
+                continue
+            try:
+                vector = vectorizer.get_vector_by_name(token)
+            except:
+                if not soft:
+                    ids[token] = None
+                    continue
+                vector = vectorizer.get_vector_by_name(
+                    fuzzy_index(vectorizer).nearest(token)[0]
+                )
+            ids[token] = len(vectors)
+            vectors.append(vector)
+
+    indices, indptr = [], [0]
+    for tokens in tokenized:
+        indices.extend([ids[t] for t in tokens if ids[t] is not None])
+        indptr.append(len(indices))
+    indices, indptr = np.array(indices, dtype = np.int64), np.array(indptr)
+    lengths = np.diff(indptr)
+    if not len(vectors):
+        return np.zeros((len(tokenized), 0))
+    vectors = np.array(vectors)
+
+    if aggregation in ['mean', 'sum', 'sqrt']:
+        matrix = csr_matrix(
+            (np.ones(len(indices)), indices, indptr),
+            shape = (len(tokenized), len(vectors)),
+        )
+        results = matrix.dot(vectors)
+        if aggregation == 'mean':
+            results /= np.maximum(lengths, 1)[:, None]
+        elif aggregation == 'sqrt':
+            results /= np.sqrt(np.maximum(lengths, 1))[:, None]
+        return results
+
+    reduce = np.minimum if aggregation == 'min' else np.maximum
+    results = np.zeros((len(tokenized), vectors.shape[1]))
+    nonempty = lengths > 0
+    if nonempty.any():
+        results[nonempty] = reduce.reduceat(
+            vectors[indices], indptr[:-1][nonempty], axis = 0
+        )
+    return results
+
+
 class DisplayablePath(object):
     display_filename_prefix_middle = '├──'
     display_filename_prefix_last = '└──'
@@ -3,13 +3,14 @@ from sklearn.cluster import KMeans
 from sklearn.manifold import MDS
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from .texts.vectorizer import SkipGramVectorizer
-from .stem import sastrawi
+from .stem import sastrawi_batch
 from .texts._text_functions import (
     simple_textcleaning,
     split_into_sentences,
     STOPWORDS,
 )
 
+from scipy.sparse import csr_matrix, issparse
 import numpy as np
 import re
 import random
@@ -313,8 +314,7 @@ def cluster_scatter(
         for i in range(len(corpus)):
             corpus[i] = cleaning(corpus[i])
     if stemming:
-        for i in range(len(corpus)):
-            corpus[i] = sastrawi(corpus[i])
+        corpus[:] = sastrawi_batch(corpus)
     text_clean = []
     for text in corpus:
         text_clean.append(
@@ -336,9 +336,8 @@ def cluster_scatter(
         transformed_text_clean = np.concatenate(
             transformed_text_clean, axis = 0
         )
-    km = clustering(n_clusters = num_clusters)
+    km = _fit_clustering(clustering, num_clusters, transformed_text_clean)
     dist = 1 - cosine_similarity(transformed_text_clean)
-    km.fit(transformed_text_clean)
     clusters = km.labels_.tolist()
     if isinstance(decomposition, MDS):
         decomposed = decomposition(
@@ -472,8 +471,7 @@ def cluster_dendogram(
         for i in range(len(corpus)):
             corpus[i] = cleaning(corpus[i])
     if stemming:
-        for i in range(len(corpus)):
-            corpus[i] = sastrawi(corpus[i])
+        corpus[:] = sastrawi_batch(corpus)
     text_clean = []
     for text in corpus:
         text_clean.append(
@@ -528,6 +526,62 @@ def cluster_dendogram(
     return {'linkage_matrix': linkage_matrix, 'titles': titles}
 
 
+def _fit_clustering(clustering, num_clusters, matrix):
+    """
+    fit `clustering(n_clusters = num_clusters)` on matrix, sparse matrix is densified
+    only if the estimator does not accept sparse input, eg, AgglomerativeClustering.
+    """
+    km = clustering(n_clusters = num_clusters)
+    try:
+        km.fit(matrix)
+    except (TypeError, ValueError):
+        if not issparse(matrix):
+            raise
+        km = clustering(n_clusters = num_clusters)
+        km.fit(matrix.toarray())
+    return km
+
+
+def _correlation_edges(matrix, threshold, block_size = 256):
+    """
+    pairs of rows with absolute pearson correlation >= threshold, computed block by block
+    so the n x n correlation matrix is never materialised.
+    Return rows, columns and correlations as arrays, every pair once with row < column.
+    """
+    size, dimension = matrix.shape
+    if issparse(matrix):
+        matrix = csr_matrix(matrix, dtype = np.float64)
+        means = np.asarray(matrix.mean(axis = 1)).ravel()
+        squares = np.asarray(matrix.multiply(matrix).sum(axis = 1)).ravel()
+        norms = np.sqrt(np.maximum(squares - dimension * means ** 2, 0))
+        norms[norms <= 1e-6 * np.sqrt(squares)] = 0
+    else:
+        matrix = np.asarray(matrix, dtype = np.float64)
+        means = matrix.mean(axis = 1)
+        matrix = matrix - means[:, None]
+        norms = np.linalg.norm(matrix, axis = 1)
+    scales = np.zeros(size)
+    scales[norms > 0] = 1 / norms[norms > 0]
+    rows, columns, values = [], [], []
+    for start in range(0, size, block_size):
+        block = matrix[start : start + block_size].dot(matrix.T)
+        if issparse(block):
+            block = block.toarray()
+            block -= (
+                dimension * means[start : start + block_size, None] * means
+            )
+        block = np.abs(
+            block * scales[start : start + block_size, None] * scales
+        )
+        row, column = np.nonzero(block >= threshold)
+        keep = row + start < column
+        row, column = row[keep], column[keep]
+        rows.append(row + start)
+        columns.append(column)
+        values.append(block[row, column])
+    return np.concatenate(rows), np.concatenate(columns), np.concatenate(values)
+
+
 def cluster_graph(
     corpus,
     vectorizer,
@@ -611,7 +665,6 @@ def cluster_graph(
         import seaborn as sns
         import networkx as nx
         import networkx.drawing.layout as nxlayout
-        import pandas as pd
 
         sns.set()
     except:
@@ -625,8 +678,7 @@ def cluster_graph(
         for i in range(len(corpus)):
             corpus[i] = cleaning(corpus[i])
     if stemming:
-        for i in range(len(corpus)):
-            corpus[i] = sastrawi(corpus[i])
+        corpus[:] = sastrawi_batch(corpus)
     text_clean = []
     for text in corpus:
         text_clean.append(
@@ -635,7 +687,7 @@ def cluster_graph(
 
     if hasattr(vectorizer, 'fit'):
         vectorizer.fit(text_clean)
-        transformed_text_clean = vectorizer.transform(text_clean).todense()
+        transformed_text_clean = vectorizer.transform(text_clean)
         features = vectorizer.get_feature_names()
     else:
         transformed_text_clean, attentions = [], []
@@ -650,9 +702,7 @@ def cluster_graph(
         )
 
     DxT = transformed_text_clean
-    DxD = np.abs(pd.DataFrame(DxT.T).corr()).values
-    km = clustering(n_clusters = num_clusters)
-    km.fit(DxT)
+    km = _fit_clustering(clustering, num_clusters, DxT)
     clusters = km.labels_.tolist()
 
     if not titles:
@@ -660,7 +710,7 @@ def cluster_graph(
         for i in range(transformed_text_clean.shape[0]):
 
             if hasattr(vectorizer, 'fit'):
-                indices = np.argsort(np.array(transformed_text_clean[i])[0])[
+                indices = np.argsort(transformed_text_clean[i].toarray()[0])[
                     ::-1
                 ]
                 titles.append(
@@ -678,14 +728,10 @@ def cluster_graph(
     for i in range(DxT.shape[0]):
         G.add_node(i, text = titles[i], label = clusters[i])
 
-    len_dense = len(DxD)
-    for i in range(len_dense):
-        for j in range(len_dense):
-            if j == i:
-                continue
-            if DxD[i, j] >= threshold:
-                weight = DxD[i, j]
-                G.add_edge(i, j, weight = weight)
+    rows, columns, weights = _correlation_edges(DxT, threshold)
+    G.add_weighted_edges_from(
+        zip(rows.tolist(), columns.tolist(), weights.tolist())
+    )
     node_colors, node_labels = [], {}
     for node in G:
         node_colors.append(colors[G.node[node]['label']])
@@ -819,7 +865,6 @@ def cluster_entity_linking(
         import seaborn as sns
         import networkx as nx
         import networkx.drawing.layout as nxlayout
-        import pandas as pd
         from fuzzywuzzy import fuzz
 
         sns.set()
@@ -890,8 +935,7 @@ def cluster_entity_linking(
         for i in range(len(corpus)):
             corpus[i] = cleaning(corpus[i])
     if stemming:
-        for i in range(len(corpus)):
-            corpus[i] = sastrawi(corpus[i])
+        corpus[:] = sastrawi_batch(corpus)
     text_clean = []
     for text in corpus:
         text_clean.append(
@@ -900,7 +944,7 @@ def cluster_entity_linking(
 
     if hasattr(vectorizer, 'fit'):
         vectorizer.fit(text_clean)
-        transformed_text_clean = vectorizer.transform(text_clean).todense()
+        transformed_text_clean = vectorizer.transform(text_clean)
         features = vectorizer.get_feature_names()
     else:
         transformed_text_clean, attentions = [], []
@@ -915,20 +959,15 @@ def cluster_entity_linking(
         )
 
     DxT = transformed_text_clean
-    DxD = np.abs(pd.DataFrame(DxT.T).corr()).values
 
     G = nx.Graph()
     for i in range(DxT.shape[0]):
         G.add_node(i, text = topics[i], label = topics[i])
 
-    len_dense = len(DxD)
-    for i in range(len_dense):
-        for j in range(len_dense):
-            if j == i:
-                continue
-            if DxD[i, j] >= threshold:
-                weight = DxD[i, j]
-                G.add_edge(i, j, weight = weight)
+    rows, columns, weights = _correlation_edges(DxT, threshold)
+    G.add_weighted_edges_from(
+        zip(rows.tolist(), columns.tolist(), weights.tolist())
+    )
 
     node_colors, node_labels = [], {}
     for node in G:
@@ -1,11 +1,12 @@
 import numpy as np
 import json
 import re
-import dateparser
+import html
 from unidecode import unidecode
 from .num2word import to_cardinal, to_ordinal
 from .word2num import word2num
-from .texts._text_functions import ENGLISH_WORDS, MALAY_WORDS, multireplace
+from .texts._text_functions import ENGLISH_WORDS, MALAY_WORDS
+from .texts._datetime import parse as parse_datetime
 from .texts._regex import (
     _date,
     _past_date_string,
@@ -45,9 +46,129 @@ from .texts._normalization import (
     fraction,
     money,
     ignore_words,
+    _roman_regex,
 )
 from .cluster import cluster_words
-from .preprocessing import _tokenizer
+from .preprocessing import SocialTokenizer
+
+def _token_scanner():
+    """
+    tokenizer alternation of malaya.preprocessing.SocialTokenizer with money, date, time,
+    number and ordinal (`ke` of `ke-3`) as named groups, tokens are identical to `_tokenizer`.
+    """
+    pipeline = []
+    for name, pattern in SocialTokenizer().pipeline:
+        if name == 'word':
+            pipeline.append('(?P<ordinal>[Kk][Ee](?!\\w))')
+        if name in ['money', 'date', 'time', 'number']:
+            pattern = '(?P<%s>%s)' % (name, pattern)
+        pipeline.append(pattern)
+    return re.compile('|'.join(pipeline))
+
+
+_scanner = _token_scanner()
+_digit_regex = re.compile('\\d')
+_token_regexes = [
+    ('money', re.compile(_money)),
+    ('date', re.compile(_date)),
+    ('time', re.compile(_expressions['time'])),
+]
+_spans = [
+    ('date', pattern)
+    for pattern in [
+        _date,
+        _past_date_string,
+        _now_date_string,
+        _future_date_string,
+        _yesterday_tomorrow_date_string,
+        _depan_date_string,
+        _expressions['time'],
+        _today_time,
+    ]
+]
+_spans += [
+    ('datetime', pattern)
+    for pattern in [
+        _left_datetime,
+        _right_datetime,
+        _left_datetodaytime,
+        _right_datetodaytime,
+        _left_yesterdaydatetime,
+        _right_yesterdaydatetime,
+        _left_yesterdaydatetodaytime,
+        _right_yesterdaydatetodaytime,
+    ]
+]
+_spans.append(('money', _money))
+_span_regexes = [(tag, re.compile(pattern)) for tag, pattern in _spans]
+_span_scanner = re.compile(
+    '(?=%s)' % '|'.join('(?:%s)' % pattern for _, pattern in _spans)
+)
+_spaces_regex = re.compile(r'[ ]+')
+_date_replace_regex = re.compile(
+    '|'.join(map(re.escape, sorted(date_replace, key = len, reverse = True)))
+)
+
+
+def _replace_dates(string):
+    return _date_replace_regex.sub(
+        lambda match: date_replace[match.group(0)], string
+    )
+
+
+def _scan(string):
+    """
+    tokenize and tag a string in one pass, return tokens and tags.
+    """
+    tokens, tags = [], []
+    for m in _scanner.finditer(html.unescape(string)):
+        tokens.append(m.group())
+        tags.append(m.lastgroup)
+    return tokens, tags
+
+
+def _tag(word, tag):
+    """
+    money, date or time tag of a word with the same priority as searching each pattern
+    inside lowercased word, only words with digits need a regex.
+    """
+    if tag == 'money' or not _digit_regex.search(word):
+        return tag
+    word = word.lower()
+    for tag, regex in _token_regexes:
+        if regex.search(word):
+            return tag
+
+
+def _word_tag(word):
+    """
+    tag of a rewritten word, same as tagging it as a token.
+    """
+    m = _scanner.match(word)
+    if m and m.end() == len(word):
+        return m.lastgroup
+
+
+def _scan_spans(string):
+    """
+    money, date and datetime spans of a string in one pass, only positions where
+    any pattern starts are matched, spans are identical to `findall` of each pattern.
+    """
+    spans = [[] for _ in _span_regexes]
+    ends = [0] * len(_span_regexes)
+    for m in _span_scanner.finditer(string):
+        start = m.start()
+        for no, (_, regex) in enumerate(_span_regexes):
+            if start < ends[no]:
+                continue
+            span = regex.match(string, start)
+            if span:
+                spans[no].append(span.group())
+                ends[no] = span.end()
+    money_, dates_ = [], []
+    for (tag, _), matches in zip(_span_regexes, spans):
+        (money_ if tag == 'money' else dates_).extend(matches)
+    return money_, dates_
 
 
 class _SPELL_NORMALIZE:
@@ -74,10 +195,12 @@ class _SPELL_NORMALIZE:
             raise ValueError('check_english must be a boolean')
 
         result, normalized = [], []
-        tokenized = _tokenizer(string)
+        tokenized, tags = _scan(string)
+        joined = ' '.join(tokenized)
         index = 0
         while index < len(tokenized):
             word = tokenized[index]
+            tag = tags[index]
             if word in '~@#$%^&*()_+{}|[:"\'];<>,.?/-':
                 result.append(word)
                 index += 1
@@ -112,8 +235,10 @@ class _SPELL_NORMALIZE:
                 word = word[1:]
             else:
                 result_string = ''
+            if word != tokenized[index]:
+                tag = _word_tag(word)
 
-            if word.lower() == 'ke' and index < (len(tokenized) - 2):
+            if tag == 'ordinal' and index < (len(tokenized) - 2):
                 if tokenized[index + 1] == '-' and _is_number_regex(
                     tokenized[index + 2]
                 ):
@@ -124,8 +249,8 @@ class _SPELL_NORMALIZE:
                     )
                     index += 3
                     continue
-                elif tokenized[index + 1] == '-' and re.match(
-                    '.*(V|X|I|L|D)', tokenized[index + 2]
+                elif tokenized[index + 1] == '-' and _roman_regex.match(
+                    tokenized[index + 2]
                 ):
                     result.append(
                         ordinal(
@@ -184,31 +309,25 @@ class _SPELL_NORMALIZE:
                     index += 3
                     continue
 
-            if re.findall(_money, word.lower()):
+            tag = _tag(word, tag)
+
+            if tag == 'money':
                 money_, _ = money(word)
                 result.append(money_)
                 index += 1
                 continue
 
-            if re.findall(_date, word.lower()):
-                word = word.lower()
-                word = multireplace(word, date_replace)
-                word = re.sub(r'[ ]+', ' ', word).strip()
-                parsed = dateparser.parse(word)
-                if parsed:
-                    result.append(parsed.strftime('%d/%m/%Y'))
-                else:
-                    result.append(word)
-                index += 1
-                continue
-
-            if re.findall(_expressions['time'], word.lower()):
+            if tag in ('date', 'time'):
                 word = word.lower()
-                word = multireplace(word, date_replace)
-                word = re.sub(r'[ ]+', ' ', word).strip()
-                parsed = dateparser.parse(word)
+                word = _replace_dates(word)
+                word = _spaces_regex.sub(' ', word).strip()
+                parsed = parse_datetime(word)
                 if parsed:
-                    result.append(parsed.strftime('%H:%M:%S'))
+                    result.append(
+                        parsed.strftime(
+                            '%d/%m/%Y' if tag == 'date' else '%H:%M:%S'
+                        )
+                    )
                 else:
                     result.append(word)
                 index += 1
@@ -237,81 +356,19 @@ class _SPELL_NORMALIZE:
                 index += 1
                 continue
             selected = self._speller.correct(
-                word, string = ' '.join(tokenized), index = index
+                word, string = joined, index = index
             )
             result.append(result_string + selected + end_result_string)
             index += 1
 
         result = ' '.join(result)
         normalized = ' '.join(normalized)
-        money_ = re.findall(_money, normalized)
+        money_, dates_ = _scan_spans(normalized)
         money_ = [(s, money(s)[1]) for s in money_]
-        dates_ = re.findall(_date, normalized)
-
-        past_date_string_ = re.findall(_past_date_string, normalized)
-        now_date_string_ = re.findall(_now_date_string, normalized)
-        future_date_string_ = re.findall(_future_date_string, normalized)
-        yesterday_date_string_ = re.findall(
-            _yesterday_tomorrow_date_string, normalized
-        )
-        depan_date_string_ = re.findall(_depan_date_string, normalized)
-        today_time_ = re.findall(_today_time, normalized)
-        time_ = re.findall(_expressions['time'], normalized)
-        left_datetime_ = [
-            '%s %s' % (i[0], i[1])
-            for i in re.findall(_left_datetime, normalized)
-        ]
-        right_datetime_ = [
-            '%s %s' % (i[0], i[1])
-            for i in re.findall(_right_datetime, normalized)
-        ]
-        today_left_datetime_ = [
-            '%s %s' % (i[0], i[1])
-            for i in re.findall(_left_datetodaytime, normalized)
-        ]
-        today_right_datetime_ = [
-            '%s %s' % (i[0], i[1])
-            for i in re.findall(_right_datetodaytime, normalized)
-        ]
-        left_yesterdaydatetime_ = [
-            '%s %s' % (i[0], i[1])
-            for i in re.findall(_left_yesterdaydatetime, normalized)
-        ]
-        right_yesterdaydatetime_ = [
-            '%s %s' % (i[0], i[1])
-            for i in re.findall(_right_yesterdaydatetime, normalized)
-        ]
-        left_yesterdaydatetodaytime_ = [
-            '%s %s' % (i[0], i[1])
-            for i in re.findall(_left_yesterdaydatetodaytime, normalized)
-        ]
-        right_yesterdaydatetodaytime_ = [
-            '%s %s' % (i[0], i[1])
-            for i in re.findall(_right_yesterdaydatetodaytime, normalized)
-        ]
-
-        dates_ = (
-            dates_
-            + past_date_string_
-            + now_date_string_
-            + future_date_string_
-            + yesterday_date_string_
-            + depan_date_string_
-            + time_
-            + today_time_
-            + left_datetime_
-            + right_datetime_
-            + today_left_datetime_
-            + today_right_datetime_
-            + left_yesterdaydatetime_
-            + right_yesterdaydatetime_
-            + left_yesterdaydatetodaytime_
-            + right_yesterdaydatetodaytime_
-        )
-        dates_ = [multireplace(s, date_replace) for s in dates_]
-        dates_ = [re.sub(r'[ ]+', ' ', s).strip() for s in dates_]
-        dates_ = cluster_words(dates_)
-        dates_ = {s: dateparser.parse(s) for s in dates_}
+        dates_ = [_replace_dates(s) for s in dates_]
+        dates_ = [_spaces_regex.sub(' ', s).strip() for s in dates_]
+        dates_ = cluster_words(list(dict.fromkeys(dates_)))
+        dates_ = {s: parse_datetime(s) for s in dates_}
         money_ = {s[0]: s[1] for s in money_}
         return {'normalize': result, 'date': dates_, 'money': money_}
 
@@ -1,5 +1,4 @@
-import re
-from .texts._tatabahasa import tatabahasa_dict, hujung, permulaan
+from .texts._tatabahasa import tatabahasa_dict
 from ._utils import _tag_class
 from ._utils._paths import PATH_POS, S3_PATH_POS
 
@@ -18,23 +17,16 @@ def available_transformer_model():
     return _availability
 
 
+_word_tag = {}
+for key, vals in tatabahasa_dict.items():
+    for val in vals:
+        _word_tag.setdefault(val, key)
+
+
 def _naive_POS_word(word):
-    for key, vals in tatabahasa_dict.items():
-        if word in vals:
-            return (key, word)
-    try:
-        if len(re.findall(r'^(.*?)(%s)$' % ('|'.join(hujung[:1])), i)[0]) > 1:
-            return ('KJ', word)
-    except:
-        pass
-    try:
-        if (
-            len(re.findall(r'^(.*?)(%s)' % ('|'.join(permulaan[:-4])), word)[0])
-            > 1
-        ):
-            return ('KJ', word)
-    except Exception as e:
-        pass
+    tag = _word_tag.get(word)
+    if tag is not None:
+        return (tag, word)
     if len(word) > 2:
         return ('KN', word)
     else:
@@ -55,11 +47,32 @@ def naive(string):
     """
     if not isinstance(string, str):
         raise ValueError('input must be a string')
-    string = string.lower()
-    results = []
-    for i in string.split():
-        results.append(_naive_POS_word(i))
-    return results
+    return [_naive_POS_word(i) for i in string.lower().split()]
+
+
+def naive_batch(strings):
+    """
+    Recognize POS in list of strings using Regex, each unique word only tagged once.
+
+    Parameters
+    ----------
+    strings: list of str
+
+    Returns
+    -------
+    result : list of tokenized strings with POS related
+    """
+    if not isinstance(strings, list):
+        raise ValueError('input must be a list')
+    if len(strings) and not isinstance(strings[0], str):
+        raise ValueError('input must be list of strings')
+    splitted = [string.lower().split() for string in strings]
+    tags = {}
+    for words in splitted:
+        for word in words:
+            if word not in tags:
+                tags[word] = _naive_POS_word(word)
+    return [[tags[word] for word in words] for words in splitted]
 
 
 def transformer(model = 'xlnet', size = 'base', validate = True):
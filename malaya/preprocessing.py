@@ -6,12 +6,12 @@ import itertools
 from functools import lru_cache
 from math import log10
 from unidecode import unidecode
-from .texts._tatabahasa import rules_normalizer, hujung
+from .texts._tatabahasa import rules_normalizer
 from .texts._regex import _expressions, _money
 from .texts._english_words import _english_words
 from ._utils._paths import PATH_PREPROCESSING, S3_PATH_PREPROCESSING
-from ._utils._utils import check_file, check_available
-from .stem import naive
+from ._utils._utils import check_file, check_available, multiprocessing_imap
+from .stem import naive, _hujung
 
 _annotate = [
     'hashtag',
@@ -25,6 +25,7 @@ _annotate = [
 _normalize = list(_expressions.keys())
 
 REGEX_TOKEN = re.compile(r'\b[a-z]{2,}\b')
+_spaces_regex = re.compile(r' +')
 NGRAM_SEP = '_'
 
 
@@ -48,48 +49,58 @@ def _case_of(text):
     )
 
 
+@lru_cache(maxsize = 65536)
 def _naive_stem(word):
-    hujung_result = [e for e in hujung if word.endswith(e)]
+    hujung_result = _hujung.matches(word)
     if len(hujung_result):
         hujung_result = max(hujung_result, key = len)
-        if len(hujung_result):
-            word = word[: -len(hujung_result)]
+        word = word[: -len(hujung_result)]
     return word
 
 
+_contractions = [
+    (
+        r"(?:[Aa]re|[Cc]ould|[Dd]id|[Dd]oes|[Dd]o|[Hh]ad|[Hh]as|[Hh]ave|[Ii]s|[Mm]ight|[Mm]ust|[Ss]hould|[Ww]ere|[Ww]ould)",
+        r"n't",
+        ' not',
+    ),
+    (r'(?:[Hh]e|[Ii]|[Ss]he|[Tt]hey|[Ww]e|[Ww]hat|[Ww]ho|[Yy]ou)', r"'ll", ' will'),
+    (r'(?:[Tt]hey|[Ww]e|[Ww]hat|[Ww]ho|[Yy]ou)', r"'re", ' are'),
+    (
+        r'(?:[Ii]|[Ss]hould|[Tt]hey|[Ww]e|[Ww]hat|[Ww]ho|[Ww]ould|[Yy]ou)',
+        r"'ve",
+        ' have',
+    ),
+    (r'[Cc]a', r"n't", 'n not'),
+    (r'[Ii]', r"'m", ' am'),
+    (r'[Ll]et', r"'s", ' us'),
+    (r'[Ww]', r"on't", 'ill not'),
+    (r'[Ss]', r"han't", 'hall not'),
+    (r'[Yy]', r"(?:'all|a'll)", 'ou all'),
+]
+_contractions_regex = re.compile(
+    '|'.join(
+        r'\b(?P<c%d>%s)%s' % (no, word, suffix)
+        for no, (word, suffix, _) in enumerate(_contractions)
+    )
+)
+
+
+def _unpack_contraction(m):
+    no = int(m.lastgroup[1:])
+    return m.group(m.lastgroup) + _contractions[no][2]
+
+
 def unpack_english_contractions(text):
     """
     Replace *English* contractions in ``text`` str with their unshortened forms.
     N.B. The "'d" and "'s" forms are ambiguous (had/would, is/has/possessive),
     so are left as-is.
     Important Note: The function is taken from textacy (https://github.com/chartbeat-labs/textacy).
+    All rules are compiled into a single alternation, applied in one pass.
     """
 
-    text = re.sub(
-        r"(\b)([Aa]re|[Cc]ould|[Dd]id|[Dd]oes|[Dd]o|[Hh]ad|[Hh]as|[Hh]ave|[Ii]s|[Mm]ight|[Mm]ust|[Ss]hould|[Ww]ere|[Ww]ould)n't",
-        r'\1\2 not',
-        text,
-    )
-    text = re.sub(
-        r"(\b)([Hh]e|[Ii]|[Ss]he|[Tt]hey|[Ww]e|[Ww]hat|[Ww]ho|[Yy]ou)'ll",
-        r'\1\2 will',
-        text,
-    )
-    text = re.sub(
-        r"(\b)([Tt]hey|[Ww]e|[Ww]hat|[Ww]ho|[Yy]ou)'re", r'\1\2 are', text
-    )
-    text = re.sub(
-        r"(\b)([Ii]|[Ss]hould|[Tt]hey|[Ww]e|[Ww]hat|[Ww]ho|[Ww]ould|[Yy]ou)'ve",
-        r'\1\2 have',
-        text,
-    )
-    text = re.sub(r"(\b)([Cc]a)n't", r'\1\2n not', text)
-    text = re.sub(r"(\b)([Ii])'m", r'\1\2 am', text)
-    text = re.sub(r"(\b)([Ll]et)'s", r'\1\2 us', text)
-    text = re.sub(r"(\b)([Ww])on't", r'\1\2ill not', text)
-    text = re.sub(r"(\b)([Ss])han't", r'\1\2hall not', text)
-    text = re.sub(r"(\b)([Yy])(?:'all|a'll)", r'\1\2ou all', text)
-    return text
+    return _contractions_regex.sub(_unpack_contraction, text)
 
 
 def _get_expression_dict():
@@ -146,76 +157,110 @@ class SocialTokenizer:
         numbers = kwargs.get('numbers', True)
 
         if urls:
-            pipeline.append(self.regexes['url'])
+            pipeline.append(('url', self.regexes['url']))
 
         if tags:
-            pipeline.append(self.regexes['tag'])
+            pipeline.append(('tag', self.regexes['tag']))
 
         if emails:
-            pipeline.append(self.wrap_non_matching(self.regexes['email']))
+            pipeline.append(
+                ('email', self.wrap_non_matching(self.regexes['email']))
+            )
 
         if users:
-            pipeline.append(self.wrap_non_matching(self.regexes['user']))
+            pipeline.append(
+                ('user', self.wrap_non_matching(self.regexes['user']))
+            )
 
         if hashtags:
-            pipeline.append(self.wrap_non_matching(self.regexes['hashtag']))
+            pipeline.append(
+                ('hashtag', self.wrap_non_matching(self.regexes['hashtag']))
+            )
 
         if cashtags:
-            pipeline.append(self.wrap_non_matching(self.regexes['cashtag']))
+            pipeline.append(
+                ('cashtag', self.wrap_non_matching(self.regexes['cashtag']))
+            )
 
         if phones:
-            pipeline.append(self.wrap_non_matching(self.regexes['phone']))
+            pipeline.append(
+                ('phone', self.wrap_non_matching(self.regexes['phone']))
+            )
 
         if percents:
-            pipeline.append(self.wrap_non_matching(self.regexes['percent']))
+            pipeline.append(
+                ('percent', self.wrap_non_matching(self.regexes['percent']))
+            )
 
         if money:
-            pipeline.append(self.wrap_non_matching(self.regexes['money']))
+            pipeline.append(
+                ('money', self.wrap_non_matching(self.regexes['money']))
+            )
 
         if date:
-            pipeline.append(self.wrap_non_matching(self.regexes['date']))
+            pipeline.append(
+                ('date', self.wrap_non_matching(self.regexes['date']))
+            )
 
         if time:
-            pipeline.append(self.wrap_non_matching(self.regexes['time']))
+            pipeline.append(
+                ('time', self.wrap_non_matching(self.regexes['time']))
+            )
 
         if acronyms:
-            pipeline.append(self.wrap_non_matching(self.regexes['acronym']))
+            pipeline.append(
+                ('acronym', self.wrap_non_matching(self.regexes['acronym']))
+            )
 
         if emoticons:
-            pipeline.append(self.regexes['ltr_face'])
-            pipeline.append(self.regexes['rtl_face'])
+            pipeline.append(('ltr_face', self.regexes['ltr_face']))
+            pipeline.append(('rtl_face', self.regexes['rtl_face']))
 
         if censored:
-            pipeline.append(self.wrap_non_matching(self.regexes['censored']))
+            pipeline.append(
+                ('censored', self.wrap_non_matching(self.regexes['censored']))
+            )
 
         if emphasis:
-            pipeline.append(self.wrap_non_matching(self.regexes['emphasis']))
+            pipeline.append(
+                ('emphasis', self.wrap_non_matching(self.regexes['emphasis']))
+            )
 
         if emoticons:
             pipeline.append(
-                self.wrap_non_matching(self.regexes['rest_emoticons'])
+                (
+                    'rest_emoticons',
+                    self.wrap_non_matching(self.regexes['rest_emoticons']),
+                )
             )
 
         if numbers:
-            pipeline.append(self.regexes['number'])
+            pipeline.append(('number', self.regexes['number']))
 
         if emojis:
-            pipeline.append(self.regexes['emoji'])
+            pipeline.append(('emoji', self.regexes['emoji']))
 
         # any other word
-        pipeline.append(self.regexes['word'])
+        pipeline.append(('word', self.regexes['word']))
 
         if emoticons:
             pipeline.append(
-                self.wrap_non_matching(self.regexes['eastern_emoticons'])
+                (
+                    'eastern_emoticons',
+                    self.wrap_non_matching(self.regexes['eastern_emoticons']),
+                )
             )
 
         # keep repeated puncts as one term
         # pipeline.append(r"")
 
-        pipeline.append('(?:\S)')  # CATCH ALL remaining terms
+        pipeline.append(('other', '(?:\S)'))  # CATCH ALL remaining terms
 
-        self.tok = re.compile(r'({})'.format('|'.join(pipeline)))
+        # list of (name, pattern), order is priority.
+        self.pipeline = pipeline
+        self.tok = re.compile(
+            r'({})'.format('|'.join(pattern for _, pattern in pipeline))
+        )
 
     @staticmethod
     def wrap_non_matching(exp):
@@ -259,7 +304,7 @@ class _Pdist(dict):
 
 
 class _Segmenter:
-    def __init__(self, max_split_length = 20):
+    def __init__(self, max_split_length = 20, cache_size = 65536):
         self.unigrams = _read_stats(1)
         self.bigrams = _read_stats(2)
         self.N = sum(self.unigrams.values())
@@ -269,6 +314,17 @@ class _Segmenter:
         self.P2w = _Pdist(self.bigrams, self.N)
 
         self.case_split = _get_expression_dict()['camel_split']
+        self._cache_size = cache_size
+        self._segment = lru_cache(maxsize = cache_size)(self._segment)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state['_segment']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._segment = lru_cache(maxsize = self._cache_size)(self._segment)
 
     def condProbWord(self, word, prev):
         try:
@@ -280,38 +336,69 @@ class _Segmenter:
     def unk_probability(key, total):
         return 10.0 / (total * 10 ** len(key))
 
-    @staticmethod
-    def combine(first, rem):
-        (first_prob, first_word) = first
-        (rem_prob, rem_words) = rem
-        return first_prob + rem_prob, [first_word] + rem_words
-
-    def splits(self, text):
-        return [
-            (text[: i + 1], text[i + 1 :])
-            for i in range(min(len(text), self.L))
-        ]
-
-    @lru_cache(maxsize = 65536)
     def find_segment(self, text, prev = '<S>'):
+        """
+        Viterbi search over unigram and bigram probabilities.
+        best[i] maps the last word of a segmentation of text[:i] to its
+        (log probability, previous word).
+        """
         if not text:
             return 0.0, []
-        candidates = [
-            self.combine(
-                (log10(self.condProbWord(first, prev)), first),
-                self.find_segment(rem, first),
-            )
-            for first, rem in self.splits(text)
-        ]
-        return max(candidates)
-
-    @lru_cache(maxsize = 65536)
-    def segment(self, word):
+        best = [{} for _ in range(len(text) + 1)]
+        best[0][prev] = (0.0, None)
+        for end in range(1, len(text) + 1):
+            states = best[end]
+            for length in range(1, min(end, self.L) + 1):
+                word = text[end - length : end]
+                for p, (prob, _) in best[end - length].items():
+                    prob = prob + log10(self.condProbWord(word, p))
+                    if word not in states or prob > states[word][0]:
+                        states[word] = (prob, p)
+
+        end = len(text)
+        word, (prob, p) = max(best[end].items(), key = lambda item: item[1][0])
+        words = []
+        while end > 0:
+            words.append(word)
+            end -= len(word)
+            word, p = p, best[end][p][1]
+        return prob, words[::-1]
+
+    def _segment(self, word):
         if word.islower():
             return ' '.join(self.find_segment(word)[1])
         else:
             return self.case_split.sub(r' \1', word).lower()
 
+    def segment(self, word):
+        """
+        Segment a string.
+
+        Parameters
+        ----------
+        word : str
+
+        Returns
+        -------
+        string: segmented string
+        """
+        return self._segment(word)
+
+    def segment_batch(self, strings):
+        """
+        Segment list of strings, duplicate strings only segmented once.
+
+        Parameters
+        ----------
+        strings : List[str]
+
+        Returns
+        -------
+        result: List[str]
+        """
+        segmented = {s: self._segment(s) for s in set(strings)}
+        return [segmented[s] for s in strings]
+
 
 class _Preprocessing:
     def __init__(
@@ -374,7 +461,6 @@ class _Preprocessing:
             processed = ' '.join([' {} <{}> '.format(t, tag) for t in tokens])
             return ' ' + processed + ' '
 
-    @lru_cache(maxsize = 65536)
     def _handle_hashtag_match(self, m):
         expanded = m.group()[1:]
         if self._expand_hashtags:
@@ -393,7 +479,6 @@ class _Preprocessing:
 
         return expanded
 
-    @lru_cache(maxsize = 65536)
     def _handle_repeated_puncts(self, m):
         text = m.group()
         text = ''.join(sorted(set(text), reverse = True))
@@ -403,7 +488,6 @@ class _Preprocessing:
 
         return text
 
-    @lru_cache(maxsize = 65536)
     def _handle_generic_match(self, m, tag, mode = 'every'):
         text = m.group()
         text = self._add_special_tag(text, tag, mode = mode)
@@ -424,7 +508,6 @@ class _Preprocessing:
             text = self._add_special_tag(text, 'elongated')
         return text
 
-    @lru_cache(maxsize = 65536)
     def _handle_emphasis_match(self, m):
         text = m.group().replace('*', '')
         if 'emphasis' in self._annotate:
@@ -432,9 +515,6 @@ class _Preprocessing:
 
         return text
 
-    def _dict_replace(self, wordlist, _dict):
-        return [_dict.get(w, w) for w in wordlist]
-
     @staticmethod
     def text(wordlist):
         in_hashtag = False
@@ -453,18 +533,25 @@ class _Preprocessing:
         return _words
 
     def process(self, text):
-        text = re.sub(r' +', ' ', text)
+        """
+        Preprocess a string.
+
+        Parameters
+        ----------
+        text : str
+
+        Returns
+        -------
+        result: List[str]
+        """
+        text = _spaces_regex.sub(' ', text)
         if self._fix_unidecode:
             text = ftfy.fix_text(text)
 
         for item in self._normalize:
-            text = self._regexes[item].sub(
-                lambda m: ' ' + '<' + item + '>' + ' ', text
-            )
+            text = self._regexes[item].sub(' <%s> ' % (item), text)
 
-        text = self._regexes['hashtag'].sub(
-            lambda w: self._handle_hashtag_match(w), text
-        )
+        text = self._regexes['hashtag'].sub(self._handle_hashtag_match, text)
 
         if 'allcaps' in self._annotate:
             text = self._regexes['allcaps'].sub(
@@ -475,15 +562,15 @@ class _Preprocessing:
             )
         if 'elongated' in self._annotate:
             text = self._regexes['elongated'].sub(
-                lambda w: self._handle_elongated_match(w), text
+                self._handle_elongated_match, text
             )
         if 'repeated' in self._annotate:
             text = self._regexes['repeat_puncts'].sub(
-                lambda w: self._handle_repeated_puncts(w), text
+                self._handle_repeated_puncts, text
             )
         if 'emphasis' in self._annotate:
             text = self._regexes['emphasis'].sub(
-                lambda w: self._handle_emphasis_match(w), text
+                self._handle_emphasis_match, text
             )
         if 'censored' in self._annotate:
             text = self._regexes['censored'].sub(
@@ -492,19 +579,44 @@ class _Preprocessing:
         if self._expand_contractions:
             text = unpack_english_contractions(text)
 
-        text = re.sub(r' +', ' ', text)
         text = self.text(text.split())
         text = ' '.join(text)
         text = self._tokenizer(text)
-        text = self._dict_replace(text, rules_normalizer)
+        return [self._replace_word(w) for w in text]
+
+    def _replace_word(self, word):
+        word = rules_normalizer.get(word, word)
         if self._translator:
-            text = self._dict_replace(text, self._translator)
-        if self._remove_postfix:
-            text = [
-                _naive_stem(w) if w not in _english_words else w for w in text
-            ]
+            word = self._translator.get(word, word)
+        if self._remove_postfix and word not in _english_words:
+            word = _naive_stem(word)
+        return word
 
-        return text
+    def process_batch(self, strings, cores = None, chunksize = 64):
+        """
+        Preprocess list of strings using multiprocessing, order of results is preserved.
+
+        Parameters
+        ----------
+        strings : iterable of str
+        cores: int, optional (default=None)
+            number of processes, if None, will use all available cpus.
+        chunksize: int, optional (default=64)
+            number of strings sent to a process at once.
+
+        Returns
+        -------
+        result: List[List[str]]
+        """
+        if cores is not None and not isinstance(cores, int):
+            raise ValueError('cores must be an integer')
+        if not isinstance(chunksize, int):
+            raise ValueError('chunksize must be an integer')
+        return list(
+            multiprocessing_imap(
+                self, 'process', strings, cores = cores, chunksize = chunksize
+            )
+        )
 
 
 def preprocessing(
@@ -644,7 +756,7 @@ def preprocessing(
     )
 
 
-def segmenter(max_split_length = 20, validate = True):
+def segmenter(max_split_length = 20, cache_size = 65536, validate = True):
     """
     Load Segmenter class.
 
@@ -652,6 +764,8 @@ def segmenter(max_split_length = 20, validate = True):
     ----------
     max_split_length: int, (default=20)
         max length of words in a sentence to segment
+    cache_size: int, (default=65536)
+        size of LRU cache for segmented strings, bounded per Segmenter object.
     validate: bool, optional (default=True)
         if True, malaya will check model availability and download if not available.
 
@@ -674,7 +788,11 @@ def segmenter(max_split_length = 20, validate = True):
             raise Exception(
                 'preprocessing is not available, please `validate = True`'
             )
-    return _Segmenter(max_split_length = max_split_length)
+    if not isinstance(cache_size, int):
+        raise ValueError('cache_size must be an integer')
+    return _Segmenter(
+        max_split_length = max_split_length, cache_size = cache_size
+    )
 
 
 _tokenizer = SocialTokenizer().tokenize
@@ -3,11 +3,13 @@ import os
 import random
 import numpy as np
 import json
-from .texts._jarowrinkler import JaroWinkler
 from sklearn.metrics.pairwise import (
     cosine_similarity,
     euclidean_distances,
     manhattan_distances,
+    paired_cosine_distances,
+    paired_euclidean_distances,
+    paired_manhattan_distances,
 )
 from ._utils._utils import (
     check_file,
@@ -16,6 +18,7 @@ from ._utils._utils import (
     generate_session,
     sentencepiece_tokenizer_bert,
     sentencepiece_tokenizer_xlnet,
+    bag_of_vectors,
 )
 from .preprocessing import _tokenizer
 from ._models._bert_model import SIAMESE_BERT
@@ -23,6 +26,10 @@ from ._models._xlnet_model import SIAMESE_XLNET
 from ._utils._paths import PATH_SIMILARITY, S3_PATH_SIMILARITY
 
 
+def _paired_cosine_similarity(left_vectors, right_vectors):
+    return 1 - paired_cosine_distances(left_vectors, right_vectors)
+
+
 class _VECTORIZER_SIMILARITY:
     def __init__(self, vectorizer):
         self._vectorizer = vectorizer
@@ -183,7 +190,6 @@ class _VECTORIZER_SIMILARITY:
 class _DOC2VEC_SIMILARITY:
     def __init__(self, vectorizer):
         self._vectorizer = vectorizer
-        self._jarowinkler = JaroWinkler()
 
     def _predict(
         self,
@@ -192,6 +198,7 @@ class _DOC2VEC_SIMILARITY:
         aggregation = 'mean',
         similarity = 'cosine',
         soft = True,
+        paired = False,
     ):
 
         if not isinstance(left_strings, list):
@@ -216,91 +223,49 @@ class _DOC2VEC_SIMILARITY:
         identical = left_strings == right_strings
 
         aggregation = aggregation.lower()
-        if aggregation == 'mean':
-            aggregation_function = np.mean
-        elif aggregation == 'min':
-            aggregation_function = np.min
-        elif aggregation == 'max':
-            aggregation_function = np.max
-        elif aggregation == 'sum':
-            aggregation_function = np.sum
-        elif aggregation == 'sqrt':
-            aggregation_function = np.sqrt
-        else:
+        if aggregation not in ['mean', 'min', 'max', 'sum', 'sqrt']:
             raise ValueError(
                 "aggregation only supports 'mean', 'min', 'max', 'sum' and 'sqrt'"
             )
 
         similarity = similarity.lower()
         if similarity == 'cosine':
-            similarity_function = cosine_similarity
+            similarity_function = (
+                _paired_cosine_similarity if paired else cosine_similarity
+            )
         elif similarity == 'euclidean':
-            similarity_function = euclidean_distances
+            similarity_function = (
+                paired_euclidean_distances if paired else euclidean_distances
+            )
         elif similarity == 'manhattan':
-            similarity_function = manhattan_distances
+            similarity_function = (
+                paired_manhattan_distances if paired else manhattan_distances
+            )
         else:
             raise ValueError(
                 "similarity only supports 'cosine', 'euclidean', and 'manhattan'"
             )
 
-        left_vectors, right_vectors = [], []
-        for i in range(len(left_strings)):
-            left_string = left_strings[i]
-            right_string = right_strings[i]
-            left_tokenized = _tokenizer(left_string)
-            if not len(left_tokenized):
-                raise ValueError('insert not empty left string')
-            right_tokenized = _tokenizer(right_string)
-            if not len(right_tokenized):
-                raise ValueError('insert not empty right string')
-
-            in_vector = []
-            for token in left_tokenized:
-                try:
-                    in_vector.append(self._vectorizer.get_vector_by_name(token))
-                except:
-                    if not soft:
-                        pass
-                    else:
-                        arr = np.array(
-                            [
-                                self._jarowinkler.similarity(token, k)
-                                for k in self._vectorizer.words
-                            ]
-                        )
-                        idx = (-arr).argsort()[0]
-                        in_vector.append(
-                            self._vectorizer.get_vector_by_name(
-                                self._vectorizer.words[idx]
-                            )
-                        )
-            left_vectors.append(aggregation_function(in_vector, axis = 0))
-
-            if not identical:
-                in_vector = []
-                for token in right_tokenized:
-                    try:
-                        in_vector.append(
-                            self._vectorizer.get_vector_by_name(token)
-                        )
-                    except:
-                        if not soft:
-                            pass
-                        else:
-                            arr = np.array(
-                                [
-                                    self._jarowinkler.similarity(token, k)
-                                    for k in self._vectorizer.words
-                                ]
-                            )
-                            idx = (-arr).argsort()[0]
-                            in_vector.append(
-                                self._vectorizer.get_vector_by_name(
-                                    self._vectorizer.words[idx]
-                                )
-                            )
-
-                right_vectors.append(aggregation_function(in_vector, axis = 0))
+        left_tokenized = [_tokenizer(string) for string in left_strings]
+        if not all([len(tokens) for tokens in left_tokenized]):
+            raise ValueError('insert not empty left string')
+        right_tokenized = [_tokenizer(string) for string in right_strings]
+        if not all([len(tokens) for tokens in right_tokenized]):
+            raise ValueError('insert not empty right string')
+
+        left_vectors = bag_of_vectors(
+            self._vectorizer,
+            left_tokenized,
+            aggregation = aggregation,
+            soft = soft,
+        )
+        if not identical:
+            right_vectors = bag_of_vectors(
+                self._vectorizer,
+                right_tokenized,
+                aggregation = aggregation,
+                soft = soft,
+            )
 
         if identical:
             similar = similarity_function(left_vectors, left_vectors)
@@ -359,7 +324,8 @@ class _DOC2VEC_SIMILARITY:
             aggregation = aggregation,
             similarity = similarity,
             soft = soft,
-        )[0, 0]
+            paired = True,
+        )[0]
 
     def predict_batch(
         self,
@@ -404,7 +370,8 @@ class _DOC2VEC_SIMILARITY:
             aggregation = aggregation,
             similarity = similarity,
             soft = soft,
-        ).diagonal()
+            paired = True,
+        )
 
     def tree_plot(
         self,
@@ -524,6 +491,425 @@ def encoder(vectorizer):
     return _VECTORIZER_SIMILARITY(vectorizer)
 
 
+class _SIMILARITY_INDEX:
+    def __init__(self, vectorizer, path = None, dtype = 'float32'):
+        self._vectorizer = vectorizer
+        self._path = path
+        self._dtype = dtype
+        self._dimension = None
+        self._ids = []
+        self._deleted = []
+        self._blocks = []
+        self._matrix = None
+        if path is not None and os.path.isfile(self._metadata_path):
+            with open(self._metadata_path) as fopen:
+                metadata = json.load(fopen)
+            self._dtype = metadata['dtype']
+            self._dimension = metadata['dimension']
+            self._ids = metadata['ids']
+            self._deleted = metadata['deleted']
+        self._rows = {i: no for no, i in enumerate(self._ids)}
+
+    @property
+    def _vectors_path(self):
+        return os.path.join(self._path, 'vectors.bin')
+
+    @property
+    def _metadata_path(self):
+        return os.path.join(self._path, 'index.json')
+
+    def __len__(self):
+        return len(self._ids) - sum(self._deleted)
+
+    def _get_matrix(self):
+        if self._matrix is None:
+            if not len(self._ids):
+                self._matrix = np.zeros((0, self._dimension or 0))
+            elif self._path is None:
+                self._matrix = np.concatenate(self._blocks)
+                self._blocks = [self._matrix]
+            else:
+                self._matrix = np.memmap(
+                    self._vectors_path,
+                    dtype = self._dtype,
+                    mode = 'r',
+                    shape = (len(self._ids), self._dimension),
+                )
+        return self._matrix
+
+    def _encode(self, strings):
+        vectors = np.asarray(
+            self._vectorizer.vectorize(strings), dtype = np.float32
+        )
+        norm = np.linalg.norm(vectors, axis = 1, keepdims = True)
+        return vectors / np.maximum(norm, 1e-12)
+
+    def _check_id(self, i, seen):
+        try:
+            hash(i)
+            valid = json.loads(json.dumps(i)) == i
+        except (TypeError, ValueError):
+            valid = False
+        if not valid:
+            raise ValueError('id %s must be hashable and json serializable' % (i,))
+        if i in self._rows or i in seen:
+            raise ValueError('id %s already exists' % (i,))
+        seen.add(i)
+
+    def _truncate(self, rows):
+        if self._path is None or not os.path.isfile(self._vectors_path):
+            return
+        itemsize = np.dtype(self._dtype).itemsize
+        with open(self._vectors_path, 'r+b') as fopen:
+            fopen.truncate(rows * (self._dimension or 0) * itemsize)
+
+    def _rollback(self, rows, blocks, dimension):
+        for i in self._ids[rows:]:
+            self._rows.pop(i, None)
+        self._ids = self._ids[:rows]
+        self._deleted = self._deleted[:rows]
+        self._blocks = self._blocks[:blocks]
+        self._truncate(rows)
+        self._dimension = dimension
+        self._matrix = None
+
+    def add(self, strings, ids = None, batch_size = 64):
+        """
+        encode strings in batches and append into the index.
+        if any batch fails, nothing from this call is added.
+
+        Parameters
+        ----------
+        strings : iterable of str
+            can be a generator, only `batch_size` strings are encoded at a time.
+        ids : iterable, optional (default=None)
+            hashable and json serializable id for each string, default is position in the index.
+            tuple is not allowed because json loads it back as list.
+        batch_size : int, optional (default=64)
+        """
+        if not isinstance(batch_size, int):
+            raise ValueError('batch_size must be an integer')
+        strings = iter(strings)
+        ids = iter(ids) if ids is not None else None
+        if self._path is not None:
+            os.makedirs(self._path, exist_ok = True)
+        rows, blocks, dimension = (
+            len(self._ids),
+            len(self._blocks),
+            self._dimension,
+        )
+        # drop rows written by an interrupted add that never reached index.json.
+        self._truncate(rows)
+        seen = set()
+        try:
+            while True:
+                batch = [s for _, s in zip(range(batch_size), strings)]
+                if not len(batch):
+                    break
+                if not all(isinstance(s, str) for s in batch):
+                    raise ValueError('strings must be list of strings')
+                if ids is not None:
+                    batch_ids = [i for _, i in zip(batch, ids)]
+                    if len(batch_ids) != len(batch):
+                        raise ValueError(
+                            'length of ids must be same with length of strings'
+                        )
+                else:
+                    batch_ids = list(
+                        range(len(self._ids), len(self._ids) + len(batch))
+                    )
+                for i in batch_ids:
+                    self._check_id(i, seen)
+                vectors = self._encode(batch).astype(self._dtype)
+                if self._dimension not in [None, vectors.shape[1]]:
+                    raise ValueError(
+                        'vector dimension %d must be same with index dimension %d'
+                        % (vectors.shape[1], self._dimension)
+                    )
+                self._dimension = vectors.shape[1]
+                if self._path is None:
+                    self._blocks.append(vectors)
+                else:
+                    with open(self._vectors_path, 'ab') as fopen:
+                        fopen.write(vectors.tobytes())
+                for i in batch_ids:
+                    self._rows[i] = len(self._ids)
+                    self._ids.append(i)
+                    self._deleted.append(False)
+                self._matrix = None
+            self.save()
+        except BaseException:
+            self._rollback(rows, blocks, dimension)
+            raise
+
+    def delete(self, ids):
+        """
+        delete ids from the index, rows are only removed from disk on `compact`.
+
+        Parameters
+        ----------
+        ids : list
+        """
+        if not isinstance(ids, list):
+            raise ValueError('ids must be a list')
+        for i in ids:
+            if i not in self._rows:
+                raise ValueError('id %s not found' % (i))
+            self._deleted[self._rows[i]] = True
+        self.save()
+
+    def compact(self):
+        """
+        remove deleted rows from the index.
+        """
+        keep = np.nonzero(~np.array(self._deleted, dtype = bool))[0]
+        matrix = np.array(self._get_matrix()[keep])
+        self._matrix = None
+        if self._path is not None:
+            temp_path = self._vectors_path + '.tmp'
+            with open(temp_path, 'wb') as fopen:
+                fopen.write(matrix.tobytes())
+            os.replace(temp_path, self._vectors_path)
+        self._ids = [self._ids[i] for i in keep]
+        self._deleted = [False] * len(self._ids)
+        self._rows = {i: no for no, i in enumerate(self._ids)}
+        if self._path is None:
+            self._blocks = [matrix]
+        self.save()
+
+    def save(self):
+        if self._path is None:
+            return
+        temp_path = self._metadata_path + '.tmp'
+        with open(temp_path, 'w') as fopen:
+            json.dump(
+                {
+                    'dtype': self._dtype,
+                    'dimension': self._dimension,
+                    'ids': self._ids,
+                    'deleted': self._deleted,
+                },
+                fopen,
+            )
+        os.replace(temp_path, self._metadata_path)
+
+    def query(self, strings, top_k = 10, block_size = 65536):
+        """
+        find most similar strings inside the index.
+
+        Parameters
+        ----------
+        strings : list of str
+        top_k : int, optional (default=10)
+        block_size : int, optional (default=65536)
+            number of index rows scored at a time.
+
+        Returns
+        -------
+        result: list of list of (id, similarity), similarity is between 0-1.
+        """
+        if not isinstance(strings, list):
+            raise ValueError('strings must be a list')
+        if not isinstance(strings[0], str):
+            raise ValueError('strings must be list of strings')
+        if not isinstance(top_k, int):
+            raise ValueError('top_k must be an integer')
+        queries = self._encode(strings)
+        matrix = self._get_matrix()
+        deleted = np.array(self._deleted, dtype = bool)
+        indices = np.zeros((len(queries), 0), dtype = np.int64)
+        values = np.zeros((len(queries), 0), dtype = np.float32)
+        for i in range(0, len(matrix), block_size):
+            block = np.asarray(matrix[i : i + block_size], dtype = np.float32)
+            similarities = queries.dot(block.T)
+            similarities[:, deleted[i : i + block_size]] = -np.inf
+            values = np.concatenate([values, similarities], axis = 1)
+            indices = np.concatenate(
+                [
+                    indices,
+                    np.broadcast_to(
+                        np.arange(i, i + len(block)), similarities.shape
+                    ),
+                ],
+                axis = 1,
+            )
+            if values.shape[1] > top_k:
+                top = np.argpartition(-values, top_k - 1, axis = 1)[:, :top_k]
+                values = np.take_along_axis(values, top, axis = 1)
+                indices = np.take_along_axis(indices, top, axis = 1)
+        order = np.argsort(-values, axis = 1, kind = 'stable')
+        values = np.take_along_axis(values, order, axis = 1)
+        indices = np.take_along_axis(indices, order, axis = 1)
+        results = []
+        for no in range(len(queries)):
+            results.append(
+                [
+                    (self._ids[i], float((v + 1) / 2))
+                    for i, v in zip(indices[no], values[no])
+                    if v > -np.inf
+                ]
+            )
+        return results
+
+
+def index(vectorizer, path = None, dtype = 'float32'):
+    """
+    Corpus similarity search index on top of encoder interface, eg, BERT, skip-thought, XLNET.
+
+    Parameters
+    ----------
+    vectorizer : object
+        encoder interface object, BERT, skip-thought, XLNET.
+    path : str, optional (default=None)
+        directory to store vectors and metadata, index reloads from it if exists.
+        if None, index is kept in memory.
+    dtype : str, optional (default='float32')
+        storage precision, `float32` or `float16`.
+
+    Returns
+    -------
+    _SIMILARITY_INDEX: malaya.similarity._SIMILARITY_INDEX
+    """
+    if not hasattr(vectorizer, 'vectorize'):
+        raise ValueError('vectorizer must has `vectorize` method')
+    if path is not None and not isinstance(path, str):
+        raise ValueError('path must be a string')
+    if dtype not in ['float32', 'float16']:
+        raise ValueError('dtype only supports `float32` and `float16`')
+    return _SIMILARITY_INDEX(vectorizer, path = path, dtype = dtype)
+
+
+class _RETRIEVE_RERANK:
+    def __init__(self, vectorizer, model, shortlist = 20, batch_size = 32):
+        self._index = _SIMILARITY_INDEX(vectorizer)
+        self._model = model
+        self._shortlist = shortlist
+        self._batch_size = batch_size
+        self._strings = {}
+
+    def add(self, strings, ids = None, batch_size = 64):
+        """
+        add strings into the retrieval index.
+
+        Parameters
+        ----------
+        strings : list of str
+        ids : list, optional (default=None)
+            id for each string, default is position in the index.
+        batch_size : int, optional (default=64)
+            encoder batch size.
+        """
+        if not isinstance(strings, list):
+            raise ValueError('strings must be a list')
+        if ids is None:
+            start = len(self._index._ids)
+            ids = list(range(start, start + len(strings)))
+        if not isinstance(ids, list):
+            raise ValueError('ids must be a list')
+        if len(ids) != len(strings):
+            raise ValueError('length of ids must be same with length of strings')
+        # index.add is all or nothing, so strings only registered after it succeeded.
+        self._index.add(strings, ids = ids, batch_size = batch_size)
+        self._strings.update(zip(ids, strings))
+
+    def delete(self, ids):
+        """
+        delete ids from the retrieval index.
+
+        Parameters
+        ----------
+        ids : list
+        """
+        self._index.delete(ids)
+        for i in ids:
+            self._strings.pop(i, None)
+
+    def _rerank(self, lefts, rights):
+        order = np.argsort(
+            [len(l) + len(r) for l, r in zip(lefts, rights)], kind = 'stable'
+        )
+        scores = np.zeros(len(lefts))
+        for i in range(0, len(order), self._batch_size):
+            batch = order[i : i + self._batch_size]
+            scores[batch] = self._model.predict_batch(
+                [lefts[k] for k in batch], [rights[k] for k in batch]
+            )
+        return scores
+
+    def query(self, strings, top_k = 5, shortlist = None):
+        """
+        shortlist candidates using the encoder, then rerank only the shortlist using the siamese model.
+
+        Parameters
+        ----------
+        strings : list of str
+        top_k : int, optional (default=5)
+            number of results per string.
+        shortlist : int, optional (default=None)
+            number of candidates reranked per string, higher is better recall but slower.
+            if None, will use `shortlist` given to `retrieve_rerank`.
+
+        Returns
+        -------
+        result: list of list of (id, similarity), sorted by siamese similarity.
+        """
+        if not isinstance(strings, list):
+            raise ValueError('strings must be a list')
+        if not isinstance(top_k, int):
+            raise ValueError('top_k must be an integer')
+        shortlist = shortlist or self._shortlist
+        if not isinstance(shortlist, int):
+            raise ValueError('shortlist must be an integer')
+        candidates = self._index.query(strings, top_k = max(shortlist, top_k))
+        lefts, rights, owners = [], [], []
+        for no, candidate in enumerate(candidates):
+            for i, _ in candidate:
+                lefts.append(strings[no])
+                rights.append(self._strings[i])
+                owners.append((no, i))
+        results = [[] for _ in strings]
+        if len(lefts):
+            for (no, i), score in zip(owners, self._rerank(lefts, rights)):
+                results[no].append((i, float(score)))
+        return [
+            sorted(result, key = lambda x: x[1], reverse = True)[:top_k]
+            for result in results
+        ]
+
+
+def retrieve_rerank(vectorizer, model, shortlist = 20, batch_size = 32):
+    """
+    Two-stage similarity search, shortlist candidates using a cheap encoder,
+    then rerank the shortlist using siamese transformer model.
+
+    Parameters
+    ----------
+    vectorizer : object
+        encoder interface object, BERT, skip-thought, XLNET.
+    model : object
+        siamese model from malaya.similarity.transformer.
+    shortlist : int, optional (default=20)
+        number of candidates reranked per query, trade-off between recall and latency.
+    batch_size : int, optional (default=32)
+        siamese model batch size, pairs are batched by similar length.
+
+    Returns
+    -------
+    _RETRIEVE_RERANK: malaya.similarity._RETRIEVE_RERANK
+    """
+    if not hasattr(vectorizer, 'vectorize'):
+        raise ValueError('vectorizer must has `vectorize` method')
+    if not hasattr(model, 'predict_batch'):
+        raise ValueError('model must has `predict_batch` method')
+    if not isinstance(shortlist, int):
+        raise ValueError('shortlist must be an integer')
+    if not isinstance(batch_size, int):
+        raise ValueError('batch_size must be an integer')
+    return _RETRIEVE_RERANK(
+        vectorizer, model, shortlist = shortlist, batch_size = batch_size
+    )
+
+
 _availability = {'bert': ['base'], 'xlnet': ['base'], 'albert': ['base']}
 
 
@@ -10,14 +10,13 @@ from .texts._tatabahasa import (
     consonants,
     vowels,
     rules_normalizer,
-    permulaan,
-    hujung,
     stopword_tatabahasa,
     quad_vowels,
     group_compound,
 )
 from ._utils._paths import PATH_NGRAM, S3_PATH_NGRAM
 from ._utils._utils import check_file, check_available
+from .stem import _strip_affixes
 
 
 def _load_sentencepiece(vocab, vocab_model):
@@ -486,19 +485,8 @@ class _SpellCorrector(_Spell_augmentation):
             return word
         if word in stopword_tatabahasa:
             return word
-        hujung_result = [v for k, v in hujung.items() if word.endswith(k)]
         cp_word = word[:]
-        if len(hujung_result):
-            hujung_result = max(hujung_result, key = len)
-            if len(hujung_result):
-                word = word[: -len(hujung_result)]
-        permulaan_result = [
-            v for k, v in permulaan.items() if word.startswith(k)
-        ]
-        if len(permulaan_result):
-            permulaan_result = max(permulaan_result, key = len)
-            if len(permulaan_result):
-                word = word[len(permulaan_result) :]
+        word, hujung_result, permulaan_result = _strip_affixes(word)
         if len(word):
             if word in rules_normalizer:
                 word = rules_normalizer[word]
@@ -686,18 +674,7 @@ class _SymspellCorrector:
             return word
 
         cp_word = word[:]
-        hujung_result = [v for k, v in hujung.items() if word.endswith(k)]
-        if len(hujung_result):
-            hujung_result = max(hujung_result, key = len)
-            if len(hujung_result):
-                word = word[: -len(hujung_result)]
-        permulaan_result = [
-            v for k, v in permulaan.items() if word.startswith(k)
-        ]
-        if len(permulaan_result):
-            permulaan_result = max(permulaan_result, key = len)
-            if len(permulaan_result):
-                word = word[len(permulaan_result) :]
+        word, hujung_result, permulaan_result = _strip_affixes(word)
         if len(word):
             if word in rules_normalizer:
                 word = rules_normalizer[word]
@@ -1,6 +1,6 @@
-import re
+import os
 import json
-from unidecode import unidecode
+from functools import lru_cache
 from .texts._tatabahasa import permulaan, hujung, rules_normalizer
 from ._utils._utils import (
     load_graph,
@@ -12,8 +12,9 @@ from .texts._text_functions import (
     pad_sentence_batch,
     stemmer_str_idx,
     classification_textcleaning,
+    _classification_cleaning,
 )
-from ._utils._paths import PATH_STEM, S3_PATH_STEM
+from ._utils._paths import PATH_STEM, S3_PATH_STEM, PATH_SASTRAWI_CACHE
 from . import home
 
 factory = None
@@ -24,25 +25,113 @@ EOS = 2
 UNK = 3
 
 
+class _Affix:
+    """
+    Length-bucketed affix lookup, a word only probes its own prefixes / suffixes
+    instead of scanning every affix with startswith / endswith.
+    """
+
+    def __init__(self, affixes, suffix = True):
+        self._affixes = affixes
+        self._suffix = suffix
+        self._order = {k: no for no, k in enumerate(affixes)}
+        self._lengths = sorted({len(k) for k in affixes}, reverse = True)
+
+    def matches(self, word):
+        """
+        return matched affixes in the same order as the affixes dictionary.
+        """
+        if self._suffix:
+            keys = [word[-l:] for l in self._lengths if l <= len(word)]
+        else:
+            keys = [word[:l] for l in self._lengths if l <= len(word)]
+        return sorted(
+            [k for k in keys if k in self._affixes], key = self._order.get
+        )
+
+    def longest(self, word):
+        """
+        return longest matched affix value, or empty string.
+        """
+        matched = [self._affixes[k] for k in self.matches(word)]
+        if len(matched):
+            return max(matched, key = len)
+        return ''
+
+
+_hujung = _Affix(hujung, suffix = True)
+_permulaan = _Affix(permulaan, suffix = False)
+
+
+@lru_cache(maxsize = 65536)
+def _strip_affixes(word):
+    """
+    strip longest suffix then longest prefix.
+
+    Returns
+    -------
+    result: (stripped word, suffix, prefix), suffix and prefix are empty string if not found.
+    """
+    hujung_result = _hujung.longest(word)
+    if len(hujung_result):
+        word = word[: -len(hujung_result)]
+    permulaan_result = _permulaan.longest(word)
+    if len(permulaan_result):
+        word = word[len(permulaan_result) :]
+    return word, hujung_result, permulaan_result
+
+
+class _SASTRAWI:
+    """
+    Word-level memoized Sastrawi stemmer shared by summarize, topic_model and cluster,
+    the cache can be persisted to disk and reused across runs.
+    """
+
+    def __init__(self, stemmer):
+        from Sastrawi.Stemmer.Filter.TextNormalizer import normalize_text
+
+        self._normalize = normalize_text
+        self._stemmer = getattr(stemmer, 'delegatedStemmer', stemmer)
+        self._cache = {}
+
+    def _stem_word(self, word):
+        stem = self._cache.get(word)
+        if stem is None:
+            stem = self._stemmer.stem(word)
+            self._cache[word] = stem
+        return stem
+
+    def stem(self, string):
+        return ' '.join(
+            [self._stem_word(w) for w in self._normalize(string).split(' ')]
+        )
+
+    def stem_batch(self, strings):
+        results = {}
+        for string in strings:
+            if string not in results:
+                results[string] = self.stem(string)
+        return [results[string] for string in strings]
+
+    def load(self, path):
+        with open(path) as fopen:
+            self._cache.update(json.load(fopen))
+
+    def save(self, path):
+        with open(path, 'w') as fopen:
+            json.dump(self._cache, fopen)
+
+
 def _load_sastrawi():
     from Sastrawi.Stemmer.StemmerFactory import StemmerFactory
 
     global factory, sastrawi_stemmer
     factory = StemmerFactory()
-    sastrawi_stemmer = factory.create_stemmer()
+    sastrawi_stemmer = _SASTRAWI(factory.create_stemmer())
 
 
 def _classification_textcleaning_stemmer(string, attention = False):
-    string = re.sub(
-        'http\S+|www.\S+',
-        '',
-        ' '.join(
-            [i for i in string.split() if i.find('#') < 0 and i.find('@') < 0]
-        ),
-    )
-    string = unidecode(string).replace('.', ' . ').replace(',', ' , ')
-    string = re.sub('[^A-Za-z ]+', ' ', string)
-    string = re.sub(r'[ ]+', ' ', string.lower()).strip()
+    string = _classification_cleaning(string).lower()
     string = [rules_normalizer.get(w, w) for w in string.split()]
     string = [(naive(word), word) for word in string]
     if attention:
@@ -54,8 +143,15 @@ def _classification_textcleaning_stemmer(string, attention = False):
         return ' '.join([word[0] for word in string if len(word[0]) > 1])
 
 
+def _classification_textcleaning_stemmer_batch(strings):
+    cleaned = {
+        s: _classification_textcleaning_stemmer(s) for s in set(strings)
+    }
+    return [cleaned[s] for s in strings]
+
+
 class _DEEP_STEMMER:
-    def __init__(self, x, logits, sess, dicts):
+    def __init__(self, x, logits, sess, dicts, cache_size = 65536):
         self._sess = sess
         self._x = x
         self._logits = logits
@@ -63,6 +159,31 @@ class _DEEP_STEMMER:
         self._dicts['rev_dictionary_to'] = {
             int(k): v for k, v in self._dicts['rev_dictionary_to'].items()
         }
+        self._cache = {}
+        self._cache_size = cache_size
+
+    def _stem_words(self, words, batch_size):
+        results = {w: self._cache[w] for w in words if w in self._cache}
+        words = sorted({w for w in words if w not in results}, key = len)
+        for i in range(0, len(words), batch_size):
+            batch = words[i : i + batch_size]
+            idx = stemmer_str_idx(batch, self._dicts['dictionary_from'])
+            predicted = self._sess.run(
+                self._logits,
+                feed_dict = {self._x: pad_sentence_batch(idx, PAD)[0]},
+            )
+            for word, p in zip(batch, predicted):
+                results[word] = ''.join(
+                    [
+                        self._dicts['rev_dictionary_to'][c]
+                        for c in p
+                        if c not in [GO, PAD, EOS, UNK]
+                    ]
+                )
+                if len(self._cache) >= self._cache_size:
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[word] = results[word]
+        return results
 
     def stem(self, string):
         """
@@ -78,23 +199,39 @@ class _DEEP_STEMMER:
         """
         if not isinstance(string, str):
             raise ValueError('input must be a string')
-        token_strings = classification_textcleaning(string, True).split()
-        idx = stemmer_str_idx(token_strings, self._dicts['dictionary_from'])
-        predicted = self._sess.run(
-            self._logits, feed_dict = {self._x: pad_sentence_batch(idx, PAD)[0]}
+        return self.stem_batch([string])[0]
+
+    def stem_batch(self, strings, batch_size = 256):
+        """
+        Stem list of strings. Unique words across all strings are stemmed once,
+        in batches of similar length, and cached.
+
+        Parameters
+        ----------
+        strings : List[str]
+        batch_size : int, optional (default=256)
+            number of unique words for each session run.
+
+        Returns
+        -------
+        result: List[str]
+        """
+        if not isinstance(strings, list):
+            raise ValueError('input must be a list')
+        if len(strings) and not isinstance(strings[0], str):
+            raise ValueError('input must be list of strings')
+        if not isinstance(batch_size, int):
+            raise ValueError('batch_size must be an integer')
+        token_strings = [
+            classification_textcleaning(string, True).split()
+            for string in strings
+        ]
+        stems = self._stem_words(
+            [word for tokens in token_strings for word in tokens], batch_size
         )
-        results = []
-        for word in predicted:
-            results.append(
-                ''.join(
-                    [
-                        self._dicts['rev_dictionary_to'][c]
-                        for c in word
-                        if c not in [GO, PAD, EOS, UNK]
-                    ]
-                )
-            )
-        return ' '.join(results)
+        return [
+            ' '.join([stems[word] for word in tokens]) for tokens in token_strings
+        ]
 
 
 def naive(word):
@@ -111,17 +248,26 @@ def naive(word):
     """
     if not isinstance(word, str):
         raise ValueError('input must be a string')
-    hujung_result = [v for k, v in hujung.items() if word.endswith(k)]
-    if len(hujung_result):
-        hujung_result = max(hujung_result, key = len)
-        if len(hujung_result):
-            word = word[: -len(hujung_result)]
-    permulaan_result = [v for k, v in permulaan.items() if word.startswith(k)]
-    if len(permulaan_result):
-        permulaan_result = max(permulaan_result, key = len)
-        if len(permulaan_result):
-            word = word[len(permulaan_result) :]
-    return word
+    return _strip_affixes(word)[0]
+
+
+def naive_batch(words):
+    """
+    Stem list of strings using startswith and endswith, results are cached.
+
+    Parameters
+    ----------
+    words : List[str]
+
+    Returns
+    -------
+    result: List[str]
+    """
+    if not isinstance(words, list):
+        raise ValueError('input must be a list')
+    if len(words) and not isinstance(words[0], str):
+        raise ValueError('input must be list of strings')
+    return [_strip_affixes(word)[0] for word in words]
 
 
 def available_deep_model():
@@ -150,14 +296,82 @@ def sastrawi(string):
     return sastrawi_stemmer.stem(string)
 
 
-def deep_model(model = 'bahdanau', validate = True):
+def sastrawi_batch(strings):
+    """
+    Stem list of strings using Sastrawi, repeated strings and words only stemmed once.
+
+    Parameters
+    ----------
+    strings : list of str
+
+    Returns
+    -------
+    result: list of stemmed strings.
+    """
+    if sastrawi_stemmer is None:
+        _load_sastrawi()
+    if not isinstance(strings, list):
+        raise ValueError('input must be a list')
+    if len(strings) and not isinstance(strings[0], str):
+        raise ValueError('input must be list of strings')
+    return sastrawi_stemmer.stem_batch(strings)
+
+
+def load_sastrawi_cache(path = PATH_SASTRAWI_CACHE):
+    """
+    Load persisted Sastrawi word cache, so stemming on a new corpus can reuse words stemmed in previous runs.
+
+    Parameters
+    ----------
+    path : str, (default=PATH_SASTRAWI_CACHE)
+    """
+    if sastrawi_stemmer is None:
+        _load_sastrawi()
+    if not isinstance(path, str):
+        raise ValueError('path must be a string')
+    if os.path.exists(path):
+        sastrawi_stemmer.load(path)
+
+
+def save_sastrawi_cache(path = PATH_SASTRAWI_CACHE):
+    """
+    Persist Sastrawi word cache to disk.
+
+    Parameters
+    ----------
+    path : str, (default=PATH_SASTRAWI_CACHE)
+    """
+    if sastrawi_stemmer is None:
+        _load_sastrawi()
+    if not isinstance(path, str):
+        raise ValueError('path must be a string')
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok = True)
+    sastrawi_stemmer.save(path)
+
+
+def _stem_batch(strings, stemming):
+    if stemming is sastrawi:
+        return sastrawi_batch(strings)
+    return [stemming(string) for string in strings]
+
+
+def deep_model(model = 'bahdanau', validate = True, cache_size = 65536):
     """
     Load seq2seq stemmer deep learning model.
 
+    Parameters
+    ----------
+    cache_size: int, (default=65536)
+        maximum number of stemmed words kept in cache, oldest words are removed first.
+
     Returns
     -------
     DEEP_STEMMER: malaya.stemmer._DEEP_STEMMER class
     """
+    if not isinstance(cache_size, int):
+        raise ValueError('cache_size must be an integer')
     if validate:
         check_file(PATH_STEM[model], S3_PATH_STEM[model])
     else:
@@ -179,4 +393,5 @@ def deep_model(model = 'bahdanau', validate = True):
         g.get_tensor_by_name('import/logits:0'),
         generate_session(graph = g),
         dic_stemmer,
+        cache_size = cache_size,
     )
@@ -2,7 +2,6 @@ import numpy as np
 import re
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from sklearn.decomposition import TruncatedSVD, NMF, LatentDirichletAllocation
-from .texts._jarowrinkler import JaroWinkler
 from sklearn.metrics.pairwise import cosine_similarity
 from .texts._text_functions import (
     summary_textcleaning,
@@ -11,16 +10,126 @@ from .texts._text_functions import (
     simple_textcleaning,
 )
 import itertools
-import networkx as nx
-from .stem import sastrawi
+from functools import partial
+from scipy.sparse import csr_matrix, issparse
+from .stem import sastrawi_batch
 from ._models import _skip_thought
 from .cluster import cluster_words
+from ._utils._utils import bag_of_vectors, multiprocessing_imap
 from .texts.vectorizer import SkipGramVectorizer
 
 
+def _similarity_graph(vectors, threshold = 0.999, neighbors = None):
+    """
+    cosine similarity graph of sentence vectors, similarities >= threshold are removed.
+    If neighbors is not None, only keep the top `neighbors` positive similarities per sentence,
+    computed block by block into a symmetric sparse matrix.
+    """
+    if neighbors is None:
+        similar = cosine_similarity(vectors, vectors)
+        similar[similar >= threshold] = 0
+        return similar
+
+    vectors = vectors.toarray() if issparse(vectors) else np.asarray(vectors)
+    norm = np.linalg.norm(vectors, axis = 1, keepdims = True)
+    normed = vectors / np.maximum(norm, 1e-12)
+    size = normed.shape[0]
+    neighbors = min(neighbors, size)
+    rows, columns, values = [], [], []
+    for start in range(0, size, 1024):
+        similar = normed[start : start + 1024].dot(normed.T)
+        similar[similar >= threshold] = 0
+        top = np.argpartition(-similar, neighbors - 1, axis = 1)[
+            :, :neighbors
+        ]
+        top_values = np.take_along_axis(similar, top, axis = 1)
+        row, column = np.nonzero(top_values > 0)
+        rows.append(row + start)
+        columns.append(top[row, column])
+        values.append(top_values[row, column])
+    graph = csr_matrix(
+        (np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))),
+        shape = (size, size),
+    )
+    return graph.maximum(graph.T)
+
+
+def _pagerank(graph, damping = 0.85, tolerance = 1e-6, max_iter = 10000):
+    """
+    weighted PageRank using power iteration, same formulation as `networkx.pagerank`,
+    dangling sentences distribute their rank uniformly.
+    """
+    size = graph.shape[0]
+    if not size:
+        return np.zeros(0)
+    degree = np.asarray(graph.sum(axis = 1)).ravel()
+    dangling = degree == 0
+    degree[dangling] = 1
+    if issparse(graph):
+        transition = csr_matrix(graph.multiply(1 / degree[:, None]))
+    else:
+        transition = graph / degree[:, None]
+    transition = transition.T
+    scores = np.full(size, 1 / size)
+    for _ in range(max_iter):
+        last = scores
+        scores = damping * (
+            transition.dot(last) + last[dangling].sum() / size
+        ) + (1 - damping) / size
+        if np.abs(scores - last).sum() < size * tolerance:
+            break
+    return scores
+
+
+def _rank_sentences(
+    vectors,
+    original_strings,
+    top_k,
+    threshold = 0.999,
+    neighbors = None,
+    tolerance = 1e-6,
+):
+    scores = _pagerank(
+        _similarity_graph(vectors, threshold = threshold, neighbors = neighbors),
+        tolerance = tolerance,
+    )
+    ranked_sentences = sorted(
+        ((scores[i], s) for i, s in enumerate(original_strings)), reverse = True
+    )
+    return [r[1] for r in ranked_sentences[:top_k]]
+
+
+def _check_corpus(corpus):
+    if not isinstance(corpus, list) and not isinstance(corpus, str):
+        raise ValueError('corpus must be a list')
+    if isinstance(corpus, list):
+        if not isinstance(corpus[0], str):
+            raise ValueError('corpus must be list of strings')
+
+
+def _split_corpus(corpus):
+    if isinstance(corpus, str):
+        corpus = split_into_sentences(corpus)
+    else:
+        corpus = '. '.join(corpus)
+        corpus = split_into_sentences(corpus)
+    splitted_fullstop = [summary_textcleaning(i) for i in corpus]
+    original_strings = [i[0] for i in splitted_fullstop]
+    cleaned_strings = [i[1] for i in splitted_fullstop]
+    return corpus, original_strings, cleaned_strings
+
+
 class _DEEP_SKIPTHOUGHT:
     def __init__(
-        self, sess, x, logits, attention, dictionary, maxlen, model = None
+        self,
+        sess,
+        x,
+        logits,
+        attention,
+        dictionary,
+        maxlen,
+        model = None,
+        cache_size = 65536,
     ):
         self._sess = sess
         self._X = x
@@ -30,8 +139,58 @@ class _DEEP_SKIPTHOUGHT:
         self._maxlen = maxlen
         self._rev_dictionary = {v: k for k, v in self.dictionary.items()}
         self._model = model
+        self._cache = {}
+        self._cache_size = cache_size
 
-    def vectorize(self, strings):
+    def _encode(self, strings, batch_size = 256, documents = None):
+        """
+        Encode cleaned strings, unique strings are sorted by length and packed into batches
+        of `batch_size`, so the recurrent encoder only runs up to the longest sentence of a batch.
+        Vectors are cached by string. If `documents`, the document index of every string,
+        is not None, also return attention summed per document, cache is not used.
+        """
+        unique, inverse = np.unique(strings, return_inverse = True)
+        inverse = inverse.ravel()
+        unique = [str(string) for string in unique]
+        vectors = [self._cache.get(string) for string in unique]
+        attention = None
+        if documents is None:
+            missing = [i for i, v in enumerate(vectors) if v is None]
+        else:
+            missing = list(range(len(unique)))
+            counts = csr_matrix(
+                (np.ones(len(strings)), (documents, inverse)),
+                shape = (documents.max() + 1, len(unique)),
+            ).tocsc()
+        lengths = [
+            min(len(unique[i].split()), self._maxlen - 2) for i in missing
+        ]
+        missing = [missing[i] for i in np.argsort(lengths, kind = 'stable')]
+        for i in range(0, len(missing), batch_size):
+            batch = missing[i : i + batch_size]
+            sequences = _skip_thought.batch_sequence(
+                [unique[k] for k in batch], self.dictionary, maxlen = self._maxlen
+            )
+            if documents is None:
+                v = self._sess.run(self._logits, feed_dict = {self._X: sequences})
+            else:
+                v, a = self._sess.run(
+                    [self._logits, self._attention],
+                    feed_dict = {self._X: sequences},
+                )
+                a = counts[:, batch].dot(a)
+                attention = a if attention is None else attention + a
+            for k, vector in zip(batch, v):
+                vectors[k] = vector
+                if len(self._cache) >= self._cache_size:
+                    self._cache.pop(next(iter(self._cache)))
+                self._cache[unique[k]] = vector
+        vectors = np.array(vectors)[inverse]
+        if documents is None:
+            return vectors
+        return vectors, attention
+
+    def vectorize(self, strings, batch_size = 256):
 
         """
         Vectorize string inputs using bert attention.
@@ -39,6 +198,8 @@ class _DEEP_SKIPTHOUGHT:
         Parameters
         ----------
         strings : str / list of str
+        batch_size: int, (default=256)
+            number of sentences per batch, sentences are sorted by length before batching.
 
         Returns
         -------
@@ -57,18 +218,98 @@ class _DEEP_SKIPTHOUGHT:
         splitted_fullstop = [summary_textcleaning(i) for i in strings]
         original_strings = [i[0] for i in splitted_fullstop]
         cleaned_strings = [i[1] for i in splitted_fullstop]
-        sequences = _skip_thought.batch_sequence(
-            cleaned_strings, self.dictionary, maxlen = self._maxlen
-        )
-        return self._sess.run(
-            self._logits, feed_dict = {self._X: np.array(sequences)}
-        )
+        return self._encode(cleaned_strings, batch_size = batch_size)
 
 
 class _DEEP_SUMMARIZER:
     def __init__(self, vectorizer):
         self._vectorizer = vectorizer
 
+    def _skipthought_group(self, cleaned, important_words, batch_size):
+        vectorizer = self._vectorizer
+        lengths = [len(c) for c in cleaned]
+        vectors, attention = vectorizer._encode(
+            list(itertools.chain(*cleaned)),
+            batch_size = batch_size,
+            documents = np.repeat(np.arange(len(cleaned)), lengths),
+        )
+        vectors = np.split(vectors, np.cumsum(lengths)[:-1])
+        top_words = []
+        for row in attention:
+            indices = np.argsort(row)[::-1]
+            top_words.append(
+                [
+                    vectorizer._rev_dictionary[i]
+                    for i in indices
+                    if vectorizer._rev_dictionary[i] not in STOPWORDS
+                ][:important_words]
+            )
+        return vectors, top_words
+
+    def _transformer_group(self, corpus, important_words, batch_size, **kwargs):
+        strings = list(itertools.chain(*corpus))
+        vectors, attentions = [], []
+        for i in range(0, len(strings), batch_size):
+            vectors.append(self._vectorizer.vectorize(strings[i : i + batch_size]))
+            attentions.extend(
+                self._vectorizer.attention(strings[i : i + batch_size], **kwargs)
+            )
+        splits = np.cumsum([len(c) for c in corpus])[:-1]
+        vectors = np.split(np.concatenate(vectors), splits)
+        top_words = []
+        for attention in np.split(np.arange(len(strings)), splits):
+            r = {}
+            for f in itertools.chain(*[attentions[i] for i in attention]):
+                c = simple_textcleaning(f[0])
+                if c in STOPWORDS:
+                    continue
+                if c not in r:
+                    r[c] = f[1]
+                else:
+                    r[c] += f[1]
+            top_words.append(
+                sorted(r, key = r.get, reverse = True)[:important_words]
+            )
+        return vectors, top_words
+
+    def _summarize_group(
+        self, group, top_k, important_words, batch_size, **kwargs
+    ):
+        if '_DEEP_SKIPTHOUGHT' in str(self._vectorizer):
+            vectors, top_words = self._skipthought_group(
+                [g[2] for g in group], important_words, batch_size
+            )
+        else:
+            vectors, top_words = self._transformer_group(
+                [g[0] for g in group], important_words, batch_size, **kwargs
+            )
+        for (_, original_strings, _), v, words in zip(group, vectors, top_words):
+            summary = _rank_sentences(
+                v, original_strings, top_k, threshold = 0.99999
+            )
+            yield {
+                'summary': ' '.join(summary),
+                'top-words': words,
+                'cluster-top-words': cluster_words(words),
+            }
+
+    def _summarize_batch(
+        self, corpora, top_k, important_words, batch_size, **kwargs
+    ):
+        group, size = [], 0
+        for corpus in corpora:
+            group.append(_split_corpus(corpus))
+            size += len(group[-1][0])
+            if size >= batch_size:
+                yield from self._summarize_group(
+                    group, top_k, important_words, batch_size, **kwargs
+                )
+                group, size = [], 0
+        if len(group):
+            yield from self._summarize_group(
+                group, top_k, important_words, batch_size, **kwargs
+            )
+
     def summarize(self, corpus, top_k = 3, important_words = 3, **kwargs):
         """
         Summarize list of strings / corpus
@@ -90,71 +331,54 @@ class _DEEP_SUMMARIZER:
             raise ValueError('top_k must be an integer')
         if not isinstance(important_words, int):
             raise ValueError('important_words must be an integer')
-        if not isinstance(corpus, list) and not isinstance(corpus, str):
-            raise ValueError('corpus must be a list')
-        if isinstance(corpus, list):
-            if not isinstance(corpus[0], str):
-                raise ValueError('corpus must be list of strings')
-
-        if isinstance(corpus, str):
-            corpus = split_into_sentences(corpus)
-        else:
-            corpus = '. '.join(corpus)
-            corpus = split_into_sentences(corpus)
-
-        splitted_fullstop = [summary_textcleaning(i) for i in corpus]
-        original_strings = [i[0] for i in splitted_fullstop]
-        cleaned_strings = [i[1] for i in splitted_fullstop]
+        _check_corpus(corpus)
+        group = [_split_corpus(corpus)]
+        return next(
+            self._summarize_group(
+                group, top_k, important_words, len(group[0][0]), **kwargs
+            )
+        )
 
-        if '_DEEP_SKIPTHOUGHT' in str(self._vectorizer):
+    def summarize_batch(
+        self,
+        corpora,
+        top_k = 3,
+        important_words = 3,
+        batch_size = 256,
+        **kwargs,
+    ):
+        """
+        Summarize many corpus, sentences from different corpus are packed into the same
+        encoder batch and results are yielded as soon as a group of corpus is encoded.
 
-            sequences = _skip_thought.batch_sequence(
-                cleaned_strings,
-                self._vectorizer.dictionary,
-                maxlen = self._vectorizer._maxlen,
-            )
-            vectors, attention = self._vectorizer._sess.run(
-                [self._vectorizer._logits, self._vectorizer._attention],
-                feed_dict = {self._vectorizer._X: np.array(sequences)},
-            )
-            attention = attention.sum(axis = 0)
-            indices = np.argsort(attention)[::-1]
-            top_words = [
-                self._vectorizer._rev_dictionary[i]
-                for i in indices
-                if self._vectorizer._rev_dictionary[i] not in STOPWORDS
-            ][:important_words]
+        Parameters
+        ----------
+        corpora: list of str / list of list of str
 
-        else:
-            vectors = self._vectorizer.vectorize(corpus)
-            attentions = self._vectorizer.attention(corpus, **kwargs)
-            flatten = list(itertools.chain(*attentions))
-            r = {}
-            for f in flatten:
-                c = simple_textcleaning(f[0])
-                if c in STOPWORDS:
-                    continue
-                if c not in r:
-                    r[c] = f[1]
-                else:
-                    r[c] += f[1]
-            top_words = sorted(r, key = r.get, reverse = True)[:important_words]
+        top_k: int, (default=3)
+            number of summarized strings.
+        important_words: int, (default=3)
+            number of important words.
+        batch_size: int, (default=256)
+            number of sentences per encoder batch.
 
-        similar = cosine_similarity(vectors, vectors)
-        similar[similar >= 0.99999] = 0
-        nx_graph = nx.from_numpy_array(similar)
-        scores = nx.pagerank(nx_graph, max_iter = 10000)
-        ranked_sentences = sorted(
-            ((scores[i], s) for i, s in enumerate(original_strings)),
-            reverse = True,
+        Returns
+        -------
+        result: generator of dict, same order as corpora
+        """
+        if not isinstance(top_k, int):
+            raise ValueError('top_k must be an integer')
+        if not isinstance(important_words, int):
+            raise ValueError('important_words must be an integer')
+        if not isinstance(batch_size, int):
+            raise ValueError('batch_size must be an integer')
+        if not isinstance(corpora, list):
+            raise ValueError('corpora must be a list')
+        for corpus in corpora:
+            _check_corpus(corpus)
+        return self._summarize_batch(
+            corpora, top_k, important_words, batch_size, **kwargs
         )
-        summary = [r[1] for r in ranked_sentences[:top_k]]
-
-        return {
-            'summary': ' '.join(summary),
-            'top-words': top_words,
-            'cluster-top-words': cluster_words(top_words),
-        }
 
 
 def available_skipthought():
@@ -221,12 +445,20 @@ def _base_summarizer(
     ngram = (1, 3),
     vectorizer = 'bow',
     important_words = 10,
+    neighbors = None,
+    tolerance = 1e-6,
     **kwargs,
 ):
     if not isinstance(vectorizer, str):
         raise ValueError('vectorizer must be a string')
     if not isinstance(top_k, int):
         raise ValueError('top_k must be an integer')
+    if not (neighbors is None or isinstance(neighbors, int)):
+        raise ValueError('neighbors must be an integer or None')
+    if isinstance(neighbors, int) and neighbors < 1:
+        raise ValueError('neighbors must be bigger than 0')
+    if not isinstance(tolerance, float):
+        raise ValueError('tolerance must be a float')
     vectorizer = vectorizer.lower()
     if not vectorizer in ['tfidf', 'bow', 'skip-gram']:
         raise ValueError("vectorizer must be in  ['tfidf', 'bow', 'skip-gram']")
@@ -244,21 +476,9 @@ def _base_summarizer(
         raise ValueError(
             'max_df must be bigger than 0, less than or equal to 1'
         )
-    if not isinstance(corpus, list) and not isinstance(corpus, str):
-        raise ValueError('corpus must be a list')
-    if isinstance(corpus, list):
-        if not isinstance(corpus[0], str):
-            raise ValueError('corpus must be list of strings')
-    if isinstance(corpus, str):
-        corpus = split_into_sentences(corpus)
-    else:
-        corpus = '. '.join(corpus)
-        corpus = split_into_sentences(corpus)
-
-    splitted_fullstop = [summary_textcleaning(i) for i in corpus]
-    original_strings = [i[0] for i in splitted_fullstop]
-    cleaned_strings = [i[1] for i in splitted_fullstop]
-    stemmed = [sastrawi(i) for i in cleaned_strings]
+    _check_corpus(corpus)
+    corpus, original_strings, cleaned_strings = _split_corpus(corpus)
+    stemmed = sastrawi_batch(cleaned_strings)
 
     if vectorizer == 'tfidf':
         Vectorizer = TfidfVectorizer
@@ -283,15 +503,20 @@ def _base_summarizer(
 
     features = tf_vectorizer.get_feature_names()
     top_words = [features[i] for i in indices[:important_words]]
-    vectors = decomposition(tf.shape[1] // 2).fit_transform(tf)
-    similar = cosine_similarity(vectors, vectors)
-    similar[similar >= 0.999] = 0
-    nx_graph = nx.from_numpy_array(similar)
-    scores = nx.pagerank(nx_graph, max_iter = 10000)
-    ranked_sentences = sorted(
-        ((scores[i], s) for i, s in enumerate(original_strings)), reverse = True
+    n_components = max(1, tf.shape[1] // 2)
+    if decomposition is TruncatedSVD:
+        n_components = max(1, min(n_components, tf.shape[0]))
+        decomposition = decomposition(n_components, algorithm = 'randomized')
+    else:
+        decomposition = decomposition(n_components)
+    vectors = decomposition.fit_transform(tf)
+    summary = _rank_sentences(
+        vectors,
+        original_strings,
+        top_k,
+        neighbors = neighbors,
+        tolerance = tolerance,
     )
-    summary = [r[1] for r in ranked_sentences[:top_k]]
     return {
         'summary': ' '.join(summary),
         'top-words': top_words,
@@ -307,6 +532,8 @@ def lda(
     min_df = 2,
     ngram = (1, 3),
     vectorizer = 'bow',
+    neighbors = None,
+    tolerance = 1e-6,
     **kwargs,
 ):
     """
@@ -331,6 +558,11 @@ def lda(
         * ``'bow'`` - Bag of Word.
         * ``'tfidf'`` - Term frequency inverse Document Frequency.
         * ``'skip-gram'`` - Bag of Word with skipping certain n-grams.
+    neighbors: int, (default=None)
+        keep only `neighbors` most similar sentences per sentence in TextRank graph,
+        sparse graph for long documents. If None, use dense graph of all sentences.
+    tolerance: float, (default=1e-6)
+        convergence tolerance of PageRank power iteration.
 
     Returns
     -------
@@ -345,6 +577,8 @@ def lda(
         ngram = ngram,
         vectorizer = vectorizer,
         important_words = important_words,
+        neighbors = neighbors,
+        tolerance = tolerance,
         **kwargs,
     )
 
@@ -357,6 +591,8 @@ def lsa(
     min_df = 2,
     ngram = (1, 3),
     vectorizer = 'bow',
+    neighbors = None,
+    tolerance = 1e-6,
     **kwargs,
 ):
     """
@@ -381,6 +617,11 @@ def lsa(
         * ``'bow'`` - Bag of Word.
         * ``'tfidf'`` - Term frequency inverse Document Frequency.
         * ``'skip-gram'`` - Bag of Word with skipping certain n-grams.
+    neighbors: int, (default=None)
+        keep only `neighbors` most similar sentences per sentence in TextRank graph,
+        sparse graph for long documents. If None, use dense graph of all sentences.
+    tolerance: float, (default=1e-6)
+        convergence tolerance of PageRank power iteration.
 
     Returns
     -------
@@ -395,6 +636,8 @@ def lsa(
         ngram = ngram,
         vectorizer = vectorizer,
         important_words = important_words,
+        neighbors = neighbors,
+        tolerance = tolerance,
         **kwargs,
     )
 
@@ -429,63 +672,88 @@ def doc2vec(vectorizer, corpus, top_k = 3, aggregation = 'mean', soft = True):
         raise ValueError('vectorizer must has `get_vector_by_name` method')
     if not isinstance(top_k, int):
         raise ValueError('top_k must be an integer')
-    if not isinstance(corpus, list) and not isinstance(corpus, str):
-        raise ValueError('corpus must be a list')
-    if isinstance(corpus, list):
-        if not isinstance(corpus[0], str):
-            raise ValueError('corpus must be list of strings')
-    if isinstance(corpus, str):
-        corpus = split_into_sentences(corpus)
-    else:
-        corpus = '. '.join(corpus)
-        corpus = split_into_sentences(corpus)
-    splitted_fullstop = [summary_textcleaning(i) for i in corpus]
-    original_strings = [i[0] for i in splitted_fullstop]
-    cleaned_strings = [i[1] for i in splitted_fullstop]
+    _check_corpus(corpus)
+    corpus, original_strings, cleaned_strings = _split_corpus(corpus)
 
     aggregation = aggregation.lower()
-    if aggregation == 'mean':
-        aggregation_function = np.mean
-    elif aggregation == 'min':
-        aggregation_function = np.min
-    elif aggregation == 'max':
-        aggregation_function = np.max
-    elif aggregation == 'sum':
-        aggregation_function = np.sum
-    elif aggregation == 'sqrt':
-        aggregation_function = np.sqrt
-    else:
+    if aggregation not in ['mean', 'min', 'max', 'sum', 'sqrt']:
         raise ValueError(
             'aggregation only supports `mean`, `min`, `max`, `sum` and `sqrt`'
         )
 
-    vectors = []
-    for string in cleaned_strings:
-        inside = []
-        for token in string.split():
-            try:
-                inside.append(vectorizer.get_vector_by_name(token))
-            except:
-                if not soft:
-                    pass
-                else:
-                    arr = np.array(
-                        [
-                            self._jarowinkler.similarity(token, k)
-                            for k in vectorizer.words
-                        ]
-                    )
-                    idx = (-arr).argsort()[0]
-                    inside.append(
-                        vectorizer.get_vector_by_name(vectorizer.words[idx])
-                    )
-        vectors.append(aggregation_function(inside, axis = 0))
-    similar = cosine_similarity(vectors, vectors)
-    similar[similar >= 0.999] = 0
-    nx_graph = nx.from_numpy_array(similar)
-    scores = nx.pagerank(nx_graph, max_iter = 10000)
-    ranked_sentences = sorted(
-        ((scores[i], s) for i, s in enumerate(original_strings)), reverse = True
+    vectors = bag_of_vectors(
+        vectorizer,
+        [string.split() for string in cleaned_strings],
+        aggregation = aggregation,
+        soft = soft,
     )
-    summary = [r[1] for r in ranked_sentences[:top_k]]
+    summary = _rank_sentences(vectors, original_strings, top_k)
     return ' '.join(summary)
+
+
+class _FUNCTION_SUMMARIZER:
+    def __init__(self, function, kwargs):
+        self._function = function
+        self._kwargs = kwargs
+
+    def summarize(self, corpus):
+        return self._function(corpus, **self._kwargs)
+
+
+def summarize_batch(
+    corpora, model = 'lsa', cores = None, chunksize = 1, **kwargs
+):
+    """
+    Summarize many corpus, results are streamed back in the same order as corpora.
+
+    Parameters
+    ----------
+    corpora: list of str / list of list of str
+    model: str / object, (default='lsa')
+        summarizer. Allowed values:
+
+        * ``'lsa'`` - `malaya.summarize.lsa`, corpus are summarized on a pool of processes.
+        * ``'lda'`` - `malaya.summarize.lda`, corpus are summarized on a pool of processes.
+        * fast-text or word2vec interface object - `malaya.summarize.doc2vec`, corpus are summarized in the calling process,
+          the vectorizer holds a tensorflow session so it is never sent to other processes.
+        * `malaya.summarize._DEEP_SUMMARIZER` - sentences from many corpus are packed into the same encoder batch.
+    cores: int, (default=None)
+        number of processes, if None, will use all available cpus. Ignored for doc2vec.
+    chunksize: int, (default=1)
+        number of corpus sent to a process at once.
+    **kwargs:
+        keyword parameters for the summarizer, example, `top_k`.
+
+    Returns
+    -------
+    result: generator of results, same order as corpora
+    """
+    if not isinstance(corpora, list):
+        raise ValueError('corpora must be a list')
+    if cores is not None and not isinstance(cores, int):
+        raise ValueError('cores must be an integer')
+    if not isinstance(chunksize, int):
+        raise ValueError('chunksize must be an integer')
+    if hasattr(model, 'summarize_batch'):
+        return model.summarize_batch(corpora, **kwargs)
+    if isinstance(model, str):
+        model = model.lower()
+        if model not in ['lsa', 'lda']:
+            raise ValueError("model must be in ['lsa', 'lda']")
+        function = lsa if model == 'lsa' else lda
+    elif hasattr(model, 'get_vector_by_name'):
+        function = partial(doc2vec, model)
+        cores = 1
+    else:
+        raise ValueError(
+            'model must be a string, has `get_vector_by_name` or `summarize_batch` method'
+        )
+    for corpus in corpora:
+        _check_corpus(corpus)
+    return multiprocessing_imap(
+        _FUNCTION_SUMMARIZER(function, kwargs),
+        'summarize',
+        corpora,
+        cores = cores,
+        chunksize = chunksize,
+    )
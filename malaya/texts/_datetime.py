@@ -0,0 +1,165 @@
+import re
+import dateparser
+from datetime import datetime, timedelta
+from dateutil.relativedelta import relativedelta
+from functools import lru_cache
+
+_months = {
+    'januari': 1,
+    'jan': 1,
+    'februari': 2,
+    'feb': 2,
+    'mac': 3,
+    'march': 3,
+    'april': 4,
+    'apr': 4,
+    'mei': 5,
+    'may': 5,
+    'jun': 6,
+    'june': 6,
+    'julai': 7,
+    'jul': 7,
+    'july': 7,
+    'ogos': 8,
+    'aug': 8,
+    'august': 8,
+    'september': 9,
+    'sep': 9,
+    'sept': 9,
+    'oktober': 10,
+    'okt': 10,
+    'oct': 10,
+    'october': 10,
+    'november': 11,
+    'nov': 11,
+    'disember': 12,
+    'dis': 12,
+    'dec': 12,
+    'december': 12,
+}
+_units = {
+    'saat': 'seconds',
+    'minit': 'minutes',
+    'jam': 'hours',
+    'hari': 'days',
+    'minggu': 'weeks',
+    'bulan': 'months',
+    'tahun': 'years',
+}
+_days = {'semalam': -1, 'sekarang': 0, 'esok': 1}
+
+_short_date = r'(?P<a>\d{1,2})(?P<sep>[\/\-\.])(?P<b>\d{1,2})(?P=sep)(?P<year>\d{4})'
+_full_date = r'(?P<day>\d{1,2}) (?P<month>%s) (?P<fyear>\d{4})' % '|'.join(
+    sorted(_months, key = len, reverse = True)
+)
+_time = r'(?P<hour>\d{1,2})(?::(?P<minute>\d{1,2})(?::(?P<second>\d{1,2}))?)?(?: ?(?P<ampm>am|pm|a\.m\.|p\.m\.))?'
+
+_date_regex = re.compile(r'^(?:%s|%s)$' % (_short_date, _full_date))
+_time_regex = re.compile(r'^%s$' % _time)
+_relative_regex = re.compile(
+    r'^(?:dalam (?P<future>\d+) ?(?P<future_unit>%s)|(?P<past>\d+) (?P<past_unit>%s) lalu)$'
+    % ('|'.join(_units), '|'.join(_units))
+)
+
+
+def _parse_date(string):
+    m = _date_regex.match(string)
+    if not m:
+        return
+    if m.group('year'):
+        a, b, year = int(m.group('a')), int(m.group('b')), int(m.group('year'))
+        month, day = (a, b) if a <= 12 else (b, a)
+    else:
+        day = int(m.group('day'))
+        month = _months[m.group('month')]
+        year = int(m.group('fyear'))
+    if not (1 <= month <= 12 and 1 <= day <= 31):
+        return
+    return year, month, day
+
+
+def _parse_time(string):
+    m = _time_regex.match(string)
+    if not m:
+        return
+    hour = int(m.group('hour'))
+    minute = int(m.group('minute') or 0)
+    second = int(m.group('second') or 0)
+    ampm = m.group('ampm')
+    if not ampm and m.group('minute') is None:
+        return
+    if ampm:
+        if not 1 <= hour <= 12:
+            return
+        hour = hour % 12 + (12 if ampm[0] == 'p' else 0)
+    if hour > 23 or minute > 59 or second > 59:
+        return
+    return hour, minute, second
+
+
+@lru_cache(maxsize = 65536)
+def _parse_spec(string):
+    """
+    parse a string into a spec independent of current time, cached.
+    returns None if the string is not a format supported by the fast path.
+    """
+    date = _parse_date(string)
+    if date:
+        return 'date', date, None
+
+    time = _parse_time(string)
+    if time:
+        return 'day', 0, time
+
+    if string in _days:
+        return 'now', _days[string], None
+
+    m = _relative_regex.match(string)
+    if m:
+        if m.group('future'):
+            return 'relative', int(m.group('future')), m.group('future_unit')
+        return 'relative', -int(m.group('past')), m.group('past_unit')
+
+    words = string.split()
+    for i in range(1, len(words)):
+        left, right = ' '.join(words[:i]), ' '.join(words[i:])
+        for date, time in ((left, right), (right, left)):
+            time = _parse_time(time)
+            if not time:
+                continue
+            if date in _days:
+                return 'day', _days[date], time
+            date = _parse_date(date)
+            if date:
+                return 'date', date, time
+
+
+def parse(string):
+    """
+    parse Malay date / time strings recognized by Malaya regexes, and fallback to dateparser.parse.
+
+    Parameters
+    ----------
+    string : str
+
+    Returns
+    -------
+    result: datetime.datetime or None
+    """
+    spec = _parse_spec(string.lower())
+    if spec is None:
+        return dateparser.parse(string)
+    kind, value, extra = spec
+    if kind == 'date':
+        try:
+            return datetime(*value, *(extra or ()))
+        except ValueError:
+            return None
+    now = datetime.now()
+    if kind == 'now':
+        return now + timedelta(days = value)
+    if kind == 'relative':
+        return now + relativedelta(**{_units[extra]: value})
+    return datetime(now.year, now.month, now.day, *extra) + timedelta(
+        days = value
+    )
@@ -1,6 +1,6 @@
-import dateparser
 import re
 from ._text_functions import multireplace
+from ._datetime import parse as parse_datetime
 from ._tatabahasa import date_replace
 from ._regex import (
     _money,
@@ -76,7 +76,7 @@ class _Entity_regex:
         )
         dates_ = [multireplace(s, date_replace) for s in dates_]
         dates_ = [re.sub(r'[ ]+', ' ', s).strip() for s in dates_]
-        dates_ = {s: dateparser.parse(s) for s in dates_}
+        dates_ = {s: parse_datetime(s) for s in dates_}
         money_ = {s[0]: s[1] for s in money_}
         temperature_ = re.findall(_temperature, string)
         temperature_ = [re.sub(r'[ ]+', ' ', s).strip() for s in temperature_]
@@ -103,7 +103,7 @@ class _Entity_regex:
 
         time_ = [multireplace(s, date_replace) for s in time_]
         time_ = [re.sub(r'[ ]+', ' ', s).strip() for s in time_]
-        time_ = {s: dateparser.parse(s) for s in time_}
+        time_ = {s: parse_datetime(s) for s in time_}
 
         left_datetime_ = [
             '%s %s' % (i[0], i[1]) for i in re.findall(_left_datetime, string)
@@ -147,7 +147,7 @@ class _Entity_regex:
             + right_yesterdaydatetodaytime_
         )
         datetime_ = [re.sub(r'[ ]+', ' ', s).strip() for s in datetime_]
-        datetime_ = {s: dateparser.parse(s) for s in datetime_}
+        datetime_ = {s: parse_datetime(s) for s in datetime_}
 
         foods_ = re.findall(total_foods_regex, string)
         foods_ = [re.sub(r'[ ]+', ' ', s).strip() for s in foods_]
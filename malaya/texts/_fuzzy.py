@@ -0,0 +1,64 @@
+import numpy as np
+from functools import lru_cache
+from ._jarowrinkler import JaroWinkler
+
+
+def _ngrams(word, n = 2):
+    word = '^%s$' % (word)
+    return {word[i : i + n] for i in range(len(word) - n + 1)}
+
+
+class _FuzzyIndex:
+    """
+    Character n-gram inverted index over a vocabulary, a query only scores with Jaro-Winkler
+    the words sharing the most n-grams instead of the whole vocabulary.
+    """
+
+    def __init__(self, words, ngram = 2, shortlist = 256, cache_size = 65536):
+        self._words = words
+        self._ngram = ngram
+        self._shortlist = shortlist
+        self._jarowinkler = JaroWinkler()
+        postings = {}
+        for no, word in enumerate(words):
+            for gram in _ngrams(word, ngram):
+                postings.setdefault(gram, []).append(no)
+        self._postings = {
+            gram: np.array(ids, dtype = np.int32)
+            for gram, ids in postings.items()
+        }
+        self.nearest = lru_cache(maxsize = cache_size)(self._nearest)
+
+    def _candidates(self, word):
+        ids = [
+            self._postings[gram]
+            for gram in _ngrams(word, self._ngram)
+            if gram in self._postings
+        ]
+        if not len(ids):
+            return np.arange(len(self._words))
+        counts = np.bincount(np.concatenate(ids), minlength = len(self._words))
+        candidates = np.nonzero(counts)[0]
+        if len(candidates) > self._shortlist:
+            top = np.argpartition(-counts[candidates], self._shortlist - 1)
+            candidates = np.sort(candidates[top[: self._shortlist]])
+        return candidates
+
+    def _nearest(self, word, n = 1):
+        candidates = self._candidates(word)
+        scores = self._jarowinkler.similarity_batch(
+            word, [self._words[i] for i in candidates]
+        )
+        order = np.argsort(-scores, kind = 'stable')[:n]
+        return tuple(self._words[candidates[i]] for i in order)
+
+
+def fuzzy_index(vectorizer):
+    """
+    return fuzzy index over `vectorizer.words`, built once and attached to the vectorizer.
+    """
+    index = getattr(vectorizer, '_fuzzy_index', None)
+    if index is None:
+        index = _FuzzyIndex(vectorizer.words)
+        vectorizer._fuzzy_index = index
+    return index
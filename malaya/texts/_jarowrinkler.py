@@ -18,6 +18,28 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import numpy as np
+
+
+def _encode(strings, pad):
+    lengths = np.array([len(s) for s in strings], dtype = np.int64)
+    codes = np.full(
+        (len(strings), max(lengths.max(initial = 0), 1)), pad, dtype = np.int32
+    )
+    buffer = np.frombuffer(
+        ''.join(strings).encode('utf-32-le'), dtype = np.uint32
+    )
+    rows = np.repeat(np.arange(len(strings)), lengths)
+    starts = np.repeat(np.cumsum(lengths) - lengths, lengths)
+    codes[rows, np.arange(len(buffer)) - starts] = buffer
+    return codes, lengths
+
+
+def _pad(codes, width, pad):
+    return np.pad(
+        codes, ((0, 0), (0, width - codes.shape[1])), constant_values = pad
+    )
+
 
 class StringDistance:
     def distance(self, s0, s1):
@@ -73,6 +95,113 @@ class JaroWinkler(NormalizedStringSimilarity, NormalizedStringDistance):
     def distance(self, s0, s1):
         return 1.0 - self.similarity(s0, s1)
 
+    def similarity_batch(self, s0, strings):
+        """
+        similarity of a string against list of strings, identical to `similarity`.
+        """
+        if not len(strings):
+            return np.zeros(0)
+        codes0, len0 = _encode([s0], -1)
+        codes1, len1 = _encode(strings, -2)
+        return self._similarity_codes(
+            np.repeat(codes0, len(strings), axis = 0),
+            np.repeat(len0, len(strings)),
+            codes1,
+            len1,
+        )
+
+    def similarity_matrix(self, left_strings, right_strings):
+        """
+        similarity of every left string against every right string, returns [len(left), len(right)].
+        """
+        results = np.zeros((len(left_strings), len(right_strings)))
+        if not len(right_strings):
+            return results
+        codes1, len1 = _encode(right_strings, -2)
+        for no, s0 in enumerate(left_strings):
+            codes0, len0 = _encode([s0], -1)
+            results[no] = self._similarity_codes(
+                np.repeat(codes0, len(right_strings), axis = 0),
+                np.repeat(len0, len(right_strings)),
+                codes1,
+                len1,
+            )
+        return results
+
+    def similarity_pairs(self, left_strings, right_strings):
+        """
+        vectorized `similarity` over aligned pairs of strings.
+        """
+        if not len(left_strings):
+            return np.zeros(0)
+        codes0, len0 = _encode(left_strings, -1)
+        codes1, len1 = _encode(right_strings, -2)
+        return self._similarity_codes(codes0, len0, codes1, len1)
+
+    def _similarity_codes(self, codes0, len0, codes1, len1):
+        """
+        strings are encoded into padded code point arrays and matched position by position,
+        looping over positions instead of pairs.
+        """
+        width = max(codes0.shape[1], codes1.shape[1])
+        codes0 = _pad(codes0, width, -1)
+        codes1 = _pad(codes1, width, -2)
+        swap = len0 > len1
+        max_codes = np.where(swap[:, None], codes0, codes1)
+        min_codes = np.where(swap[:, None], codes1, codes0)
+        max_len = np.maximum(len0, len1)
+        min_len = np.minimum(len0, len1)
+        ran = np.maximum(max_len // 2 - 1, 0)
+        max_ran = ran.max()
+        rows = np.arange(len(codes0))
+
+        # position-major layout, so every step below reads contiguous rows.
+        max_t = np.ascontiguousarray(max_codes.T)
+        min_t = np.ascontiguousarray(min_codes.T)
+        free = np.arange(width)[:, None] < max_len[None]
+        match_flags = np.zeros((width, len(rows)), dtype = bool)
+        min_matched = np.zeros((width, len(rows)), dtype = bool)
+        for mi in range(min_len.max()):
+            searching = mi < min_len
+            for xi in range(max(mi - max_ran, 0), min(mi + max_ran + 1, width)):
+                matched = searching & free[xi] & (max_t[xi] == min_t[mi])
+                if abs(xi - mi) > ran.min():
+                    matched &= abs(xi - mi) <= ran
+                match_flags[xi] |= matched
+                free[xi] &= ~matched
+                min_matched[mi] |= matched
+                searching &= ~matched
+        match_flags = match_flags.T
+        min_matched = min_matched.T
+        matches = min_matched.sum(axis = 1)
+
+        order0 = np.argsort(~min_matched, axis = 1, kind = 'stable')
+        order1 = np.argsort(~match_flags, axis = 1, kind = 'stable')
+        ms0 = min_codes[rows[:, None], order0]
+        ms1 = max_codes[rows[:, None], order1]
+        in_match = np.arange(width)[None] < matches[:, None]
+        transpositions = ((ms0 != ms1) & in_match).sum(axis = 1) // 2
+
+        equal = codes0 == codes1
+        in_min = np.arange(width)[None] < min_len[:, None]
+        prefix = np.cumprod(equal & in_min, axis = 1).sum(axis = 1)
+        identical = (len0 == len1) & (equal | ~in_min).all(axis = 1)
+
+        with np.errstate(divide = 'ignore', invalid = 'ignore'):
+            j = (
+                matches / len0
+                + matches / len1
+                + (matches - transpositions) / matches
+            ) / self.three
+            jw = np.where(
+                j > self.get_threshold(),
+                j
+                + np.minimum(self.jw_coef, 1.0 / max_len) * prefix * (1 - j),
+                j,
+            )
+        jw = np.where(matches == 0, 0.0, jw)
+        return np.where(identical, 1.0, jw)
+
     @staticmethod
     def matches(s0, s1):
         if len(s0) > len(s1):
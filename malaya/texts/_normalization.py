@@ -13,6 +13,14 @@ from ._tatabahasa import (
 ignore_words = ['ringgit', 'sen']
 ignore_postfix = ['adalah']
 
+_number_regex = re.compile('^\d+?\.\d+?$')
+_alphabet_regex = re.compile('.*[A-Za-z]+.*')
+_float_regex = re.compile('.+\..*')
+_decimal_regex = re.compile('\..*')
+_digits_regex = re.compile('^[0-9]+$')
+_roman_regex = re.compile('.*(V|X|I|L|D)')
+_ke_regex = re.compile('^ke.*')
+
 
 def _remove_postfix(word):
     if word in ignore_postfix:
@@ -41,7 +49,7 @@ def _normalize_money(
 
 
 def _is_number_regex(s):
-    if re.match('^\d+?\.\d+?$', s) is None:
+    if _number_regex.match(s) is None:
         return s.isdigit()
     return True
 
@@ -55,13 +63,13 @@ def _string_to_num(word):
 
 def cardinal(x):
     try:
-        if re.match('.*[A-Za-z]+.*', x):
+        if _alphabet_regex.match(x):
             return x
         x = re.sub(',', '', x, count = 10)
 
-        if re.match('.+\..*', x):
+        if _float_regex.match(x):
             x = to_cardinal(float(x))
-        elif re.match('\..*', x):
+        elif _decimal_regex.match(x):
             x = to_cardinal(float(x))
         else:
             x = to_cardinal(int(x))
@@ -137,12 +145,12 @@ def ordinal(x):
         result_string = ''
         x = x.replace(',', '')
         x = x.replace('[\.]$', '')
-        if re.match('^[0-9]+$', x):
+        if _digits_regex.match(x):
             x = to_ordinal(int(x))
             return x
-        if re.match('.*(V|X|I|L|D)', x):
+        if _roman_regex.match(x):
             x = x.replace('-', '')
-            if re.match('^ke.*', x):
+            if _ke_regex.match(x):
                 x = x[2:]
                 x = rom_to_int(x)
                 result_string = to_ordinal(x)
@@ -150,7 +158,7 @@ def ordinal(x):
                 x = rom_to_int(x)
                 result_string = to_ordinal(x)
                 result_string = 'yang ' + result_string
-        elif re.match('^ke.*', x):
+        elif _ke_regex.match(x):
             x = x.replace('-', '')
             x = x[2:]
             result_string = to_ordinal(int(x))
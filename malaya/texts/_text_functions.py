@@ -3,6 +3,7 @@ import os
 import numpy as np
 import itertools
 import collections
+from functools import lru_cache
 from unidecode import unidecode
 from .._utils._utils import download_file
 from ._tatabahasa import stopword_tatabahasa, stopwords, stopwords_calon
@@ -83,6 +84,96 @@ _list_laughing = {
 }
 
 
+_links_regex = re.compile('http\S+|www.\S+')
+_spaces_regex = re.compile(r'[ ]+')
+_alphabet_regex = re.compile('[^A-Za-z ]+')
+_entities_regex = re.compile('[^A-Za-z0-9\-() ]+')
+_summary_regex = re.compile('[^A-Za-z0-9\-\/\'"\.\, ]+')
+_language_detection_regex = re.compile(
+    u'[0-9!@#$%^&*()_\-+{}|\~`\'";:?/.>,<]', flags = re.UNICODE
+)
+
+
+@lru_cache(maxsize = 65536)
+def _unidecode_char(char):
+    return unidecode(char)
+
+
+def _unidecode(string):
+    """
+    unidecode with ASCII fast path, non-ASCII characters are cached.
+    """
+    try:
+        string.encode('ascii')
+        return string
+    except UnicodeEncodeError:
+        return ''.join([_unidecode_char(c) for c in string])
+
+
+def _remove_alias(string):
+    return ' '.join(
+        [i for i in string.split() if i.find('#') < 0 and i.find('@') < 0]
+    )
+
+
+_cleaning_steps = {
+    'remove_alias': _remove_alias,
+    'remove_links': lambda string: _links_regex.sub('', string),
+    'unidecode': _unidecode,
+    'split_punctuation': lambda string: string.replace('.', ' . ').replace(
+        ',', ' , '
+    ),
+    'alphabet': lambda string: _alphabet_regex.sub(' ', string),
+    'entities': lambda string: _entities_regex.sub(' ', string),
+    'summary': lambda string: _summary_regex.sub(' ', string),
+    'language_detection': lambda string: _language_detection_regex.sub(
+        ' ', string
+    ),
+    'lower': str.lower,
+    'spaces': lambda string: _spaces_regex.sub(' ', string).strip(),
+}
+
+
+class _TextCleaning:
+    """
+    Apply a declarative list of precompiled cleaning steps, check `_cleaning_steps` for supported steps.
+    """
+
+    def __init__(self, steps):
+        self._steps = [_cleaning_steps[step] for step in steps]
+
+    def __call__(self, string):
+        for step in self._steps:
+            string = step(string)
+        return string
+
+    def batch(self, strings):
+        """
+        Clean list of strings, duplicate strings only cleaned once.
+        """
+        cleaned = {s: self(s) for s in set(strings)}
+        return [cleaned[s] for s in strings]
+
+
+_classification_cleaning = _TextCleaning(
+    [
+        'remove_alias',
+        'remove_links',
+        'unidecode',
+        'split_punctuation',
+        'alphabet',
+        'spaces',
+    ]
+)
+_simple_cleaning = _TextCleaning(['unidecode', 'alphabet', 'lower', 'spaces'])
+_simple_cleaning_cased = _TextCleaning(['unidecode', 'alphabet', 'spaces'])
+_entities_cleaning = _TextCleaning(['entities', 'spaces'])
+_summary_cleaning = _TextCleaning(['unidecode', 'summary', 'lower', 'spaces'])
+_language_detection_cleaning = _TextCleaning(
+    ['lower', 'language_detection', 'spaces']
+)
+
+
 def remove_links_alias(string):
     string = unidecode(string)
     string = re.sub(
@@ -171,17 +262,22 @@ def simple_textcleaning(string, lowering = True):
     use by topic modelling
     only accept A-Z, a-z
     """
-    string = unidecode(string)
-    string = re.sub('[^A-Za-z ]+', ' ', string)
-    return re.sub(r'[ ]+', ' ', string.lower() if lowering else string).strip()
+    if lowering:
+        return _simple_cleaning(string)
+    return _simple_cleaning_cased(string)
+
+
+def simple_textcleaning_batch(strings, lowering = True):
+    if lowering:
+        return _simple_cleaning.batch(strings)
+    return _simple_cleaning_cased.batch(strings)
 
 
 def entities_textcleaning(string, lowering = True):
     """
     use by entities recognition, pos recognition and dependency parsing
     """
-    string = re.sub('[^A-Za-z0-9\-() ]+', ' ', string)
-    string = re.sub(r'[ ]+', ' ', string).strip()
+    string = _entities_cleaning(string)
     original_string = string.split()
     if lowering:
         string = string.lower()
@@ -194,9 +290,7 @@ def entities_textcleaning(string, lowering = True):
 
 
 def summary_textcleaning(string):
-    original_string = string
-    string = re.sub('[^A-Za-z0-9\-\/\'"\.\, ]+', ' ', unidecode(string))
-    return original_string, re.sub(r'[ ]+', ' ', string.lower()).strip()
+    return string, _summary_cleaning(string)
 
 
 def get_hashtags(string):
@@ -214,13 +308,11 @@ def split_by_dot(string):
 
 
 def language_detection_textcleaning(string):
-    string = re.sub(
-        u'[0-9!@#$%^&*()_\-+{}|\~`\'";:?/.>,<]',
-        ' ',
-        string.lower(),
-        flags = re.UNICODE,
-    )
-    return re.sub(r'[ ]+', ' ', string).strip()
+    return _language_detection_cleaning(string)
+
+
+def language_detection_textcleaning_batch(strings):
+    return _language_detection_cleaning.batch(strings)
 
 
 def pos_entities_textcleaning(string):
@@ -252,44 +344,29 @@ def classification_textcleaning(string, no_stopwords = False, lowering = True):
     stemmer, summarization, topic-modelling
     remove links, hashtags, alias
     """
-    string = re.sub(
-        'http\S+|www.\S+',
-        '',
-        ' '.join(
-            [i for i in string.split() if i.find('#') < 0 and i.find('@') < 0]
-        ),
-    )
-    string = unidecode(string).replace('.', ' . ').replace(',', ' , ')
-    string = re.sub('[^A-Za-z ]+', ' ', string)
-    string = re.sub(r'[ ]+', ' ', string).strip()
-    if no_stopwords:
-        string = ' '.join(
-            [
-                i
-                for i in re.findall('[\\w\']+|[;:\-\(\)&.,!?"]', string)
-                if len(i)
-            ]
-        )
-    else:
-        string = ' '.join(
-            [
-                i
-                for i in re.findall('[\\w\']+|[;:\-\(\)&.,!?"]', string)
-                if len(i) and i not in STOPWORDS
-            ]
-        )
+    string = _classification_cleaning(string).split()
+    if not no_stopwords:
+        string = [i for i in string if i not in STOPWORDS]
     if lowering:
-        return string.lower()
+        return ' '.join(string).lower()
     else:
         return ' '.join(
-            [
-                word.title() if word.isupper() else word
-                for word in string.split()
-                if len(word)
-            ]
+            [word.title() if word.isupper() else word for word in string]
         )
 
 
+def classification_textcleaning_batch(
+    strings, no_stopwords = False, lowering = True
+):
+    cleaned = {
+        s: classification_textcleaning(
+            s, no_stopwords = no_stopwords, lowering = lowering
+        )
+        for s in set(strings)
+    }
+    return [cleaned[s] for s in strings]
+
+
 def separate_dataset(trainset):
     datastring = []
     datatarget = []
@@ -540,53 +617,80 @@ def _truncate_seq_pair(tokens_a, tokens_b, max_length):
             tokens_b.pop()
 
 
-def bert_tokenization_siamese(
+def _bert_siamese_sequences(
     tokenizer, left, right, cls = '[CLS]', sep = '[SEP]'
 ):
-    input_ids, input_masks, segment_ids = [], [], []
-    a, b = [], []
-    for i in range(len(left)):
-        tokens_a = tokenizer.tokenize(left[i])
-        tokens_b = tokenizer.tokenize(right[i])
-        a.append(tokens_a)
-        b.append(tokens_b)
+    """
+    unpadded BERT siamese sequences, every unique string is only tokenized once.
+    """
+    cache = {}
 
+    def tokenize(string):
+        if string not in cache:
+            cache[string] = tokenizer.tokenize(string)
+        return list(cache[string])
+
+    a = [tokenize(string) for string in left]
+    b = [tokenize(string) for string in right]
+
+    input_ids, input_masks, segment_ids = [], [], []
     maxlen = max([len(i) for i in a] + [len(i) for i in b]) + 5
     for i in range(len(left)):
         tokens_a = a[i]
         tokens_b = b[i]
         _truncate_seq_pair(tokens_a, tokens_b, maxlen - 3)
 
-        tokens = []
-        segment_id = []
-        tokens.append(cls)
-        segment_id.append(0)
-        for token in tokens_a:
-            tokens.append(token)
-            segment_id.append(0)
-
-        tokens.append(sep)
-        segment_id.append(0)
-        for token in tokens_b:
-            tokens.append(token)
-            segment_id.append(1)
-        tokens.append(sep)
-        segment_id.append(1)
+        tokens = [cls] + tokens_a + [sep] + tokens_b + [sep]
+        segment_id = [0] * (len(tokens_a) + 2) + [1] * (len(tokens_b) + 1)
         input_id = tokenizer.convert_tokens_to_ids(tokens)
-        input_mask = [1] * len(input_id)
-
-        while len(input_id) < maxlen:
-            input_id.append(0)
-            input_mask.append(0)
-            segment_id.append(0)
-
         input_ids.append(input_id)
-        input_masks.append(input_mask)
+        input_masks.append([1] * len(input_id))
         segment_ids.append(segment_id)
 
+    return input_ids, input_masks, segment_ids, maxlen
+
+
+def bert_tokenization_siamese(
+    tokenizer, left, right, cls = '[CLS]', sep = '[SEP]'
+):
+    input_ids, input_masks, segment_ids, maxlen = _bert_siamese_sequences(
+        tokenizer, left, right, cls = cls, sep = sep
+    )
+    input_ids = padding_sequence(input_ids, maxlen)
+    input_masks = padding_sequence(input_masks, maxlen)
+    segment_ids = padding_sequence(segment_ids, maxlen)
     return input_ids, input_masks, segment_ids
 
 
+def siamese_batches(sequences, pad_ints, batch_size = 32):
+    """
+    bucket pairs by length and pad every chunk to its own longest pair.
+
+    Parameters
+    ----------
+    sequences : tuple of list of list of int
+        input ids, input masks and segment ids.
+    pad_ints : tuple of int
+        pad value for each sequence.
+    batch_size : int, (default=32)
+
+    Returns
+    -------
+    result: generator of (indices, padded sequences), indices are positions in the original order.
+    """
+    lengths = [len(i) for i in sequences[0]]
+    order = np.argsort(lengths, kind = 'stable')
+    for i in range(0, len(order), batch_size):
+        indices = order[i : i + batch_size]
+        maxlen = max([lengths[k] for k in indices])
+        yield indices, [
+            padding_sequence(
+                [sequence[k] for k in indices], maxlen, pad_int = pad
+            )
+            for sequence, pad in zip(sequences, pad_ints)
+        ]
+
+
 SEG_ID_A = 0
 SEG_ID_B = 1
 SEG_ID_CLS = 2
@@ -617,11 +721,21 @@ def tokenize_fn(text, sp_model):
     return encode_ids(sp_model, text)
 
 
-def xlnet_tokenization_siamese(tokenizer, left, right):
+def _xlnet_siamese_sequences(tokenizer, left, right):
+    """
+    unpadded XLNET siamese sequences, every unique string is only tokenized once.
+    """
+    cache = {}
+
+    def tokenize(string):
+        if string not in cache:
+            cache[string] = tokenize_fn(remove_links_alias(string), tokenizer)
+        return list(cache[string])
+
     input_ids, input_mask, all_seg_ids = [], [], []
     for i in range(len(left)):
-        tokens = tokenize_fn(remove_links_alias(left[i]), tokenizer)
-        tokens_right = tokenize_fn(remove_links_alias(right[i]), tokenizer)
+        tokens = tokenize(left[i])
+        tokens_right = tokenize(right[i])
         segment_ids = [SEG_ID_A] * len(tokens)
         tokens.append(SEP_ID)
         segment_ids.append(SEG_ID_A)
@@ -634,14 +748,17 @@ def xlnet_tokenization_siamese(tokenizer, left, right):
         tokens.append(CLS_ID)
         segment_ids.append(SEG_ID_CLS)
 
-        cur_input_ids = tokens
-        cur_input_mask = [0] * len(cur_input_ids)
-        assert len(tokens) == len(cur_input_mask)
-        assert len(tokens) == len(segment_ids)
         input_ids.append(tokens)
-        input_mask.append(cur_input_mask)
+        input_mask.append([0] * len(tokens))
         all_seg_ids.append(segment_ids)
 
+    return input_ids, input_mask, all_seg_ids
+
+
+def xlnet_tokenization_siamese(tokenizer, left, right):
+    input_ids, input_mask, all_seg_ids = _xlnet_siamese_sequences(
+        tokenizer, left, right
+    )
     maxlen = max([len(i) for i in input_ids])
     input_ids = padding_sequence(input_ids, maxlen)
     input_mask = padding_sequence(input_mask, maxlen, pad_int = 1)
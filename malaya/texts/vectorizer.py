@@ -6,6 +6,7 @@ if not sys.warnoptions:
 
 from itertools import combinations
 import random
+import numpy as np
 from sklearn.feature_extraction.text import CountVectorizer
 
 
@@ -119,3 +120,73 @@ def skipgrams(
         random.shuffle(labels)
 
     return couples, labels
+
+
+def skipgram_pairs(
+    sequences,
+    vocabulary_size,
+    window_size = 4,
+    negative_samples = 0.0,
+    seed = None,
+):
+    """
+    Vectorized `skipgrams` over many sequences at once, index 0 is treated as padding.
+
+    Parameters
+    ----------
+    sequences: list of list of int / list of numpy array
+    vocabulary_size: int
+    window_size: int, (default=4)
+    negative_samples: float, (default=0.0)
+        ratio of negative pairs to positive pairs, negative target is drawn uniformly from 1 to vocabulary_size - 1.
+    seed: int, (default=None)
+
+    Returns
+    -------
+    result: tuple of numpy arrays, (pivots, targets, sequence indices, labels)
+    """
+    lengths = np.array([len(sequence) for sequence in sequences])
+    if lengths.sum():
+        tokens = np.concatenate(
+            [np.asarray(sequence, dtype = np.int64) for sequence in sequences]
+        )
+    else:
+        tokens = np.zeros(0, dtype = np.int64)
+    documents = np.repeat(np.arange(len(sequences)), lengths)
+    pivots, targets, owners = [], [], []
+    for offset in range(-window_size, window_size + 1):
+        if offset == 0 or abs(offset) >= len(tokens):
+            continue
+        left = np.arange(max(0, -offset), len(tokens) - max(0, offset))
+        right = left + offset
+        valid = (
+            (documents[left] == documents[right])
+            & (tokens[left] != 0)
+            & (tokens[right] != 0)
+        )
+        pivots.append(tokens[left[valid]])
+        targets.append(tokens[right[valid]])
+        owners.append(documents[left[valid]])
+    if len(pivots):
+        pivots = np.concatenate(pivots)
+        targets = np.concatenate(targets)
+        owners = np.concatenate(owners)
+    else:
+        pivots = np.zeros(0, dtype = np.int64)
+        targets = np.zeros(0, dtype = np.int64)
+        owners = np.zeros(0, dtype = np.int64)
+    labels = np.ones(len(pivots), dtype = np.int64)
+
+    num_negative_samples = int(len(pivots) * negative_samples)
+    if num_negative_samples and len(pivots):
+        rng = np.random.RandomState(seed)
+        picked = rng.randint(0, len(pivots), num_negative_samples)
+        pivots = np.concatenate([pivots, pivots[picked]])
+        targets = np.concatenate(
+            [targets, rng.randint(1, vocabulary_size, num_negative_samples)]
+        )
+        owners = np.concatenate([owners, owners[picked]])
+        labels = np.concatenate(
+            [labels, np.zeros(num_negative_samples, dtype = np.int64)]
+        )
+    return pivots, targets, owners, labels
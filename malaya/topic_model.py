@@ -1,19 +1,24 @@
 import numpy as np
 import collections
+import itertools
 from sklearn.utils import shuffle
 from sklearn.feature_extraction.text import TfidfVectorizer, CountVectorizer
 from sklearn.decomposition import TruncatedSVD, NMF, LatentDirichletAllocation
-from .stem import sastrawi
+
+try:
+    from sklearn.decomposition import MiniBatchNMF
+except ImportError:
+    MiniBatchNMF = None
+from .stem import sastrawi, _stem_batch
 from ._models._lda2vec import LDA2VEC
 from .texts._text_functions import (
     simple_textcleaning,
     STOPWORDS,
-    classification_textcleaning,
+    classification_textcleaning_batch,
     print_topics_modelling,
     build_dataset,
 )
-from .texts.vectorizer import skipgrams, SkipGramVectorizer
-from .generator import ngrams as ngrams_generator
+from .texts.vectorizer import skipgram_pairs, SkipGramVectorizer
 
 
 def _softmax(x):
@@ -273,9 +278,31 @@ class _DEEP_TOPIC:
         return [self._corpus[i] for i in reverse_sorted[:len_sentence]]
 
 
+def _preprocess(corpus, cleaning, stemming):
+    if cleaning is not None:
+        corpus = [cleaning(string) for string in corpus]
+    if stemming is not None:
+        corpus = _stem_batch(list(corpus), stemming)
+    return list(corpus)
+
+
+def _feature_names(vectorizer):
+    if hasattr(vectorizer, 'get_feature_names_out'):
+        return vectorizer.get_feature_names_out().tolist()
+    return vectorizer.get_feature_names()
+
+
 class _TOPIC:
     def __init__(
-        self, features, comp, corpus, transformed, vectorizer, vectors
+        self,
+        features,
+        comp,
+        corpus,
+        transformed,
+        vectorizer,
+        vectors,
+        cleaning = None,
+        stemming = None,
     ):
         self.features = features
         self.comp = comp
@@ -283,6 +310,27 @@ class _TOPIC:
         self.transformed = transformed
         self.vectorizer = vectorizer
         self._vectors = vectors
+        self._cleaning = cleaning
+        self._stemming = stemming
+
+    def transform(self, strings):
+        """
+        Transform new strings into topic distribution without refitting.
+
+        Parameters
+        ----------
+        strings: list of str
+
+        Returns
+        -------
+        result: numpy array, [len(strings), n_topics]
+        """
+        if not isinstance(strings, list):
+            raise ValueError('strings must be a list')
+        if not isinstance(strings[0], str):
+            raise ValueError('strings must be list of strings')
+        strings = _preprocess(strings, self._cleaning, self._stemming)
+        return self.comp.transform(self.vectorizer.transform(strings))
 
     def visualize_topics(self, notebook_mode = False, mds = 'pcoa'):
         """
@@ -391,6 +439,65 @@ class _TOPIC:
         return [self.corpus[i] for i in reverse_sorted[:len_sentence]]
 
 
+class _STREAM_TOPIC(_TOPIC):
+    def __init__(
+        self, comp, vectorizer, cleaning = None, stemming = None, chunk_size = 1024
+    ):
+        _TOPIC.__init__(
+            self,
+            None,
+            comp,
+            None,
+            None,
+            vectorizer,
+            None,
+            cleaning = cleaning,
+            stemming = stemming,
+        )
+        self._chunk_size = chunk_size
+        self._fitted = False
+        self.n_documents = 0
+
+    def partial_fit(self, documents):
+        """
+        Update topic model using an iterable of strings, consumed `chunk_size` strings at a time.
+        Vocabulary is learnt from the first chunk and fixed after that.
+
+        Parameters
+        ----------
+        documents: iterable of str
+
+        Returns
+        -------
+        self: malaya.topic_model._STREAM_TOPIC class
+        """
+        documents = iter(documents)
+        while True:
+            chunk = list(itertools.islice(documents, self._chunk_size))
+            if not len(chunk):
+                break
+            chunk = _preprocess(chunk, self._cleaning, self._stemming)
+            if not self._fitted:
+                vectors = self.vectorizer.fit_transform(chunk)
+                self.features = _feature_names(self.vectorizer)
+                self._fitted = True
+            else:
+                vectors = self.vectorizer.transform(chunk)
+            self.comp.partial_fit(vectors)
+            self.n_documents += len(chunk)
+        return self
+
+    def visualize_topics(self, notebook_mode = False, mds = 'pcoa'):
+        raise ValueError(
+            'streaming topic model does not keep the corpus, visualize_topics is not supported'
+        )
+
+    def get_sentences(self, len_sentence, k = 0):
+        raise ValueError(
+            'streaming topic model does not keep the corpus, use `transform` instead'
+        )
+
+
 def _base_topic_modelling(
     corpus,
     n_topics,
@@ -444,12 +551,7 @@ def _base_topic_modelling(
             'length corpus must be bigger than or equal to n_topics'
         )
 
-    if cleaning is not None:
-        for i in range(len(corpus)):
-            corpus[i] = cleaning(corpus[i])
-    if stemming is not None:
-        for i in range(len(corpus)):
-            corpus[i] = stemming(corpus[i])
+    corpus = _preprocess(corpus, cleaning, stemming)
     if vectorizer == 'tfidf':
         Vectorizer = TfidfVectorizer
     elif vectorizer == 'bow':
@@ -471,10 +573,12 @@ def _base_topic_modelling(
     return _TOPIC(
         tf_features,
         compose,
-        [classification_textcleaning(c) for c in corpus],
+        classification_textcleaning_batch(corpus),
         compose.transform(tf),
         tf_vectorizer,
         tf,
+        cleaning = cleaning,
+        stemming = stemming,
     )
 
 
@@ -658,6 +762,119 @@ def lsa(
     )
 
 
+def stream(
+    documents,
+    n_topics = 10,
+    decomposition = 'lda',
+    chunk_size = 1024,
+    max_df = 0.95,
+    min_df = 2,
+    ngram = (1, 3),
+    stemming = sastrawi,
+    vectorizer = 'bow',
+    cleaning = simple_textcleaning,
+    stop_words = None,
+    **kwargs,
+):
+    """
+    Train a topic model on an iterable of strings in chunks, without keeping the corpus in memory.
+    Vocabulary is learnt from the first chunk, so `max_df` and `min_df` apply on the first chunk,
+    or pass `vocabulary` to use a fixed vocabulary. Call `partial_fit` on the returned object to keep updating.
+
+    Parameters
+    ----------
+    documents: iterable of str
+    n_topics: int, (default=10)
+        size of decomposition column.
+    decomposition: str, (default='lda')
+        online decomposition. Allowed values:
+
+        * ``'lda'`` - Latent Dirichlet Allocation with online variational Bayes.
+        * ``'nmf'`` - Mini-batch Non-negative Matrix Factorization, requires scikit-learn >= 1.1.
+    chunk_size: int, (default=1024)
+        number of strings per update.
+    max_df: float, (default=0.95)
+        maximum of a word selected based on document frequency.
+    min_df: int, (default=2)
+        minimum of a word selected on based on document frequency.
+    ngram: tuple, (default=(1,3))
+        n-grams size to train a corpus.
+    stemming: function, (default=sastrawi)
+        function to stem the corpus.
+    vectorizer: str, (default='bow')
+        vectorizer technique. Allowed values:
+
+        * ``'bow'`` - Bag of Word.
+        * ``'tfidf'`` - Term frequency inverse Document Frequency.
+        * ``'skip-gram'`` - Bag of Word with skipping certain n-grams.
+    cleaning: function, (default=simple_textcleaning)
+        function to clean the corpus.
+    stop_words: list, (default=None)
+        list of stop words to remove. If None, default is malaya.texts._text_functions.STOPWORDS
+
+    Returns
+    -------
+    _STREAM_TOPIC: malaya.topic_model._STREAM_TOPIC class
+    """
+    if not isinstance(n_topics, int):
+        raise ValueError('n_topics must be an integer')
+    if not isinstance(chunk_size, int):
+        raise ValueError('chunk_size must be an integer')
+    if chunk_size < n_topics:
+        raise ValueError('chunk_size must be bigger than or equal to n_topics')
+    if not isinstance(decomposition, str):
+        raise ValueError('decomposition must be a string')
+    if not isinstance(vectorizer, str):
+        raise ValueError('vectorizer must be a string')
+    if not isinstance(ngram, tuple):
+        raise ValueError('ngram must be a tuple')
+    if not len(ngram) == 2:
+        raise ValueError('ngram size must equal to 2')
+    if not isinstance(min_df, int):
+        raise ValueError('min_df must be an integer')
+    if not (isinstance(max_df, int) or isinstance(max_df, float)):
+        raise ValueError('max_df must be an integer or a float')
+    decomposition = decomposition.lower()
+    if decomposition == 'lda':
+        comp = LatentDirichletAllocation(
+            n_topics, learning_method = 'online', batch_size = chunk_size
+        )
+    elif decomposition == 'nmf':
+        if MiniBatchNMF is None:
+            raise ValueError(
+                "decomposition 'nmf' requires scikit-learn >= 1.1 for MiniBatchNMF"
+            )
+        comp = MiniBatchNMF(n_topics, batch_size = chunk_size)
+    else:
+        raise ValueError("decomposition must be in ['lda', 'nmf']")
+    vectorizer = vectorizer.lower()
+    if vectorizer == 'tfidf':
+        Vectorizer = TfidfVectorizer
+    elif vectorizer == 'bow':
+        Vectorizer = CountVectorizer
+    elif vectorizer == 'skip-gram':
+        Vectorizer = SkipGramVectorizer
+    else:
+        raise ValueError("vectorizer must be in  ['tfidf', 'bow', 'skip-gram']")
+    if stop_words is None:
+        stop_words = STOPWORDS
+    tf_vectorizer = Vectorizer(
+        max_df = max_df,
+        min_df = min_df,
+        ngram_range = ngram,
+        stop_words = stop_words,
+        **kwargs,
+    )
+    model = _STREAM_TOPIC(
+        comp,
+        tf_vectorizer,
+        cleaning = cleaning,
+        stemming = stemming,
+        chunk_size = chunk_size,
+    )
+    return model.partial_fit(documents)
+
+
 def lda2vec(
     corpus,
     n_topics,
@@ -709,6 +926,8 @@ def lda2vec(
         * ``'skip-gram'`` - Bag of Word with skipping certain n-grams.
     skip: int, (default=5)
         skip value if vectorizer = 'skip-gram'
+    **kwargs:
+        keyword parameters for malaya._models._lda2vec.LDA2VEC, example, `batch_size`, `num_threads` and `prefetch`.
 
     Returns
     -------
@@ -777,47 +996,29 @@ def lda2vec(
     if stop_words is None:
         stop_words = STOPWORDS
 
-    if cleaning is not None:
-        for i in range(len(corpus)):
-            corpus[i] = cleaning(corpus[i])
-    if stemming is not None:
-        for i in range(len(corpus)):
-            corpus[i] = stemming(corpus[i])
+    corpus = _preprocess(corpus, cleaning, stemming)
     text_clean = []
     for text in corpus:
         text_clean.append(
             ' '.join([word for word in text.split() if word not in stop_words])
         )
     tf_vectorizer.fit(text_clean)
-    idx_text_clean, len_idx_text_clean = [], []
     transformed_text_clean = tf_vectorizer.transform(text_clean)
-    for text in transformed_text_clean:
-        splitted = text.nonzero()[1]
-        idx_text_clean.append(splitted)
-        len_idx_text_clean.append(len(splitted))
+    transformed_text_clean.sort_indices()
+    idx_text_clean = np.split(
+        transformed_text_clean.indices, transformed_text_clean.indptr[1:-1]
+    )
+    len_idx_text_clean = np.diff(transformed_text_clean.indptr).tolist()
     dictionary = {
         i: no for no, i in enumerate(tf_vectorizer.get_feature_names())
     }
     reversed_dictionary = {
         no: i for no, i in enumerate(tf_vectorizer.get_feature_names())
     }
-    freqs = transformed_text_clean.toarray().sum(axis = 0).tolist()
-    doc_ids = np.arange(len(idx_text_clean))
-    num_unique_documents = doc_ids.max()
-    pivot_words, target_words, doc_ids = [], [], []
-    for i, t in enumerate(idx_text_clean):
-        pairs, _ = skipgrams(
-            t,
-            vocabulary_size = len(dictionary),
-            window_size = window_size,
-            shuffle = True,
-            negative_samples = 0,
-        )
-        for pair in pairs:
-            temp_data = pair
-            pivot_words.append(temp_data[0])
-            target_words.append(temp_data[1])
-            doc_ids.append(i)
+    freqs = np.asarray(transformed_text_clean.sum(axis = 0)).ravel().tolist()
+    pivot_words, target_words, doc_ids, _ = skipgram_pairs(
+        idx_text_clean, len(dictionary), window_size = window_size
+    )
     pivot_words, target_words, doc_ids = shuffle(
         pivot_words, target_words, doc_ids, random_state = 10
     )
@@ -844,6 +1045,29 @@ def lda2vec(
     )
 
 
+def _attention_ngrams(attention, stop_words, ngram, feature_index):
+    """
+    n-grams of a string attention after removing stop words, return feature ids and
+    summed mean attention of every n-gram. New n-grams are added into feature_index.
+    """
+    attention = [a for a in attention if a[0] not in stop_words]
+    words = [a[0] for a in attention]
+    cumsum = np.concatenate([[0.0], np.cumsum([a[1] for a in attention])])
+    ids, scores = [], []
+    for n in range(ngram[0], min(ngram[-1], len(words)) + 1):
+        for i in range(len(words) - n + 1):
+            ids.append(
+                feature_index.setdefault(
+                    ' '.join(words[i : i + n]), len(feature_index)
+                )
+            )
+        scores.append((cumsum[n:] - cumsum[:-n]) / n)
+    if not len(ids):
+        return np.zeros(0, dtype = np.int64), np.zeros(0)
+    unique, inverse = np.unique(ids, return_inverse = True)
+    return unique, np.bincount(inverse, weights = np.concatenate(scores))
+
+
 def attention(
     corpus,
     n_topics,
@@ -853,6 +1077,7 @@ def attention(
     stop_words = None,
     ngram = (1, 3),
     batch_size = 10,
+    minibatch = False,
 ):
 
     """
@@ -873,7 +1098,9 @@ def attention(
     ngram: tuple, (default=(1,3))
         n-grams size to train a corpus.
     batch_size: int, (default=10)
-        size of strings for each vectorization and attention.
+        size of strings for each vectorization and attention, strings are sorted by length before batching.
+    minibatch: bool, (default=False)
+        if True, cluster using MiniBatchKMeans instead of KMeans, faster for large corpus.
 
     Returns
     -------
@@ -888,6 +1115,8 @@ def attention(
         raise ValueError('n_topics must be an integer')
     if not isinstance(batch_size, int):
         raise ValueError('batch_size must be an integer')
+    if not isinstance(minibatch, bool):
+        raise ValueError('minibatch must be a boolean')
     if not isinstance(ngram, tuple):
         raise ValueError('ngram must be a tuple')
     if not len(ngram) == 2:
@@ -913,53 +1142,39 @@ def attention(
             'length corpus must be bigger than or equal to n_topics'
         )
 
-    from sklearn.cluster import KMeans
+    from sklearn.cluster import KMeans, MiniBatchKMeans
 
     if stop_words is None:
         stop_words = STOPWORDS
 
-    if cleaning is not None:
-        for i in range(len(corpus)):
-            corpus[i] = cleaning(corpus[i])
-    if stemming is not None:
-        for i in range(len(corpus)):
-            corpus[i] = stemming(corpus[i])
-
-    def generate_ngram(seq, ngram = (1, 3)):
-        g = []
-        for i in range(ngram[0], ngram[-1] + 1):
-            g.extend(list(ngrams_generator(seq, i)))
-        return g
-
-    rows, attentions = [], []
-    for i in range(0, len(corpus), batch_size):
-        index = min(i + batch_size, len(corpus))
-        rows.append(vectorizer.vectorize(corpus[i:index]))
-        attentions.extend(vectorizer.attention(corpus[i:index]))
-
-    concat = np.concatenate(rows, axis = 0)
-    kmeans = KMeans(n_clusters = n_topics, random_state = 0).fit(concat)
-    labels = kmeans.labels_
-
-    overall, filtered_a = [], []
-    for a in attentions:
-        f = [i for i in a if i[0] not in stop_words]
-        overall.extend(f)
-        filtered_a.append(f)
-
-    o_ngram = generate_ngram(overall, ngram)
-    features = []
-    for i in o_ngram:
-        features.append(' '.join([w[0] for w in i]))
-    features = list(set(features))
-
-    components = np.zeros((n_topics, len(features)))
-    for no, i in enumerate(labels):
-        f = generate_ngram(filtered_a[no], ngram)
-        for w in f:
-            word = ' '.join([r[0] for r in w])
-            score = np.mean([r[1] for r in w])
-            if word in features:
-                components[i, features.index(word)] += score
-
+    corpus = _preprocess(corpus, cleaning, stemming)
+    order = np.argsort([len(string.split()) for string in corpus], kind = 'stable')
+    vectors, feature_index = None, {}
+    documents, ids, scores = [], [], []
+    for i in range(0, len(order), batch_size):
+        index = order[i : i + batch_size]
+        batch = [corpus[k] for k in index]
+        v = vectorizer.vectorize(batch)
+        if vectors is None:
+            vectors = np.zeros((len(corpus), v.shape[1]), dtype = v.dtype)
+        vectors[index] = v
+        for k, a in zip(index, vectorizer.attention(batch)):
+            f, s = _attention_ngrams(a, stop_words, ngram, feature_index)
+            documents.append(np.full(len(f), k))
+            ids.append(f)
+            scores.append(s)
+
+    if minibatch:
+        clustering = MiniBatchKMeans(n_clusters = n_topics, random_state = 0)
+    else:
+        clustering = KMeans(n_clusters = n_topics, random_state = 0)
+    labels = clustering.fit(vectors).labels_
+    documents = np.concatenate(documents).astype(np.int64)
+    components = np.zeros((n_topics, len(feature_index)))
+    np.add.at(
+        components,
+        (labels[documents], np.concatenate(ids).astype(np.int64)),
+        np.concatenate(scores),
+    )
+    features = list(feature_index)
     return _ATTENTION_TOPIC(features, components)
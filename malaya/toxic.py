@@ -72,12 +72,16 @@ def multinomial(validate = True):
         raise Exception(
             "model corrupted due to some reasons, please run malaya.clear_cache('toxic/multinomial') and try again"
         )
-    from .stem import _classification_textcleaning_stemmer
+    from .stem import (
+        _classification_textcleaning_stemmer,
+        _classification_textcleaning_stemmer_batch,
+    )
 
     return MULTILABEL_BAYES(
         models = multinomial,
         vectors = vectorize,
         cleaning = _classification_textcleaning_stemmer,
+        cleaning_batch = _classification_textcleaning_stemmer_batch,
     )
 
 
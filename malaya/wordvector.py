@@ -1,9 +1,10 @@
 import pickle
 import os
+import json
+import hashlib
 import numpy as np
-from .texts._jarowrinkler import JaroWinkler
+from .texts._fuzzy import fuzzy_index
 from scipy.spatial.distance import cdist
-from sklearn.neighbors import NearestNeighbors
 import tensorflow as tf
 from . import home
 from ._utils._utils import download_file, _Calculator
@@ -55,7 +56,7 @@ def load_news(size = 256):
         return pickle.load(fopen)
 
 
-def load(embed_matrix, dictionary):
+def load(embed_matrix, dictionary, dtype = 'float32'):
 
     """
     Return malaya.wordvector._wordvector object.
@@ -64,36 +65,357 @@ def load(embed_matrix, dictionary):
     ----------
     embed_matrix: numpy array
     dictionary: dictionary
+    dtype: str, (default='float32')
+        storage precision of nearest-neighbour index. Allowed values:
+
+        * ``'float32'`` - full precision.
+        * ``'float16'`` - half precision, half memory.
+        * ``'int8'`` - scalar quantized with per-row scales, quarter memory.
 
     Returns
     -------
     _wordvector: malaya.wordvector._wordvector object
     """
+    if not isinstance(dtype, str):
+        raise ValueError('dtype must be a string')
+    if dtype not in _index_dtypes:
+        raise ValueError(
+            'dtype only supports `float32`, `float16` and `int8`'
+        )
+
+    return _wordvector(
+        embed_matrix = embed_matrix, dictionary = dictionary, dtype = dtype
+    )
+
 
-    return _wordvector(embed_matrix = embed_matrix, dictionary = dictionary)
+def _l2_normalize(matrix):
+    matrix = np.asarray(matrix, dtype = np.float32)
+    norm = np.sqrt(
+        np.maximum(np.square(matrix).sum(axis = 1, keepdims = True), 1e-12)
+    )
+    return matrix / norm
+
+
+_index_dtypes = ['float32', 'float16', 'int8']
+
+
+class _CosineIndex:
+    """
+    Cosine top-k index over an embedding matrix with per-row scales, similarity of a row
+    is `dot(query, row) * scale`. float32 keeps the embedding matrix as is with inverse
+    norms as scales, float16 keeps normalized rows, int8 keeps normalized rows scalar
+    quantized with per-row scales. Quantized indexes keep row norms to dequantize rows.
+    Queries are scored against vocabulary blocks while keeping a running top-k, so peak
+    memory is batch x block instead of batch x vocabulary.
+    """
+
+    def __init__(self, matrix, scales = None, norms = None, vocabulary = None):
+        self._matrix = matrix
+        self._scales = scales
+        self._norms = norms
+        self.vocabulary = vocabulary
+
+    @property
+    def dtype(self):
+        return self._matrix.dtype.name
+
+    @property
+    def shape(self):
+        return self._matrix.shape
+
+    @classmethod
+    def build(cls, embed_matrix, dtype = 'float32', block_size = 65536):
+        matrix = np.asarray(embed_matrix, dtype = np.float32)
+        norms = np.einsum('ij,ij->i', matrix, matrix)
+        norms = np.sqrt(np.maximum(norms, 1e-12)).astype(np.float32)
+        if dtype == 'float32':
+            return cls(matrix, 1 / norms)
+        scales = None
+        if dtype == 'int8':
+            scales = np.maximum(matrix.max(axis = 1), -matrix.min(axis = 1))
+            scales = (scales / norms / 127).astype(np.float32)
+            scales[scales == 0] = 1
+        quantized = np.empty(matrix.shape, dtype = dtype)
+        for start in range(0, len(matrix), block_size):
+            end = start + block_size
+            block = matrix[start:end] / norms[start:end, None]
+            if scales is not None:
+                block = np.round(block / scales[start:end, None])
+            quantized[start:end] = block
+        return cls(quantized, scales, norms)
+
+    @staticmethod
+    def _scales_path(path):
+        return '%s-scales.npy' % (os.path.splitext(path)[0])
+
+    @staticmethod
+    def _norms_path(path):
+        return '%s-norms.npy' % (os.path.splitext(path)[0])
+
+    @staticmethod
+    def _info_path(path):
+        return '%s.json' % (os.path.splitext(path)[0])
+
+    @classmethod
+    def load(cls, path):
+        scales, norms, vocabulary = None, None, None
+        if os.path.isfile(cls._scales_path(path)):
+            scales = np.load(cls._scales_path(path))
+        if os.path.isfile(cls._norms_path(path)):
+            norms = np.load(cls._norms_path(path))
+        if os.path.isfile(cls._info_path(path)):
+            with open(cls._info_path(path)) as fopen:
+                vocabulary = json.load(fopen)['vocabulary']
+        matrix = np.load(path, mmap_mode = 'r')
+        return cls(matrix, scales, norms, vocabulary)
+
+    def save(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok = True)
+        np.save(path, self._matrix)
+        for array, array_path in [
+            (self._scales, self._scales_path(path)),
+            (self._norms, self._norms_path(path)),
+        ]:
+            if array is not None:
+                np.save(array_path, array)
+            elif os.path.isfile(array_path):
+                os.remove(array_path)
+        with open(self._info_path(path), 'w') as fopen:
+            json.dump(
+                {
+                    'shape': list(self.shape),
+                    'dtype': self.dtype,
+                    'vocabulary': self.vocabulary,
+                },
+                fopen,
+            )
+
+    def vectors(self, rows):
+        """
+        return float32 embedding rows, dequantized on demand for float16 and int8.
+        """
+        vectors = np.asarray(self._matrix[rows], dtype = np.float32)
+        if self._norms is None:
+            return vectors
+        scales = self._norms[rows]
+        if self._scales is not None:
+            scales = scales * self._scales[rows]
+        return vectors * np.expand_dims(scales, -1)
+
+    def normed(self):
+        """
+        return dequantized float32 normalized matrix.
+        """
+        normed = np.asarray(self._matrix, dtype = np.float32)
+        if self._scales is not None:
+            normed = normed * self._scales[:, None]
+        return normed
+
+    def _block_similarities(self, vectors, start, end):
+        block = np.asarray(self._matrix[start:end], dtype = np.float32)
+        similarities = vectors.dot(block.T)
+        if self._scales is not None:
+            similarities *= self._scales[start:end]
+        return similarities
+
+    def top_k(self, vectors, k, batch_size = 256, block_size = 65536):
+        vectors = _l2_normalize(vectors.reshape((-1, self._matrix.shape[1])))
+        size = self._matrix.shape[0]
+        k = min(k, size)
+        indices, values = [], []
+        for i in range(0, len(vectors), batch_size):
+            batch = vectors[i : i + batch_size]
+            best_idx = np.zeros((len(batch), 0), dtype = np.int64)
+            best_val = np.zeros((len(batch), 0), dtype = np.float32)
+            for start in range(0, size, block_size):
+                similarities = self._block_similarities(
+                    batch, start, start + block_size
+                )
+                kk = min(k, similarities.shape[1])
+                idx = np.argpartition(-similarities, kk - 1, axis = 1)[:, :kk]
+                best_val = np.concatenate(
+                    [best_val, np.take_along_axis(similarities, idx, axis = 1)],
+                    axis = 1,
+                )
+                best_idx = np.concatenate([best_idx, idx + start], axis = 1)
+                if best_idx.shape[1] > k:
+                    idx = np.argpartition(-best_val, k - 1, axis = 1)[:, :k]
+                    best_val = np.take_along_axis(best_val, idx, axis = 1)
+                    best_idx = np.take_along_axis(best_idx, idx, axis = 1)
+            order = np.lexsort((best_idx, -best_val), axis = 1)
+            indices.append(np.take_along_axis(best_idx, order, axis = 1))
+            values.append(np.take_along_axis(best_val, order, axis = 1))
+        return np.concatenate(indices), np.concatenate(values)
 
 
 class _wordvector:
-    def __init__(self, embed_matrix, dictionary):
+    def __init__(self, embed_matrix, dictionary, dtype = 'float32'):
         self._embed_matrix = embed_matrix
+        self._shape = embed_matrix.shape
+        self._dtype = dtype
+        self._index = None
         self._dictionary = dictionary
         self._reverse_dictionary = {v: k for k, v in dictionary.items()}
         self.words = list(dictionary.keys())
-        self._jarowinkler = JaroWinkler()
-        _graph = tf.Graph()
-        with _graph.as_default():
-            self._embedding = tf.placeholder(
-                tf.float32, self._embed_matrix.shape
+        self._graph = tf.Graph()
+        with self._graph.as_default():
+            self._embedding = tf.placeholder(tf.float32, self._shape)
+            self._scales = tf.placeholder(tf.float32, [self._shape[0]])
+            self._embedding_variable = tf.Variable(
+                self._embedding, trainable = False
             )
-            self._x = tf.placeholder(
-                tf.float32, [None, self._embed_matrix.shape[1]]
+            self._scales_variable = tf.Variable(
+                self._scales, trainable = False
             )
-            normed_embedding = tf.nn.l2_normalize(self._embedding, axis = 1)
+            self._x = tf.placeholder(tf.float32, [None, self._shape[1]])
             normed_array = tf.nn.l2_normalize(self._x, axis = 1)
-            self._cosine_similarity = tf.matmul(
-                normed_array, tf.transpose(normed_embedding, [1, 0])
+            self._cosine_similarity = (
+                tf.matmul(
+                    normed_array, self._embedding_variable, transpose_b = True
+                )
+                * self._scales_variable
             )
             self._sess = tf.InteractiveSession()
+        self._embedding_initialized = False
+        self._top_k = {}
+
+    def _vocabulary(self):
+        words = sorted(self._dictionary, key = self._dictionary.get)
+        return hashlib.sha1('\n'.join(words).encode('utf-8')).hexdigest()
+
+    def build_index(self, path = None, overwrite = False):
+        """
+        build cosine nearest-neighbour index shared by n_closest, calculator and analogy,
+        stored using `dtype` given to `load`.
+        The index is built lazily on first query if this method is not called.
+        For `float16` and `int8`, the embedding matrix is released after the index built,
+        vectors are dequantized from the index on demand.
+
+        Parameters
+        ----------
+        path: str, (default=None)
+            if not None, load the index from this path if exists, else build and save into it.
+            Eg, malaya.home + '/word2vec-256/index.npy'
+        overwrite: bool, (default=False)
+            if True, rebuild the index and overwrite existing index in `path`.
+        """
+        if path is not None and not isinstance(path, str):
+            raise ValueError('path must be a string')
+        if not isinstance(overwrite, bool):
+            raise ValueError('overwrite must be a boolean')
+        vocabulary = self._vocabulary()
+        if path is not None and os.path.isfile(path) and not overwrite:
+            index = _CosineIndex.load(path)
+            if index.shape != self._shape:
+                raise ValueError(
+                    'index in %s has shape %s, not match with embedding shape %s, set `overwrite = True` to rebuild'
+                    % (path, index.shape, self._shape)
+                )
+            if index.vocabulary is None:
+                raise ValueError(
+                    'index in %s saved without vocabulary checksum, set `overwrite = True` to rebuild'
+                    % (path)
+                )
+            if index.vocabulary != vocabulary:
+                raise ValueError(
+                    'index in %s built from another vocabulary, set `overwrite = True` to rebuild'
+                    % (path)
+                )
+            if index.dtype != self._dtype:
+                raise ValueError(
+                    'index in %s stored as %s, not %s, set `overwrite = True` to rebuild'
+                    % (path, index.dtype, self._dtype)
+                )
+        else:
+            if self._embed_matrix is None:
+                raise ValueError(
+                    'embedding matrix released after quantized, load the word vector again to rebuild the index'
+                )
+            index = _CosineIndex.build(self._embed_matrix, self._dtype)
+            index.vocabulary = vocabulary
+            if path is not None:
+                index.save(path)
+        self._index = index
+        self._embedding_initialized = False
+        if index.dtype != 'float32':
+            self._embed_matrix = None
+
+    def index_recall(
+        self, num_closest = 10, samples = 1000, embed_matrix = None
+    ):
+        """
+        recall@k of nearest-neighbour index against full precision search,
+        useful to validate `float16` or `int8` index.
+
+        Parameters
+        ----------
+        num_closest: int, (default=10)
+            k in recall@k.
+        samples: int, (default=1000)
+            number of words sampled as queries.
+        embed_matrix: numpy array, (default=None)
+            full precision embedding matrix, required for `float16` and `int8` index
+            because the embedding matrix is released after quantized.
+
+        Returns
+        -------
+        recall: float
+        """
+        if not isinstance(num_closest, int):
+            raise ValueError('num_closest must be an integer')
+        if not isinstance(samples, int):
+            raise ValueError('samples must be an integer')
+        if embed_matrix is None:
+            embed_matrix = self._embed_matrix
+        if self._index is None:
+            self.build_index()
+        if embed_matrix is None:
+            raise ValueError(
+                'embed_matrix must not be None for %s index' % (self._dtype)
+            )
+        if embed_matrix.shape != self._shape:
+            raise ValueError('embed_matrix shape must be %s' % (self._shape,))
+        rows = np.random.choice(
+            self._shape[0], min(samples, self._shape[0]), replace = False
+        )
+        vectors = np.asarray(embed_matrix[rows])
+        # blocked exact scoring on the full precision matrix, shares its buffer.
+        exact = _CosineIndex.build(embed_matrix).top_k(vectors, num_closest)[0]
+        approximate = self._index.top_k(vectors, num_closest)[0]
+        found = [
+            len(np.intersect1d(exact[i], approximate[i]))
+            for i in range(len(rows))
+        ]
+        return np.sum(found) / exact.size
+
+    def _vectors(self, rows):
+        if self._embed_matrix is not None:
+            return self._embed_matrix[rows]
+        return self._index.vectors(rows)
+
+    def _nearest(self, vectors, num, metric, block_size = 65536):
+        vectors = np.asarray(vectors).reshape((-1, self._shape[1]))
+        if metric == 'cosine':
+            if self._index is None:
+                self.build_index()
+            return self._index.top_k(vectors, num)
+        best_idx = np.zeros((len(vectors), 0), dtype = np.int64)
+        best_dist = np.zeros((len(vectors), 0))
+        for start in range(0, self._shape[0], block_size):
+            block = self._vectors(slice(start, start + block_size))
+            distances = cdist(vectors, block, metric = metric)
+            idx = np.argsort(distances, axis = 1, kind = 'stable')[:, :num]
+            best_dist = np.concatenate(
+                [best_dist, np.take_along_axis(distances, idx, axis = 1)],
+                axis = 1,
+            )
+            best_idx = np.concatenate([best_idx, idx + start], axis = 1)
+            order = np.argsort(best_dist, axis = 1, kind = 'stable')[:, :num]
+            best_dist = np.take_along_axis(best_dist, order, axis = 1)
+            best_idx = np.take_along_axis(best_idx, order, axis = 1)
+        return best_idx, 1 - best_dist
 
     def get_vector_by_name(self, word):
         """
@@ -110,16 +432,12 @@ class _wordvector:
         if not isinstance(word, str):
             raise ValueError('input must be a string')
         if word not in self._dictionary:
-            arr = np.array(
-                [self._jarowinkler.similarity(word, k) for k in self.words]
-            )
-            idx = (-arr).argsort()[:5]
-            strings = ', '.join([self.words[i] for i in idx])
+            strings = ', '.join(fuzzy_index(self).nearest(word, 5))
             raise Exception(
                 'input not found in dictionary, here top-5 nearest words [%s]'
                 % (strings)
             )
-        return self._embed_matrix[self._dictionary[word]]
+        return self._vectors(self._dictionary[word])
 
     def tree_plot(self, labels, figsize = (7, 7), annotate = True):
         """
@@ -159,7 +477,7 @@ class _wordvector:
         idx = [
             self.words.index(e[0] if isinstance(e, list) else e) for e in labels
         ]
-        embed = self._embed_matrix[idx]
+        embed = self._vectors(idx)
         embed = embed.dot(embed.T)
         embed = (embed - embed.min()) / (embed.max() - embed.min())
         labelled = []
@@ -237,7 +555,7 @@ class _wordvector:
             cp_idx.extend(np.arange(i - plus_minus, i).tolist())
             cp_idx.extend(np.arange(i, i + plus_minus).tolist())
         tsne = TSNE(n_components = 2, random_state = 0).fit_transform(
-            self._embed_matrix[cp_idx]
+            self._vectors(cp_idx)
         )
 
         plt.figure(figsize = figsize)
@@ -286,53 +604,57 @@ class _wordvector:
                 temp += char
             else:
                 if len(temp):
-                    row = self._dictionary[
-                        self.words[
-                            np.argmax(
-                                [
-                                    self._jarowinkler.similarity(temp, k)
-                                    for k in self.words
-                                ]
-                            )
-                        ]
-                    ]
+                    row = self._dictionary[fuzzy_index(self).nearest(temp)[0]]
                     tokens.append(
-                        ','.join(
-                            self._embed_matrix[row, :].astype('str').tolist()
-                        )
+                        ','.join(self._vectors(row).astype('str').tolist())
                     )
                     temp = ''
                 tokens.append(char)
         if len(temp):
-            row = self._dictionary[
-                self.words[
-                    np.argmax(
-                        [
-                            self._jarowinkler.similarity(temp, k)
-                            for k in self.words
-                        ]
-                    )
-                ]
-            ]
-            tokens.append(
-                ','.join(self._embed_matrix[row, :].astype('str').tolist())
-            )
+            row = self._dictionary[fuzzy_index(self).nearest(temp)[0]]
+            tokens.append(','.join(self._vectors(row).astype('str').tolist()))
         return _Calculator(tokens).exp()
 
+    def _get_top_k(self, num_closest):
+        # only used for float32 index, quantized index is searched in numpy
+        # so no dequantized float32 copy stays resident. The variable is fed
+        # from the index buffer, scores are normalized by the index scales.
+        if not self._embedding_initialized:
+            self._sess.run(
+                [
+                    self._embedding_variable.initializer,
+                    self._scales_variable.initializer,
+                ],
+                feed_dict = {
+                    self._embedding: self._index._matrix,
+                    self._scales: self._index._scales,
+                },
+            )
+            self._embedding_initialized = True
+        if num_closest not in self._top_k:
+            with self._graph.as_default():
+                self._top_k[num_closest] = tf.nn.top_k(
+                    self._cosine_similarity, k = num_closest
+                )
+        return self._top_k[num_closest]
+
     def _batch_process(self, batch, num_closest = 5, return_similarity = True):
-        top_k = tf.nn.top_k(self._cosine_similarity, k = num_closest)
-        results = self._sess.run(
-            top_k,
-            feed_dict = {self._x: batch, self._embedding: self._embed_matrix},
-        )
-        indices = results.indices
-        values = results.values
+        if self._index is None:
+            self.build_index()
+        if self._index.dtype == 'float32':
+            results = self._sess.run(
+                self._get_top_k(num_closest), feed_dict = {self._x: batch}
+            )
+            indices = results.indices
+            values = results.values
+        else:
+            indices, values = self._index.top_k(batch, num_closest)
         words = []
         if not return_similarity:
             for result in indices:
                 words.append([self._reverse_dictionary[i] for i in result])
         else:
-            for no in range(len(results)):
+            for no in range(len(indices)):
                 words.append(
                     [
                         (
@@ -409,14 +731,13 @@ class _wordvector:
             raise ValueError('num_closest must be a boolean')
         calculated = self._calculate(equation)
         if return_similarity:
-            nn = NearestNeighbors(num_closest + 1, metric = metric).fit(
-                self._embed_matrix
+            idx, similarities = self._nearest(
+                calculated, num_closest + 1, metric
             )
-            distances, idx = nn.kneighbors(calculated.reshape((1, -1)))
             word_list = []
             for i in range(1, idx.shape[1]):
                 word_list.append(
-                    [self._reverse_dictionary[idx[0, i]], 1 - distances[0, i]]
+                    [self._reverse_dictionary[idx[0, i]], similarities[0, i]]
                 )
             return word_list
         else:
@@ -460,18 +781,11 @@ class _wordvector:
             raise ValueError('soft must be a boolean')
         if soft:
             for i in range(len(words)):
-                if words[i] not in self.words:
-                    words[i] = self.words[
-                        np.argmax(
-                            [
-                                self._jarowinkler.similarity(words[i], k)
-                                for k in self.words
-                            ]
-                        )
-                    ]
+                if words[i] not in self._dictionary:
+                    words[i] = fuzzy_index(self).nearest(words[i])[0]
         else:
             for i in range(len(words)):
-                if words[i] not in self.words:
+                if words[i] not in self._dictionary:
                     raise Exception(
                         '%s not in dictionary, please use another word or set `soft` = True'
                         % (words[i])
@@ -513,16 +827,13 @@ class _wordvector:
         if not isinstance(return_similarity, bool):
             raise ValueError('num_closest must be a boolean')
         if return_similarity:
-            nn = NearestNeighbors(num_closest + 1, metric = metric).fit(
-                self._embed_matrix
-            )
-            distances, idx = nn.kneighbors(
-                self.get_vector_by_name(word).reshape((1, -1))
+            idx, similarities = self._nearest(
+                self.get_vector_by_name(word), num_closest + 1, metric
             )
             word_list = []
             for i in range(1, idx.shape[1]):
                 word_list.append(
-                    [self._reverse_dictionary[idx[0, i]], 1 - distances[0, i]]
+                    [self._reverse_dictionary[idx[0, i]], similarities[0, i]]
                 )
             return word_list
         else:
@@ -538,11 +849,7 @@ class _wordvector:
             return word_list
 
     def closest_row_indices(self, wv, num, metric):
-        dist_array = np.ravel(
-            cdist(self._embed_matrix, wv.reshape((1, -1)), metric = metric)
-        )
-        sorted_indices = np.argsort(dist_array)
-        return sorted_indices[:num]
+        return self._nearest(wv, num, metric)[0][0]
 
     def analogy(self, a, b, c, num = 1, metric = 'cosine'):
         """
@@ -601,7 +908,7 @@ class _wordvector:
         if not isinstance(end, int):
             raise ValueError('end must be an integer')
         tsne = TSNE(n_components = 2)
-        embed_2d = tsne.fit_transform(self._embed_matrix[start:end, :])
+        embed_2d = tsne.fit_transform(self._vectors(slice(start, end)))
         word_list = []
         for i in range(start, end):
             word_list.append(self._reverse_dictionary[i])
@@ -0,0 +1,37 @@
+import numpy as np
+from scipy.sparse import csr_matrix
+import malaya
+
+
+def test_correlation_edges():
+    from malaya.cluster import _correlation_edges
+
+    matrix = np.random.RandomState(0).rand(10, 6)
+    matrix[matrix < 0.5] = 0
+    matrix[3] = 0.7
+    matrix[7] = matrix[2] * 2 + 1
+    with np.errstate(invalid = 'ignore', divide = 'ignore'):
+        correlations = np.abs(np.nan_to_num(np.corrcoef(matrix)))
+    expected = {
+        (i, j): correlations[i, j]
+        for i in range(len(matrix))
+        for j in range(i + 1, len(matrix))
+        if correlations[i, j] >= 0.3
+    }
+    for m in [matrix, csr_matrix(matrix)]:
+        rows, columns, values = _correlation_edges(m, 0.3, block_size = 3)
+        result = dict(zip(zip(rows.tolist(), columns.tolist()), values))
+        assert sorted(result) == sorted(expected)
+        assert all(np.isclose(result[k], expected[k]) for k in expected)
+        assert all(3 not in k for k in result)
+
+
+def test_fit_clustering_sparse():
+    from sklearn.cluster import AgglomerativeClustering
+    from malaya.cluster import _fit_clustering
+
+    matrix = np.random.RandomState(0).rand(20, 5)
+    matrix[matrix < 0.5] = 0
+    sparse = _fit_clustering(AgglomerativeClustering, 3, csr_matrix(matrix))
+    dense = _fit_clustering(AgglomerativeClustering, 3, matrix)
+    assert sparse.labels_.tolist() == dense.labels_.tolist()
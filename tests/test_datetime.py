@@ -0,0 +1,19 @@
+import dateparser
+from malaya.texts._datetime import parse
+
+
+def test_parse_date():
+    assert parse('12/05/2019') == dateparser.parse('12/05/2019')
+    assert parse('25/12/2019') == dateparser.parse('25/12/2019')
+    assert parse('12 januari 2019') == dateparser.parse('12 januari 2019')
+
+
+def test_parse_datetime():
+    assert parse('12/05/2019 10:30') == dateparser.parse('12/05/2019 10:30')
+    assert parse('3pm 12 januari 2019') == dateparser.parse(
+        '3pm 12 januari 2019'
+    )
+
+
+def test_parse_invalid():
+    assert parse('31/02/2019') is None
@@ -0,0 +1,24 @@
+from malaya.texts._jarowrinkler import JaroWinkler
+import random
+
+
+def test_jarowinkler_batch():
+    rng = random.Random(0)
+    strings = ['', 'a', 'b', 'aa', 'ab', 'ba', 'kerajaan', 'kerjaan', 'najib', 'jnaib']
+    strings += [
+        ''.join(rng.choice('abcde') for _ in range(rng.randint(0, 12)))
+        for _ in range(40)
+    ]
+    jw = JaroWinkler()
+    for s0 in strings[:15]:
+        assert jw.similarity_batch(s0, strings).tolist() == [
+            jw.similarity(s0, s) for s in strings
+        ]
+    matrix = jw.similarity_matrix(strings, strings)
+    assert matrix.tolist() == [
+        [jw.similarity(l, r) for r in strings] for l in strings
+    ]
+    right = strings[::-1]
+    assert jw.similarity_pairs(strings, right).tolist() == [
+        jw.similarity(l, r) for l, r in zip(strings, right)
+    ]
@@ -9,3 +9,61 @@ def test_naive_stemmer():
     assert normalizer.normalize('masing2') == 'masing-masing'
     assert normalizer.normalize('xmasing2') == 'tak masing-masing'
     assert normalizer.normalize('x') == 'tak'
+
+
+class _Speller:
+    def __init__(self):
+        self.strings = set()
+
+    def correct(self, word, string = None, index = None):
+        self.strings.add(id(string))
+        return word
+
+
+_words = (
+    'saya pergi ke kedai semalam beli barang RM50 dan $10 pada 12/01/2019 '
+    'pukul 10:00 ke-3 ke-IV 3-4 pada 2/3 12 Mei 2019 10am esok xnak makan '
+    'Jan, 12.01.2019 3.5 1,000 dlm 3hari 5 pagi 3.5k 20sen 30 ringgit'
+).split()
+
+
+def _corpus(n):
+    return ' '.join(_words[i % len(_words)] for i in range(n))
+
+
+def test_normalizer_scan():
+    import re
+    from malaya.normalize import _scan, _scan_spans, _span_regexes
+    from malaya.preprocessing import _tokenizer
+
+    string = _corpus(500)
+    assert _scan(string)[0] == _tokenizer(string)
+    spans = [regex.findall(string.lower()) for _, regex in _span_regexes]
+    money_ = spans.pop()
+    dates_ = [
+        ' '.join(s) if isinstance(s, tuple) else s for s in sum(spans, [])
+    ]
+    assert _scan_spans(string.lower()) == (money_, dates_)
+
+
+def test_normalizer_throughput():
+    import time
+    from malaya.normalize import _SPELL_NORMALIZE
+
+    speller = _Speller()
+    normalizer = _SPELL_NORMALIZE(speller)
+
+    def elapsed(string):
+        timings = []
+        for _ in range(2):
+            before = time.time()
+            normalizer.normalize(string)
+            timings.append(time.time() - before)
+        return min(timings)
+
+    small, large = _corpus(1000), _corpus(32000)
+    normalizer.normalize(small)
+    assert len(speller.strings) == 1
+    # tokens are scanned once and the sentence joined once, so 32x
+    # tokens must not cost quadratically more.
+    assert elapsed(large) < elapsed(small) * 40
@@ -6,6 +6,9 @@ malaya.get_available_pos_models()
 def test_pos():
     assert len(malaya.naive_pos(string))
 
+def test_naive_batch_pos():
+    assert malaya.pos.naive_batch([string]) == [malaya.pos.naive(string)]
+
 def test_multinomial_pos():
     assert len(malaya.multinomial_pos(string))
 
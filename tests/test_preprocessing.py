@@ -0,0 +1,112 @@
+import malaya
+from math import log10
+
+strings = [
+    'sayasygkan-mu',
+    'kerajaanmalaysia',
+    'DrMahathirMohamad',
+    'sebenarnyasayatidak',
+    'kerajaanmalaysia',
+]
+
+
+def _brute_segment(segmenter, text, prev = '<S>'):
+    if not text:
+        return 0.0, []
+    candidates = []
+    for i in range(1, min(len(text), segmenter.L) + 1):
+        word = text[:i]
+        prob, words = _brute_segment(segmenter, text[i:], word)
+        prob += log10(segmenter.condProbWord(word, prev))
+        candidates.append((prob, [word] + words))
+    return max(candidates, key = lambda c: c[0])
+
+
+def test_segment_batch():
+    segmenter = malaya.preprocessing.segmenter()
+    results = segmenter.segment_batch(strings)
+    fresh = malaya.preprocessing.segmenter()
+    assert results == [fresh.segment(s) for s in strings]
+
+
+def test_segment_viterbi():
+    segmenter = malaya.preprocessing.segmenter()
+    for text in ['sayasuka', 'makannasi', 'kerajaan', 'abcde']:
+        prob, words = segmenter.find_segment(text)
+        brute_prob, _ = _brute_segment(segmenter, text)
+        assert ''.join(words) == text
+        assert abs(prob - brute_prob) < 1e-9
+
+
+cleaning_strings = [
+    'Kerajaan @mahathir http://t.co/x #PRU14 sangat BAGUS!!',
+    'saya sebenarnya sukakan awak, hahahaha',
+    'Kerajaan @mahathir http://t.co/x #PRU14 sangat BAGUS!!',
+    'Dr. Mahathir café 2019, naïve',
+    '',
+    'saya sebenarnya sukakan awak, hahahaha',
+]
+
+
+def test_textcleaning_batch():
+    from malaya.texts._text_functions import (
+        simple_textcleaning,
+        simple_textcleaning_batch,
+        classification_textcleaning,
+        classification_textcleaning_batch,
+    )
+    from malaya.stem import (
+        _classification_textcleaning_stemmer,
+        _classification_textcleaning_stemmer_batch,
+    )
+
+    for lowering in [True, False]:
+        assert simple_textcleaning_batch(
+            cleaning_strings, lowering = lowering
+        ) == [simple_textcleaning(s, lowering) for s in cleaning_strings]
+        for no_stopwords in [True, False]:
+            assert classification_textcleaning_batch(
+                cleaning_strings,
+                no_stopwords = no_stopwords,
+                lowering = lowering,
+            ) == [
+                classification_textcleaning(s, no_stopwords, lowering)
+                for s in cleaning_strings
+            ]
+    assert _classification_textcleaning_stemmer_batch(cleaning_strings) == [
+        _classification_textcleaning_stemmer(s) for s in cleaning_strings
+    ]
+
+
+def test_bayes_predict_batch_cleaning():
+    import numpy as np
+    from malaya._models._sklearn_model import MULTICLASS_BAYES
+
+    class Vectorizer:
+        def transform(self, strings):
+            return np.array(
+                [[len(s) + 1.0, s.count('a') + 1.0] for s in strings]
+            )
+
+    class Multinomial:
+        def predict_proba(self, vectors):
+            return vectors / vectors.sum(axis = 1, keepdims = True)
+
+    cleaned = []
+
+    def cleaning_batch(strings):
+        cleaned.append(list(strings))
+        return [s.lower() for s in strings]
+
+    model = MULTICLASS_BAYES(
+        Multinomial(),
+        ['a', 'b'],
+        Vectorizer(),
+        cleaning = lambda s: s.lower(),
+        cleaning_batch = cleaning_batch,
+    )
+    results = model.predict_batch(cleaning_strings, get_proba = True)
+    assert cleaned == [cleaning_strings]
+    assert results == [
+        model.predict(s, get_proba = True) for s in cleaning_strings
+    ]
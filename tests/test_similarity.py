@@ -0,0 +1,131 @@
+import os
+import numpy as np
+import pytest
+import malaya
+
+
+class _Vectorizer:
+    def __init__(self, fail = None):
+        self.fail = fail
+
+    def vectorize(self, strings):
+        if self.fail in strings:
+            raise Exception('failed to encode %s' % (self.fail))
+        return np.array(
+            [
+                np.random.RandomState(sum(map(ord, s))).randn(16)
+                for s in strings
+            ]
+        )
+
+
+class _Model:
+    def predict_batch(self, lefts, rights):
+        return [float(l == r) for l, r in zip(lefts, rights)]
+
+
+strings = ['anwar ibrahim', 'mahathir mohamad', 'najib razak', 'rosmah mansor', 'lim guan eng']
+
+
+def test_similarity_index(tmp_path):
+    path = str(tmp_path / 'index')
+    index = malaya.similarity.index(_Vectorizer(), path = path)
+    index.add(strings, ids = ['a', 'b', 'c', 'd', 'e'], batch_size = 2)
+    assert len(index) == 5
+    assert [r[0][0] for r in index.query(strings, top_k = 1)] == ['a', 'b', 'c', 'd', 'e']
+
+    index.delete(['b'])
+    assert len(index) == 4
+    assert all(i != 'b' for r in index.query(strings) for i, _ in r)
+    before = index.query(strings, top_k = 3)
+
+    reloaded = malaya.similarity.index(_Vectorizer(), path = path)
+    assert len(reloaded) == 4
+    assert reloaded.query(strings, top_k = 3) == before
+
+    reloaded.compact()
+    assert reloaded._ids == ['a', 'c', 'd', 'e']
+    assert os.path.getsize(os.path.join(path, 'vectors.bin')) == 4 * 16 * 4
+    assert sorted(os.listdir(path)) == ['index.json', 'vectors.bin']
+    assert reloaded.query(strings, top_k = 3) == before
+    assert malaya.similarity.index(_Vectorizer(), path = path).query(strings, top_k = 3) == before
+
+
+def test_similarity_index_failed_add(tmp_path):
+    path = str(tmp_path / 'index')
+    queries = ['anwar ibrahim', 'najib razak', 'lim guan eng']
+    index = malaya.similarity.index(_Vectorizer(fail = 'rosmah mansor'), path = path)
+    index.add(strings[:2], ids = ['a', 'b'])
+    size = os.path.getsize(os.path.join(path, 'vectors.bin'))
+    before = index.query(queries, top_k = 2)
+
+    with pytest.raises(Exception):
+        index.add(strings[2:], ids = ['c', 'd', 'e'], batch_size = 1)
+    with pytest.raises(ValueError):
+        index.add(['najib razak', 'lim guan eng', 'anwar ibrahim'], ids = ['c', 'e', 'b'], batch_size = 1)
+    with pytest.raises(ValueError):
+        index.add(['najib razak', 'lim guan eng'], ids = ['c', 'c'], batch_size = 1)
+    with pytest.raises(ValueError):
+        index.add(['najib razak'], ids = [('c', 1)])
+    with pytest.raises(ValueError):
+        index.add(['najib razak', 'lim guan eng'], ids = ['c'])
+
+    for i in [index, malaya.similarity.index(_Vectorizer(), path = path)]:
+        assert len(i) == 2
+        assert i._ids == ['a', 'b']
+        assert i.query(queries, top_k = 2) == before
+    assert os.path.getsize(os.path.join(path, 'vectors.bin')) == size
+
+    index.add(['najib razak', 'lim guan eng'], ids = ['c', 'e'])
+    reloaded = malaya.similarity.index(_Vectorizer(), path = path)
+    assert reloaded._ids == ['a', 'b', 'c', 'e']
+    assert [r[0][0] for r in reloaded.query(['najib razak', 'lim guan eng'], top_k = 1)] == ['c', 'e']
+
+
+def test_retrieve_rerank_failed_add():
+    model = malaya.similarity.retrieve_rerank(_Vectorizer(fail = 'rosmah mansor'), _Model(), shortlist = 5)
+    model.add(strings[:2])
+    with pytest.raises(Exception):
+        model.add(strings[2:], batch_size = 1)
+    with pytest.raises(ValueError):
+        model.add(strings[2:4], ids = [5, 5])
+    assert model._index._ids == [0, 1] and sorted(model._strings) == [0, 1]
+    model.add(['najib razak'])
+    assert model.query(['najib razak'], top_k = 1) == [[(2, 1.0)]]
+
+
+def test_siamese_batches_order():
+    from malaya.texts._text_functions import siamese_batches, _bert_siamese_sequences
+    from malaya._models._bert_model import SIAMESE_BERT
+
+    class Tokenizer:
+        def tokenize(self, string):
+            return string.split()
+
+        def convert_tokens_to_ids(self, tokens):
+            return [len(t) + 1 for t in tokens]
+
+    class Session:
+        def run(self, fetch, feed_dict):
+            input_ids = np.array(feed_dict['X'])
+            input_masks = np.array(feed_dict['input_masks'])
+            return np.stack([(input_ids * input_masks).sum(axis = 1), input_masks.sum(axis = 1)], axis = 1)
+
+    lefts = ['anwar', 'mahathir mohamad tun', 'najib', 'rosmah mansor', 'lim guan eng', 'a']
+    rights = ['lim', 'anwar ibrahim', 'rosmah mansor binti', 'x', 'najib razak', 'mahathir']
+    sequences = _bert_siamese_sequences(Tokenizer(), lefts, rights)[:3]
+    seen = []
+    for indices, (input_ids, input_masks, segment_ids) in siamese_batches(sequences, (0, 0, 0), batch_size = 4):
+        for no, k in enumerate(indices):
+            assert input_ids[no][:len(sequences[0][k])] == sequences[0][k]
+            assert input_masks[no][:len(sequences[1][k])] == sequences[1][k]
+            assert segment_ids[no][:len(sequences[2][k])] == sequences[2][k]
+        seen.extend(indices)
+    assert sorted(seen) == list(range(len(lefts)))
+
+    model = SIAMESE_BERT.__new__(SIAMESE_BERT)
+    model._tokenizer, model._cls, model._sep = Tokenizer(), '[CLS]', '[SEP]'
+    model._sess, model._softmax = Session(), 'softmax'
+    model._X, model._segment_ids, model._input_masks = 'X', 'segment_ids', 'input_masks'
+    expected = [[sum(i), len(i)] for i in sequences[0]]
+    assert model._base(lefts, rights, batch_size = 4).tolist() == expected
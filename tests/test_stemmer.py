@@ -15,3 +15,23 @@ def test_deep_stemmer():
 def test_deep_stemmer_unknown():
     stemmer = malaya.deep_stemmer()
     assert len(stemmer.stem('!!!!!()*&^%!^@%4'))
+
+def test_naive_batch_stemmer():
+    assert malaya.stem.naive_batch(['makanan', 'perjalanan']) == [
+        'makan',
+        'jalan',
+    ]
+
+def test_sastrawi_batch_stemmer():
+    assert malaya.stem.sastrawi_batch(['menarik hati', 'menarik hati']) == [
+        'tarik hati',
+        'tarik hati',
+    ]
+
+def test_deep_stemmer_cache():
+    strings = ['saya sangat sukakan awak', 'makanan sangat sedap', 'sukakan makanan']
+    uncached = [malaya.stem.deep_model().stem(s) for s in strings]
+    stemmer = malaya.stem.deep_model(cache_size = 3)
+    assert stemmer.stem_batch(strings, batch_size = 2) == uncached
+    assert stemmer.stem_batch(strings) == uncached
+    assert len(stemmer._cache) <= 3
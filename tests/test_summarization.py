@@ -28,3 +28,21 @@ def test_nmf():
 
 def test_lda():
     assert len(malaya.summarize_lda(isu_kerajaan)['top-words'])
+
+def test_lsa_sparse_graph():
+    assert len(malaya.summarize.lsa(isu_kerajaan, neighbors = 3)['summary'])
+
+def test_lsa_batch():
+    results = list(malaya.summarize.summarize_batch([isu_kerajaan] * 2, 'lsa'))
+    assert len(results) == 2
+
+def test_skipthought_batch():
+    model = malaya.summarize.encoder(malaya.summarize.deep_skipthought())
+    results = list(model.summarize_batch([isu_kerajaan] * 2, batch_size = 4))
+    assert results[0]['summary'] == results[1]['summary']
+
+def test_doc2vec_batch():
+    embedded = malaya.wordvector.load_news(256)
+    vectorizer = malaya.wordvector.load(embedded['nce_weights'], embedded['dictionary'])
+    results = list(malaya.summarize.summarize_batch([isu_kerajaan] * 2, vectorizer, cores = 2))
+    assert results == [malaya.summarize.doc2vec(vectorizer, isu_kerajaan)] * 2
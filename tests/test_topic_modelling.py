@@ -25,3 +25,68 @@ def test_nmf():
 def test_lsa():
     lsa = malaya.lsa_topic_modelling(corpus,10)
     assert len(lsa.get_topics(10))
+
+def test_lda_stream():
+    lda = malaya.topic_model.stream(iter(corpus), 10, chunk_size = 100)
+    assert lda.transform(corpus[:5]).shape == (5, 10)
+
+def test_skipgram_pairs():
+    from malaya.texts.vectorizer import skipgram_pairs
+
+    pivots, targets, docs, labels = skipgram_pairs(
+        [[1, 2, 3], [4, 5]], 6, window_size = 1
+    )
+    assert sorted(zip(pivots, targets, docs)) == [
+        (1, 2, 0), (2, 1, 0), (2, 3, 0), (3, 2, 0), (4, 5, 1), (5, 4, 1)
+    ]
+
+def _brute_attention_ngrams(attention, stop_words, ngram):
+    attention = [a for a in attention if a[0] not in stop_words]
+    scores = {}
+    for n in range(ngram[0], ngram[1] + 1):
+        for i in range(len(attention) - n + 1):
+            feature = ' '.join([a[0] for a in attention[i : i + n]])
+            score = sum([a[1] for a in attention[i : i + n]]) / n
+            scores[feature] = scores.get(feature, 0) + score
+    return scores
+
+def test_attention_ngrams():
+    import numpy as np
+    from malaya.topic_model import _attention_ngrams
+
+    attention = [('kerajaan', 0.1), ('dan', 0.3), ('rakyat', 0.2), ('kerajaan', 0.15), ('rakyat', 0.25)]
+    feature_index = {'rakyat': 0}
+    ids, scores = _attention_ngrams(attention, ['dan'], (1, 3), feature_index)
+    reverse = {v: k for k, v in feature_index.items()}
+    result = {reverse[i]: s for i, s in zip(ids, scores)}
+    expected = _brute_attention_ngrams(attention, ['dan'], (1, 3))
+    assert sorted(result) == sorted(expected)
+    assert all(np.isclose(result[k], expected[k]) for k in expected)
+    assert len(_attention_ngrams([('dan', 1.0)], ['dan'], (1, 3), {})[0]) == 0
+
+def test_attention_minibatch():
+    import numpy as np
+
+    class Vectorizer:
+        def vectorize(self, strings):
+            return np.array([[1.0, 0.0] if 'bola' in s else [0.0, 1.0] for s in strings])
+
+        def attention(self, strings):
+            return [[(w, len(w) / 10) for w in s.split()] for s in strings]
+
+    strings = ['bola sepak', 'kerajaan rakyat negara', 'bola keranjang sukan', 'rakyat negara', 'sukan bola', 'kerajaan']
+    expected = {}
+    for string in strings:
+        for k, v in _brute_attention_ngrams(Vectorizer().attention([string])[0], [], (1, 2)).items():
+            expected[k] = expected.get(k, 0) + v
+    for minibatch in [False, True]:
+        model = malaya.topic_model.attention(
+            strings, 2, Vectorizer(), stemming = None, cleaning = None, stop_words = [],
+            ngram = (1, 2), batch_size = 4, minibatch = minibatch,
+        )
+        result = dict(zip(model._features, model._components.sum(axis = 0)))
+        assert sorted(result) == sorted(expected)
+        assert all(np.isclose(result[k], expected[k]) for k in expected)
+        topics = [{model._features[i] for i in np.nonzero(c)[0]} for c in model._components]
+        assert sorted(['bola' in t for t in topics]) == [False, True]
+        assert all(('bola' in t) != ('kerajaan' in t) for t in topics)
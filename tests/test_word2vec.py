@@ -52,3 +52,120 @@ def test_word2vec_tsne():
     word_vector = malaya.Word2Vec(embedded['nce_weights'], embedded['dictionary'])
     embed_2d, word_list = word_vector.project_2d(0, 100)
     assert embed_2d.shape[1] == 2
+
+def test_word2vec_build_index():
+    embedded = malaya.wordvector.load_news(256)
+    word_vector = malaya.wordvector.load(embedded['nce_weights'], embedded['dictionary'])
+    word_vector.build_index(malaya.home + '/word2vec-256/index.npy')
+    assert len(word_vector.n_closest(word='anwar', num_closest=8))
+
+def test_word2vec_int8_index():
+    embedded = malaya.wordvector.load_news(256)
+    word_vector = malaya.wordvector.load(embedded['nce_weights'], embedded['dictionary'], dtype='int8')
+    assert len(word_vector.n_closest(word='anwar', num_closest=8))
+    assert word_vector.index_recall(num_closest=10, samples=100, embed_matrix=embedded['nce_weights']) > 0.9
+
+def test_cosine_index_blocked_top_k():
+    import numpy as np
+
+    embed = np.random.RandomState(0).randn(1000, 16).astype(np.float32)
+    queries = np.random.RandomState(1).randn(20, 16).astype(np.float32)
+    index = malaya.wordvector._CosineIndex.build(embed)
+    full = malaya.wordvector._l2_normalize(queries).dot(index.normed().T)
+    expected = np.argsort(-full, axis = 1, kind = 'stable')[:, :10]
+    assert (index.top_k(queries, 10, block_size = 64)[0] == expected).all()
+
+def test_word2vec_build_index_validation(tmp_path):
+    import numpy as np
+    import pytest
+
+    embed = np.random.RandomState(0).randn(50, 8).astype(np.float32)
+    dictionary = {'word%d' % (i): i for i in range(50)}
+    path = str(tmp_path / 'index.npy')
+    word_vector = malaya.wordvector.load(embed, dictionary, dtype = 'int8')
+    word_vector.build_index(path)
+    word_vector.build_index(path)
+    assert word_vector._index.dtype == 'int8'
+
+    with pytest.raises(ValueError):
+        malaya.wordvector.load(embed[:40], {'word%d' % (i): i for i in range(40)}, dtype = 'int8').build_index(path)
+    swapped = dict(dictionary, word0 = 1, word1 = 0)
+    with pytest.raises(ValueError):
+        malaya.wordvector.load(embed, swapped, dtype = 'int8').build_index(path)
+    with pytest.raises(ValueError):
+        malaya.wordvector.load(embed, dictionary).build_index(path)
+    assert malaya.wordvector._CosineIndex.load(path).dtype == 'int8'
+
+    word_vector = malaya.wordvector.load(embed, dictionary)
+    word_vector.build_index(path, overwrite = True)
+    assert malaya.wordvector._CosineIndex.load(path).dtype == 'float32'
+    word_vector.build_index(path)
+    assert word_vector._index.dtype == 'float32'
+
+def test_word2vec_quantized_vectors():
+    import numpy as np
+    from scipy.spatial.distance import cdist
+
+    embed = np.random.RandomState(0).randn(300, 16).astype(np.float32)
+    dictionary = {'word%d' % (i): i for i in range(300)}
+    index = malaya.wordvector._CosineIndex.build(embed)
+    assert index._matrix is embed
+    for dtype, tolerance in [('float16', 1e-2), ('int8', 5e-2)]:
+        word_vector = malaya.wordvector.load(embed, dictionary, dtype = dtype)
+        word_vector.build_index()
+        assert word_vector._embed_matrix is None
+        vector = word_vector.get_vector_by_name('word3')
+        assert vector.shape == (16,) and np.abs(vector - embed[3]).max() < tolerance * np.abs(embed[3]).max()
+        dequantized = word_vector._index.vectors(slice(None))
+        assert np.abs(dequantized - embed).max() < tolerance * np.abs(embed).max()
+        idx, similarities = word_vector._nearest(embed[:5], 10, 'euclidean', block_size = 64)
+        distances = cdist(embed[:5], dequantized, metric = 'euclidean')
+        assert (idx == np.argsort(distances, axis = 1, kind = 'stable')[:, :10]).all()
+        assert np.allclose(1 - similarities, np.take_along_axis(distances, idx, axis = 1))
+        assert word_vector.index_recall(num_closest = 10, samples = 50, embed_matrix = embed) > 0.8
+
+def test_word2vec_batch_n_closest_return_similarity():
+    embedded = malaya.wordvector.load_news(256)
+    word_vector = malaya.wordvector.load(embedded['nce_weights'], embedded['dictionary'])
+    with_similarity = word_vector.batch_n_closest(['anwar', 'mahathir'], num_closest = 5, return_similarity = True)
+    without_similarity = word_vector.batch_n_closest(['anwar', 'mahathir'], num_closest = 5, return_similarity = False)
+    assert len(with_similarity) == 2 and len(with_similarity[0]) == 5
+    assert all(isinstance(w, tuple) and isinstance(w[0], str) and abs(float(w[1])) <= 1.0001 for row in with_similarity for w in row)
+    assert all(isinstance(w, str) for row in without_similarity for w in row)
+    assert [[w[0] for w in row] for row in with_similarity] == without_similarity
+
+def test_word2vec_int8_batch_n_closest():
+    embedded = malaya.wordvector.load_news(256)
+    word_vector = malaya.wordvector.load(embedded['nce_weights'], embedded['dictionary'], dtype='int8')
+    words = word_vector.batch_n_closest(['anwar', 'mahathir'], num_closest = 5, return_similarity = False)
+    assert len(words) == 2 and len(words[0]) == 5
+    assert not word_vector._embedding_initialized
+
+def test_bag_of_vectors_pooling():
+    import numpy as np
+    from malaya._utils._utils import bag_of_vectors
+
+    class Vectorizer:
+        def __init__(self):
+            self.vectors = {
+                w: np.random.RandomState(i).randn(8)
+                for i, w in enumerate(['anwar', 'mahathir', 'najib', 'rosmah'])
+            }
+
+        def get_vector_by_name(self, word):
+            return self.vectors[word]
+
+    vectorizer = Vectorizer()
+    tokenized = [
+        ['anwar', 'najib', 'anwar'],
+        ['rosmah'],
+        [],
+        ['mahathir', 'unknown', 'najib', 'rosmah'],
+    ]
+    poolings = {'mean': np.mean, 'min': np.min, 'max': np.max, 'sum': np.sum}
+    for aggregation, pooling in poolings.items():
+        results = bag_of_vectors(vectorizer, tokenized, aggregation = aggregation, soft = False)
+        for no, tokens in enumerate(tokenized):
+            vectors = [vectorizer.vectors[t] for t in tokens if t in vectorizer.vectors]
+            expected = pooling(vectors, axis = 0) if len(vectors) else np.zeros(8)
+            assert np.allclose(results[no], expected)